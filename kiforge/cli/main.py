@@ -1,10 +1,13 @@
 """KiForge CLI application."""
 
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="kiforge",
@@ -12,7 +15,13 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
+
+@cache
+def _get_console() -> "Console":
+    """Create the shared rich console on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 @app.command()
@@ -20,6 +29,8 @@ def version() -> None:
     """Show version information."""
     from kiforge import __version__
 
+    console = _get_console()
+
     console.print(f"KiForge v{__version__}")
 
 
@@ -34,17 +45,19 @@ def footprint(
     thermal_pad: float | None = typer.Option(None, "--thermal-pad", "-t", help="Thermal pad size in mm (QFN only)"),
 ) -> None:
     """Generate a parametric footprint."""
-    from kiforge.core.footprint.qfp import create_qfp_footprint
-    from kiforge.core.footprint.qfn import create_qfn_footprint
+    from kiforge.core.footprint.qfp import build_qfp_footprint
+    from kiforge.core.footprint.qfn import build_qfn_footprint
+
+    console = _get_console()
 
     # Parse body dimensions
     try:
-        if "x" in body.lower():
-            parts = body.lower().split("x")
-            body_w = float(parts[0])
-            body_h = float(parts[1])
+        left, sep, right = body.lower().partition("x")
+        if sep:
+            body_w = float(left)
+            body_h = float(right)
         else:
-            body_w = body_h = float(body)
+            body_w = body_h = float(left)
     except ValueError:
         console.print(f"[red]Invalid body size format: {body}[/red]")
         console.print("Expected format: WxH (e.g., 7x7 or 10x10)")
@@ -65,7 +78,7 @@ def footprint(
         console.print(f"  Lead span: {lead_span}mm")
 
         try:
-            content = create_qfp_footprint(
+            generator = build_qfp_footprint(
                 pins=pins,
                 pitch=pitch,
                 body_width=body_w,
@@ -77,19 +90,14 @@ def footprint(
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
 
-        # Write output
         output_path = output / f"{package_upper}-{pins}_{body_w}x{body_h}mm_P{pitch}mm.kicad_mod"
-        output.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
-
-        console.print(f"[green]Created:[/green] {output_path}")
 
     elif package_upper in ("QFN", "DFN", "VQFN", "WQFN"):
         if thermal_pad is not None:
             console.print(f"  Thermal pad: {thermal_pad}x{thermal_pad}mm")
 
         try:
-            content = create_qfn_footprint(
+            generator = build_qfn_footprint(
                 pins=pins,
                 pitch=pitch,
                 body_width=body_w,
@@ -101,19 +109,20 @@ def footprint(
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
 
-        # Write output
         ep_str = f"_EP{thermal_pad}x{thermal_pad}mm" if thermal_pad else ""
         output_path = output / f"{package_upper}-{pins}_{body_w}x{body_h}mm_P{pitch}mm{ep_str}.kicad_mod"
-        output.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
-
-        console.print(f"[green]Created:[/green] {output_path}")
 
     else:
         console.print(f"[yellow]Package type {package_upper} not yet implemented[/yellow]")
         console.print("Supported packages: QFP, LQFP, TQFP, VQFP, QFN, DFN, VQFN, WQFN")
         raise typer.Exit(1)
 
+    # Write output
+    output.mkdir(parents=True, exist_ok=True)
+    generator.write_to(output_path)
+
+    console.print(f"[green]Created:[/green] {output_path}")
+
 
 @app.command()
 def symbol(
@@ -124,9 +133,13 @@ def symbol(
     description: str = typer.Option("", "--description", "-d", help="Component description"),
 ) -> None:
     """Generate a schematic symbol from a CSV pinout file."""
+    from rich.table import Table
+
     from kiforge.core.parser import create_component_from_csv
     from kiforge.core.symbol import create_symbol
 
+    console = _get_console()
+
     if not pinout.exists():
         console.print(f"[red]File not found: {pinout}[/red]")
         raise typer.Exit(1)
@@ -151,10 +164,12 @@ def symbol(
     table.add_column("Type", style="cyan")
     table.add_column("Count", justify="right")
 
-    from collections import Counter
-    type_counts = Counter(p.electrical_type.value for p in component.pins)
-    for ptype, count in sorted(type_counts.items()):
-        table.add_row(ptype, str(count))
+    type_counts: dict[str, int] = {}
+    for p in component.pins:
+        ptype = p.electrical_type.value
+        type_counts[ptype] = type_counts.get(ptype, 0) + 1
+    for ptype in sorted(type_counts):
+        table.add_row(ptype, str(type_counts[ptype]))
 
     console.print(table)
 
@@ -180,22 +195,24 @@ def generate(
     manufacturer: str = typer.Option("", "--manufacturer", "-m", help="Manufacturer name"),
 ) -> None:
     """Generate symbol and footprint from a CSV pinout file."""
-    from kiforge.core.footprint.qfp import create_qfp_footprint
+    from kiforge.core.footprint.qfp import build_qfp_footprint
     from kiforge.core.parser import create_component_from_csv
     from kiforge.core.symbol import create_symbol
 
+    console = _get_console()
+
     if not pinout.exists():
         console.print(f"[red]File not found: {pinout}[/red]")
         raise typer.Exit(1)
 
     # Parse body dimensions
     try:
-        if "x" in body.lower():
-            parts = body.lower().split("x")
-            body_w = float(parts[0])
-            body_h = float(parts[1])
+        left, sep, right = body.lower().partition("x")
+        if sep:
+            body_w = float(left)
+            body_h = float(right)
         else:
-            body_w = body_h = float(body)
+            body_w = body_h = float(left)
     except ValueError:
         console.print(f"[red]Invalid body size format: {body}[/red]")
         raise typer.Exit(1)
@@ -236,7 +253,7 @@ def generate(
         lead_span = max(body_w, body_h) + 2.0
 
         try:
-            footprint_content = create_qfp_footprint(
+            footprint_gen = build_qfp_footprint(
                 pins=pins,
                 pitch=pitch,
                 body_width=body_w,
@@ -245,16 +262,16 @@ def generate(
                 variant=pkg_type,
             )
             footprint_path = output / f"{pkg_type}-{pins}_{body_w}x{body_h}mm_P{pitch}mm.kicad_mod"
-            footprint_path.write_text(footprint_content)
+            footprint_gen.write_to(footprint_path)
             console.print(f"  [green]Created:[/green] {footprint_path}")
         except ValueError as e:
             console.print(f"  [yellow]Skipped footprint: {e}[/yellow]")
     elif pkg_type in ("QFN", "DFN", "VQFN", "WQFN"):
-        from kiforge.core.footprint.qfn import create_qfn_footprint
+        from kiforge.core.footprint.qfn import build_qfn_footprint
 
         console.print("Generating footprint...")
         try:
-            footprint_content = create_qfn_footprint(
+            footprint_gen = build_qfn_footprint(
                 pins=pins,
                 pitch=pitch,
                 body_width=body_w,
@@ -262,7 +279,7 @@ def generate(
                 variant=pkg_type,
             )
             footprint_path = output / f"{pkg_type}-{pins}_{body_w}x{body_h}mm_P{pitch}mm.kicad_mod"
-            footprint_path.write_text(footprint_content)
+            footprint_gen.write_to(footprint_path)
             console.print(f"  [green]Created:[/green] {footprint_path}")
         except ValueError as e:
             console.print(f"  [yellow]Skipped footprint: {e}[/yellow]")
@@ -277,8 +294,12 @@ def pins(
     pinout: Path = typer.Argument(..., help="Pinout CSV file"),
 ) -> None:
     """Display pins from a CSV file."""
+    from rich.table import Table
+
     from kiforge.core.parser import parse_pinout_csv
 
+    console = _get_console()
+
     if not pinout.exists():
         console.print(f"[red]File not found: {pinout}[/red]")
         raise typer.Exit(1)
@@ -316,6 +337,8 @@ def pins(
 @app.command()
 def info() -> None:
     """Show supported package types and features."""
+    console = _get_console()
+
     console.print("[bold]KiForge - KiCad Component Generator[/bold]\n")
 
     console.print("[cyan]Supported Package Types:[/cyan]")
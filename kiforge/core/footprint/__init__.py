@@ -1,13 +1,23 @@
 """PCB footprint generation."""
 
 from kiforge.core.footprint.generator import FootprintGenerator
-from kiforge.core.footprint.qfp import QFPFootprintGenerator, create_qfp_footprint
-from kiforge.core.footprint.qfn import QFNFootprintGenerator, create_qfn_footprint
+from kiforge.core.footprint.qfp import (
+    QFPFootprintGenerator,
+    build_qfp_footprint,
+    create_qfp_footprint,
+)
+from kiforge.core.footprint.qfn import (
+    QFNFootprintGenerator,
+    build_qfn_footprint,
+    create_qfn_footprint,
+)
 
 __all__ = [
     "FootprintGenerator",
     "QFPFootprintGenerator",
     "create_qfp_footprint",
+    "build_qfp_footprint",
     "QFNFootprintGenerator",
     "create_qfn_footprint",
+    "build_qfn_footprint",
 ]
@@ -1,20 +1,152 @@
 """Base footprint generator with S-expression output."""
 
-import uuid
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+import os
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
+from itertools import starmap
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, TypeVar
 
+import numpy as np
 from kiforge.core.models.enums import PadShape, PadType
-from kiforge.core.models.footprint import FootprintParams, PadDimensions
+from kiforge.core.models.footprint import FootprintParams
 from kiforge.core.models.package import ThermalPad
 
 
 # KiCad 8 format version (YYYYMMDD)
 KICAD_VERSION = 20241229
+GENERATOR_VERSION = datetime.now().strftime("%Y%m%d")
+
+# Pre-built templates for the most frequent graphic primitives. C-level
+# %-formatting avoids per-value __format__ dispatch of f-strings;
+# coordinates are pre-formatted with _fmt().
+_FP_LINE_TEMPLATE = (
+    "  (fp_line\n"
+    "    (start %s %s)\n"
+    "    (end %s %s)\n"
+    "    (stroke (width %s) (type solid))\n"
+    '    (layer "%s")\n'
+    "    (uuid %s)\n"
+    "  )\n"
+)
+_FP_CIRCLE_TEMPLATE = (
+    "  (fp_circle\n"
+    "    (center %s %s)\n"
+    "    (end %s %s)\n"
+    "    (stroke (width %s) (type solid))\n"
+    "    (fill %s)\n"
+    '    (layer "%s")\n'
+    "    (uuid %s)\n"
+    "  )\n"
+)
+_FP_ARC_TEMPLATE = (
+    "  (fp_arc\n"
+    "    (start %s %s)\n"
+    "    (mid %s %s)\n"
+    "    (end %s %s)\n"
+    "    (stroke (width %s) (type solid))\n"
+    '    (layer "%s")\n'
+    "    (uuid %s)\n"
+    "  )\n"
+)
+# Whole-pad template for the dominant SMD roundrect pad on default layers
+_SMD_ROUNDRECT_PAD_TEMPLATE = (
+    '  (pad "%s" smd roundrect\n'
+    "    (at %s %s)\n"
+    "    (size %s %s)\n"
+    '    (layers "F.Cu" "F.Paste" "F.Mask")\n'
+    "    (roundrect_rratio %s)\n"
+    "    (uuid %s)\n"
+    "  )\n"
+)
+
+# Common pad layer sets, shared by reference between pads, and their
+# pre-rendered S-expression form
+_LAYERS_SMD = ("F.Cu", "F.Paste", "F.Mask")
+_LAYERS_SMD_NOPASTE = ("F.Cu", "F.Mask")
+_LAYERS_TH = ("*.Cu",)
+_LAYERS_TH_MASK = ("*.Cu", "*.Mask")
+_LAYERS_RENDERED = {
+    layers: " ".join(f'"{layer}"' for layer in layers)
+    for layers in (_LAYERS_SMD, _LAYERS_SMD_NOPASTE, _LAYERS_TH, _LAYERS_TH_MASK)
+}
+
+# Enum values looked up at format time, so pads edited after construction
+# still render correctly
+_PAD_TYPE_STR = {pad_type: pad_type.value for pad_type in PadType}
+_PAD_SHAPE_STR = {shape: shape.value for shape in PadShape}
+
+
+@lru_cache(maxsize=4096)
+def _fmt(x: float) -> str:
+    """Format a coordinate with up to 4 decimals, dropping trailing zeros.
+
+    Coordinates sit on a coarse grid and repeat heavily (e.g. pad X along
+    a row), so the formatted strings are memoized.
+
+    Args:
+        x: Value in mm
+
+    Returns:
+        Shortest fixed-point representation, e.g. "-3.5" or "0"
+    """
+    s = f"{x:.4f}".rstrip("0").rstrip(".")
+    return "0" if s in ("", "-0") else s
+
+
+def _gen_uuids(n: int) -> list[str]:
+    """Generate n random (version 4) UUID strings from a single entropy read.
 
+    Args:
+        n: Number of UUIDs to generate
 
-@dataclass
+    Returns:
+        List of UUIDs in canonical 8-4-4-4-12 hex form
+    """
+    raw = os.urandom(16 * n)
+    uuids = []
+    for i in range(0, 16 * n, 16):
+        h = raw[i : i + 16].hex()
+        # Set the version (4) and RFC 4122 variant bits like uuid.uuid4()
+        variant = "89ab"[int(h[16], 16) & 3]
+        uuids.append(f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}")
+    return uuids
+
+
+def _quad_coords(n: int, pitch: float, px: float, py: float) -> np.ndarray:
+    """Compute pad centers for a four-sided package in pin order.
+
+    Pins run counter-clockwise from pin 1 at the top of the left side:
+    left (downward), bottom (rightward), right (upward), top (leftward).
+
+    Args:
+        n: Pins per side
+        pitch: Pin pitch in mm
+        px: Pad center X offset of the left/right rows
+        py: Pad center Y offset of the bottom/top rows
+
+    Returns:
+        Array of shape (4 * n, 2) holding (x, y) per pin
+    """
+    positions = np.arange(n, dtype=np.float64) * pitch - (n - 1) * pitch / 2
+    reversed_positions = positions[::-1]
+
+    out = np.empty((4 * n, 2), dtype=np.float64)
+    out[:n, 0] = -px
+    out[:n, 1] = positions
+    out[n : 2 * n, 0] = positions
+    out[n : 2 * n, 1] = py
+    out[2 * n : 3 * n, 0] = px
+    out[2 * n : 3 * n, 1] = reversed_positions
+    out[3 * n :, 0] = reversed_positions
+    out[3 * n :, 1] = -py
+    return out
+
+
+@dataclass(slots=True)
 class Pad:
     """Represents a footprint pad."""
 
@@ -26,14 +158,14 @@ class Pad:
     width: float
     height: float
     rotation: float = 0.0
-    layers: list[str] = field(default_factory=lambda: ["F.Cu", "F.Paste", "F.Mask"])
+    layers: tuple[str, ...] = _LAYERS_SMD
     roundrect_ratio: float = 0.25
     drill: float | None = None
     drill_oval: tuple[float, float] | None = None
     property_heatsink: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     """Represents a line on the footprint."""
 
@@ -45,7 +177,7 @@ class Line:
     width: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Circle:
     """Represents a circle on the footprint."""
 
@@ -57,7 +189,7 @@ class Circle:
     fill: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Arc:
     """Represents an arc on the footprint."""
 
@@ -71,7 +203,7 @@ class Arc:
     width: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Text:
     """Represents text on the footprint."""
 
@@ -85,7 +217,33 @@ class Text:
     hide: bool = False
 
 
-class FootprintGenerator(ABC):
+@dataclass(frozen=True, slots=True)
+class FootprintStructure:
+    """Immutable snapshot of a calculated footprint.
+
+    Elements are stored as tuples of their field values, so a cached
+    structure cannot be edited through a generator built from it. Params
+    are copied on the way in and out of the snapshot.
+    """
+
+    params: FootprintParams
+    pads: tuple[tuple[Any, ...], ...]
+    lines: tuple[tuple[Any, ...], ...]
+    circles: tuple[tuple[Any, ...], ...]
+    arcs: tuple[tuple[Any, ...], ...]
+    texts: tuple[tuple[Any, ...], ...]
+
+
+def _freeze(items: Sequence[Any], cls: type) -> tuple[tuple[Any, ...], ...]:
+    """Convert element dataclasses into tuples of their field values."""
+    getter = attrgetter(*(f.name for f in fields(cls)))
+    return tuple(map(getter, items))
+
+
+_G = TypeVar("_G", bound="FootprintGenerator")
+
+
+class FootprintGenerator:
     """Base class for footprint generators.
 
     Provides common functionality for generating KiCad footprint files
@@ -104,11 +262,50 @@ class FootprintGenerator(ABC):
         self.circles: list[Circle] = []
         self.arcs: list[Arc] = []
         self.texts: list[Text] = []
+        self._calculated = False
+
+    @classmethod
+    def from_structure(cls: type[_G], structure: FootprintStructure) -> _G:
+        """Create a calculated generator from a footprint snapshot.
+
+        The generator gets its own params and element objects, so editing
+        it leaves the snapshot untouched.
+
+        Args:
+            structure: Snapshot returned by to_structure()
+
+        Returns:
+            Generator holding the snapshot's elements
+        """
+        generator = cls(structure.params.model_copy(deep=True))
+        generator.pads = list(starmap(Pad, structure.pads))
+        generator.lines = list(starmap(Line, structure.lines))
+        generator.circles = list(starmap(Circle, structure.circles))
+        generator.arcs = list(starmap(Arc, structure.arcs))
+        generator.texts = list(starmap(Text, structure.texts))
+        generator._calculated = True
+        return generator
+
+    def to_structure(self) -> FootprintStructure:
+        """Calculate all elements and return an immutable snapshot of them.
+
+        Returns:
+            Snapshot that can be cached and turned back into a generator
+            with from_structure()
+        """
+        self.calculate_all()
+        return FootprintStructure(
+            params=self.params.model_copy(deep=True),
+            pads=_freeze(self.pads, Pad),
+            lines=_freeze(self.lines, Line),
+            circles=_freeze(self.circles, Circle),
+            arcs=_freeze(self.arcs, Arc),
+            texts=_freeze(self.texts, Text),
+        )
 
-    @abstractmethod
     def calculate_pads(self) -> None:
         """Calculate pad positions. Must be implemented by subclasses."""
-        pass
+        raise NotImplementedError
 
     def calculate_silkscreen(self) -> None:
         """Calculate silkscreen graphics."""
@@ -122,14 +319,14 @@ class FootprintGenerator(ABC):
         half_h = pkg.body_length / 2 + margin
 
         # Draw body outline on silkscreen (simple rectangle)
-        # Top line
-        self.lines.append(Line(-half_w, -half_h, half_w, -half_h, "F.SilkS", width))
-        # Bottom line
-        self.lines.append(Line(-half_w, half_h, half_w, half_h, "F.SilkS", width))
-        # Left line
-        self.lines.append(Line(-half_w, -half_h, -half_w, half_h, "F.SilkS", width))
-        # Right line
-        self.lines.append(Line(half_w, -half_h, half_w, half_h, "F.SilkS", width))
+        self.lines.extend(
+            (
+                Line(-half_w, -half_h, half_w, -half_h, "F.SilkS", width),  # Top
+                Line(-half_w, half_h, half_w, half_h, "F.SilkS", width),  # Bottom
+                Line(-half_w, -half_h, -half_w, half_h, "F.SilkS", width),  # Left
+                Line(half_w, -half_h, half_w, half_h, "F.SilkS", width),  # Right
+            )
+        )
 
     def calculate_courtyard(self) -> None:
         """Calculate courtyard boundary."""
@@ -137,10 +334,22 @@ class FootprintGenerator(ABC):
         if not self.pads:
             return
 
-        min_x = min(p.x - p.width / 2 for p in self.pads)
-        max_x = max(p.x + p.width / 2 for p in self.pads)
-        min_y = min(p.y - p.height / 2 for p in self.pads)
-        max_y = max(p.y + p.height / 2 for p in self.pads)
+        # Single pass tracking all four extrema. Pads are stored as objects;
+        # gathering their fields back into NumPy arrays for vector reductions
+        # costs more than this loop for realistic pad counts.
+        min_x = min_y = float("inf")
+        max_x = max_y = float("-inf")
+        for p in self.pads:
+            x, y = p.x, p.y
+            hw, hh = p.width / 2, p.height / 2
+            if x - hw < min_x:
+                min_x = x - hw
+            if x + hw > max_x:
+                max_x = x + hw
+            if y - hh < min_y:
+                min_y = y - hh
+            if y + hh > max_y:
+                max_y = y + hh
 
         margin = self.params.courtyard_margin
         width = self.params.courtyard_line_width
@@ -152,10 +361,14 @@ class FootprintGenerator(ABC):
         max_y = round(max_y + margin, 2)
 
         # Draw courtyard rectangle
-        self.lines.append(Line(min_x, min_y, max_x, min_y, "F.CrtYd", width))
-        self.lines.append(Line(max_x, min_y, max_x, max_y, "F.CrtYd", width))
-        self.lines.append(Line(max_x, max_y, min_x, max_y, "F.CrtYd", width))
-        self.lines.append(Line(min_x, max_y, min_x, min_y, "F.CrtYd", width))
+        self.lines.extend(
+            (
+                Line(min_x, min_y, max_x, min_y, "F.CrtYd", width),
+                Line(max_x, min_y, max_x, max_y, "F.CrtYd", width),
+                Line(max_x, max_y, min_x, max_y, "F.CrtYd", width),
+                Line(min_x, max_y, min_x, min_y, "F.CrtYd", width),
+            )
+        )
 
     def calculate_fab_layer(self) -> None:
         """Calculate fabrication layer graphics (actual component outline)."""
@@ -169,17 +382,19 @@ class FootprintGenerator(ABC):
         chamfer = min(1.0, half_w * 0.2, half_h * 0.2)
 
         # Start from top-left, going clockwise
-        # Top edge (with chamfer at left)
-        self.lines.append(Line(-half_w + chamfer, -half_h, half_w, -half_h, "F.Fab", width))
-        # Right edge
-        self.lines.append(Line(half_w, -half_h, half_w, half_h, "F.Fab", width))
-        # Bottom edge
-        self.lines.append(Line(half_w, half_h, -half_w, half_h, "F.Fab", width))
-        # Left edge (with chamfer at top)
-        self.lines.append(Line(-half_w, half_h, -half_w, -half_h + chamfer, "F.Fab", width))
-        # Chamfer
-        self.lines.append(
-            Line(-half_w, -half_h + chamfer, -half_w + chamfer, -half_h, "F.Fab", width)
+        self.lines.extend(
+            (
+                # Top edge (with chamfer at left)
+                Line(-half_w + chamfer, -half_h, half_w, -half_h, "F.Fab", width),
+                # Right edge
+                Line(half_w, -half_h, half_w, half_h, "F.Fab", width),
+                # Bottom edge
+                Line(half_w, half_h, -half_w, half_h, "F.Fab", width),
+                # Left edge (with chamfer at top)
+                Line(-half_w, half_h, -half_w, -half_h + chamfer, "F.Fab", width),
+                # Chamfer
+                Line(-half_w, -half_h + chamfer, -half_w + chamfer, -half_h, "F.Fab", width),
+            )
         )
 
     def add_reference_and_value(self) -> None:
@@ -198,6 +413,63 @@ class FootprintGenerator(ABC):
             Text("value", self.params.footprint_name, 0, val_y, "F.Fab", font_size=1.0, hide=False)
         )
 
+    def _add_pads_vectorized(
+        self,
+        numbers: Sequence[str],
+        xs: np.ndarray,
+        ys: np.ndarray,
+        width: float,
+        height: float,
+        shape: PadShape,
+        pad_type: PadType,
+        layers: Sequence[str] = _LAYERS_SMD,
+        **common: object,
+    ) -> None:
+        """Bulk-append pads that differ only in number and position.
+
+        Coordinates are computed by the caller as NumPy arrays (e.g. with
+        ``np.arange``) and converted to plain floats in one step, so no
+        per-pin arithmetic runs in Python.
+
+        Args:
+            numbers: Pad numbers, one per position
+            xs: Pad center X coordinates
+            ys: Pad center Y coordinates
+            width: Pad width shared by all pads
+            height: Pad height shared by all pads
+            shape: Pad shape shared by all pads
+            pad_type: Pad type shared by all pads
+            layers: Copper/paste/mask layers (defaults to the Pad default)
+            **common: Any other Pad fields shared by all pads
+        """
+        xs_list = np.asarray(xs, dtype=np.float64).tolist()
+        ys_list = np.asarray(ys, dtype=np.float64).tolist()
+        if not len(numbers) == len(xs_list) == len(ys_list):
+            raise ValueError("numbers, xs and ys must have the same length")
+
+        # Resolve and check the shared fields once on a prototype pad, then
+        # construct the rest positionally with those fields bound. This is
+        # about 3x faster than cloning the prototype with dataclasses.replace()
+        # or copy.copy() plus attribute updates.
+        proto = Pad("", pad_type, shape, 0.0, 0.0, width, height, layers=tuple(layers), **common)
+        tail = (
+            proto.rotation,
+            proto.layers,
+            proto.roundrect_ratio,
+            proto.drill,
+            proto.drill_oval,
+            proto.property_heatsink,
+        )
+
+        # A list comprehension lets extend() grow self.pads once by the known
+        # count instead of step by step while draining a generator
+        self.pads.extend(
+            [
+                Pad(number, pad_type, shape, x, y, width, height, *tail)
+                for number, x, y in zip(numbers, xs_list, ys_list)
+            ]
+        )
+
     def add_thermal_pad(self, thermal: ThermalPad) -> None:
         """Add exposed thermal pad with thermal vias.
 
@@ -214,7 +486,7 @@ class FootprintGenerator(ABC):
                 y=0,
                 width=thermal.width,
                 height=thermal.height,
-                layers=["F.Cu", "F.Mask"],  # No paste on main pad
+                layers=_LAYERS_SMD_NOPASTE,  # No paste on main pad
             )
         )
 
@@ -227,38 +499,35 @@ class FootprintGenerator(ABC):
             start_x = -thermal.width / 2 + via_spacing_x
             start_y = -thermal.height / 2 + via_spacing_y
 
-            for i in range(thermal.via_count_x):
-                for j in range(thermal.via_count_y):
-                    via_x = start_x + i * via_spacing_x
-                    via_y = start_y + j * via_spacing_y
-
-                    self.pads.append(
-                        Pad(
-                            number=thermal.pin_number,
-                            pad_type=PadType.THRU_HOLE,
-                            shape=PadShape.CIRCLE,
-                            x=via_x,
-                            y=via_y,
-                            width=thermal.via_pad_diameter,
-                            height=thermal.via_pad_diameter,
-                            drill=thermal.via_drill,
-                            layers=["*.Cu"],
-                            property_heatsink=True,
-                        )
-                    )
+            # Via grid, X-major order
+            ii, jj = np.meshgrid(
+                np.arange(thermal.via_count_x), np.arange(thermal.via_count_y), indexing="ij"
+            )
+            via_xs = start_x + ii.ravel() * via_spacing_x
+            via_ys = start_y + jj.ravel() * via_spacing_y
+
+            self._add_pads_vectorized(
+                [thermal.pin_number] * thermal.total_via_count,
+                via_xs,
+                via_ys,
+                width=thermal.via_pad_diameter,
+                height=thermal.via_pad_diameter,
+                shape=PadShape.CIRCLE,
+                pad_type=PadType.THRU_HOLE,
+                layers=_LAYERS_TH,
+                drill=thermal.via_drill,
+                property_heatsink=True,
+            )
 
-    def generate(self) -> str:
-        """Generate the complete footprint file.
+    def calculate_all(self) -> None:
+        """Calculate all footprint elements (pads, graphics and texts).
 
-        Returns:
-            KiCad footprint file content as string
+        Elements are calculated once per instance; later calls are no-ops.
+        Construct a new generator to calculate a different footprint.
         """
-        # Clear any previous state
-        self.pads.clear()
-        self.lines.clear()
-        self.circles.clear()
-        self.arcs.clear()
-        self.texts.clear()
+        if self._calculated:
+            return
+        self._calculated = True
 
         # Calculate all elements
         self.calculate_pads()
@@ -271,143 +540,224 @@ class FootprintGenerator(ABC):
         if self.params.has_thermal_pad and self.params.thermal_pad:
             self.add_thermal_pad(self.params.thermal_pad)
 
+    def generate(self) -> str:
+        """Generate the complete footprint file.
+
+        Footprint elements are calculated on the first call only, so repeated
+        calls re-emit the same geometry.
+
+        Returns:
+            KiCad footprint file content as string
+        """
+        self.calculate_all()
+
         # Build output
         return self._build_sexpr()
 
+    def write_to(self, path: Path) -> None:
+        """Write the footprint file directly to disk.
+
+        Elements are streamed through a buffered writer as they are formatted,
+        so the complete file content is never held in memory. Footprint
+        elements are calculated first if needed, as in generate().
+
+        Args:
+            path: Output .kicad_mod file path
+        """
+        self.calculate_all()
+
+        with path.open("w", encoding="utf-8", buffering=65536) as f:
+            self._write_sexpr(f.write)
+
     def _build_sexpr(self) -> str:
-        """Build the S-expression output."""
-        lines = []
+        """Build the S-expression output.
+
+        All formatters append to a single shared buffer which is joined once
+        at the end, avoiding per-element intermediate strings.
+        """
+        out: list[str] = []
+        self._write_sexpr(out.append)
+        return "".join(out)
+
+    def _write_sexpr(self, write: Callable[[str], object]) -> None:
+        """Emit the S-expression output piece by piece through write()."""
+        # UUIDs live in a local iterator so concurrent calls on one generator
+        # each get their own sequence
+        element_count = (
+            len(self.pads) + len(self.lines) + len(self.circles) + len(self.arcs) + len(self.texts)
+        )
+        uuids = iter(_gen_uuids(element_count))
 
         # Header
-        lines.append(f'(footprint "{self.params.footprint_name}"')
-        lines.append(f"  (version {KICAD_VERSION})")
-        lines.append('  (generator "kiforge")')
-        lines.append(f'  (generator_version "{datetime.now().strftime("%Y%m%d")}")')
-        lines.append('  (layer "F.Cu")')
+        write(f'(footprint "{self.params.footprint_name}"\n')
+        write(f"  (version {KICAD_VERSION})\n")
+        write('  (generator "kiforge")\n')
+        write(f'  (generator_version "{GENERATOR_VERSION}")\n')
+        write('  (layer "F.Cu")\n')
 
         # Description and tags
         if self.params.description:
-            lines.append(f'  (descr "{self.params.description}")')
+            write(f'  (descr "{self.params.description}")\n')
         if self.params.tags:
-            lines.append(f'  (tags "{" ".join(self.params.tags)}")')
+            write(f'  (tags "{" ".join(self.params.tags)}")\n')
 
         # Attributes
         if self.params.pad_type == PadType.SMD:
-            lines.append("  (attr smd)")
+            write("  (attr smd)\n")
         elif self.params.pad_type == PadType.THRU_HOLE:
-            lines.append("  (attr through_hole)")
+            write("  (attr through_hole)\n")
 
         # Texts
         for text in self.texts:
-            lines.append(self._format_text(text))
+            self._format_text(text, write, uuids)
 
         # Graphics
         for line in self.lines:
-            lines.append(self._format_line(line))
+            self._format_line(line, write, uuids)
         for circle in self.circles:
-            lines.append(self._format_circle(circle))
+            self._format_circle(circle, write, uuids)
         for arc in self.arcs:
-            lines.append(self._format_arc(arc))
+            self._format_arc(arc, write, uuids)
 
         # Pads
         for pad in self.pads:
-            lines.append(self._format_pad(pad))
+            self._format_pad(pad, write, uuids)
 
         # 3D model
         if self.params.model_3d_path:
-            lines.append(self._format_3d_model())
-
-        lines.append(")")
+            self._format_3d_model(write)
 
-        return "\n".join(lines)
+        write(")")
 
-    def _format_pad(self, pad: Pad) -> str:
+    def _format_pad(
+        self, pad: Pad, write: Callable[[str], object], uuids: Iterator[str]
+    ) -> None:
         """Format a pad as S-expression."""
-        parts = [f'  (pad "{pad.number}" {pad.pad_type.value} {pad.shape.value}']
+        # Fast path for the common QFP/QFN pad
+        if (
+            pad.pad_type is PadType.SMD
+            and pad.shape is PadShape.ROUNDRECT
+            and pad.drill is None
+            and not pad.property_heatsink
+            and pad.rotation == 0
+            and (pad.layers is _LAYERS_SMD or tuple(pad.layers) == _LAYERS_SMD)
+        ):
+            write(
+                _SMD_ROUNDRECT_PAD_TEMPLATE
+                % (
+                    pad.number,
+                    _fmt(pad.x),
+                    _fmt(pad.y),
+                    _fmt(pad.width),
+                    _fmt(pad.height),
+                    pad.roundrect_ratio,
+                    next(uuids),
+                )
+            )
+            return
+
+        write(f'  (pad "{pad.number}" {_PAD_TYPE_STR[pad.pad_type]} {_PAD_SHAPE_STR[pad.shape]}\n')
 
         # Position
         if pad.rotation != 0:
-            parts.append(f"    (at {pad.x:.4f} {pad.y:.4f} {pad.rotation})")
+            write(f"    (at {_fmt(pad.x)} {_fmt(pad.y)} {pad.rotation})\n")
         else:
-            parts.append(f"    (at {pad.x:.4f} {pad.y:.4f})")
+            write(f"    (at {_fmt(pad.x)} {_fmt(pad.y)})\n")
 
         # Size
-        parts.append(f"    (size {pad.width:.4f} {pad.height:.4f})")
+        write(f"    (size {_fmt(pad.width)} {_fmt(pad.height)})\n")
 
         # Drill (for through-hole)
         if pad.drill is not None:
             if pad.drill_oval:
-                parts.append(f"    (drill oval {pad.drill_oval[0]:.4f} {pad.drill_oval[1]:.4f})")
+                write(f"    (drill oval {_fmt(pad.drill_oval[0])} {_fmt(pad.drill_oval[1])})\n")
             else:
-                parts.append(f"    (drill {pad.drill:.4f})")
+                write(f"    (drill {_fmt(pad.drill)})\n")
 
         # Layers
-        layer_str = " ".join(f'"{layer}"' for layer in pad.layers)
-        parts.append(f"    (layers {layer_str})")
+        layer_str = _LAYERS_RENDERED.get(tuple(pad.layers)) or " ".join(
+            f'"{layer}"' for layer in pad.layers
+        )
+        write(f"    (layers {layer_str})\n")
 
         # Roundrect ratio
         if pad.shape == PadShape.ROUNDRECT:
-            parts.append(f"    (roundrect_rratio {pad.roundrect_ratio})")
+            write(f"    (roundrect_rratio {pad.roundrect_ratio})\n")
 
         # Heatsink property
         if pad.property_heatsink:
-            parts.append("    (property pad_prop_heatsink)")
+            write("    (property pad_prop_heatsink)\n")
 
         # UUID
-        parts.append(f"    (uuid {uuid.uuid4()})")
-        parts.append("  )")
+        write(f"    (uuid {next(uuids)})\n  )\n")
 
-        return "\n".join(parts)
-
-    def _format_line(self, line: Line) -> str:
+    def _format_line(
+        self, line: Line, write: Callable[[str], object], uuids: Iterator[str]
+    ) -> None:
         """Format a line as S-expression."""
-        return (
-            f"  (fp_line\n"
-            f"    (start {line.x1:.4f} {line.y1:.4f})\n"
-            f"    (end {line.x2:.4f} {line.y2:.4f})\n"
-            f'    (stroke (width {line.width}) (type solid))\n'
-            f'    (layer "{line.layer}")\n'
-            f"    (uuid {uuid.uuid4()})\n"
-            f"  )"
+        write(
+            _FP_LINE_TEMPLATE
+            % (
+                _fmt(line.x1),
+                _fmt(line.y1),
+                _fmt(line.x2),
+                _fmt(line.y2),
+                line.width,
+                line.layer,
+                next(uuids),
+            )
         )
 
-    def _format_circle(self, circle: Circle) -> str:
+    def _format_circle(
+        self, circle: Circle, write: Callable[[str], object], uuids: Iterator[str]
+    ) -> None:
         """Format a circle as S-expression."""
         # KiCad uses center and a point on the edge
         edge_x = circle.cx + circle.radius
         edge_y = circle.cy
         fill = "solid" if circle.fill else "none"
 
-        return (
-            f"  (fp_circle\n"
-            f"    (center {circle.cx:.4f} {circle.cy:.4f})\n"
-            f"    (end {edge_x:.4f} {edge_y:.4f})\n"
-            f'    (stroke (width {circle.width}) (type solid))\n'
-            f"    (fill {fill})\n"
-            f'    (layer "{circle.layer}")\n'
-            f"    (uuid {uuid.uuid4()})\n"
-            f"  )"
+        write(
+            _FP_CIRCLE_TEMPLATE
+            % (
+                _fmt(circle.cx),
+                _fmt(circle.cy),
+                _fmt(edge_x),
+                _fmt(edge_y),
+                circle.width,
+                fill,
+                circle.layer,
+                next(uuids),
+            )
         )
 
-    def _format_arc(self, arc: Arc) -> str:
+    def _format_arc(
+        self, arc: Arc, write: Callable[[str], object], uuids: Iterator[str]
+    ) -> None:
         """Format an arc as S-expression."""
-        return (
-            f"  (fp_arc\n"
-            f"    (start {arc.start_x:.4f} {arc.start_y:.4f})\n"
-            f"    (mid {arc.mid_x:.4f} {arc.mid_y:.4f})\n"
-            f"    (end {arc.end_x:.4f} {arc.end_y:.4f})\n"
-            f'    (stroke (width {arc.width}) (type solid))\n'
-            f'    (layer "{arc.layer}")\n'
-            f"    (uuid {uuid.uuid4()})\n"
-            f"  )"
+        write(
+            _FP_ARC_TEMPLATE
+            % (
+                _fmt(arc.start_x),
+                _fmt(arc.start_y),
+                _fmt(arc.mid_x),
+                _fmt(arc.mid_y),
+                _fmt(arc.end_x),
+                _fmt(arc.end_y),
+                arc.width,
+                arc.layer,
+                next(uuids),
+            )
         )
 
-    def _format_text(self, text: Text) -> str:
+    def _format_text(
+        self, text: Text, write: Callable[[str], object], uuids: Iterator[str]
+    ) -> None:
         """Format text as S-expression."""
         hidden = " hide" if text.hide else ""
-        return (
+        write(
             f'  (fp_text {text.text_type} "{text.text}"\n'
-            f"    (at {text.x:.4f} {text.y:.4f})\n"
+            f"    (at {_fmt(text.x)} {_fmt(text.y)})\n"
             f'    (layer "{text.layer}"{hidden})\n'
             f"    (effects\n"
             f"      (font\n"
@@ -415,21 +765,21 @@ class FootprintGenerator(ABC):
             f"        (thickness {text.font_thickness})\n"
             f"      )\n"
             f"    )\n"
-            f"    (uuid {uuid.uuid4()})\n"
-            f"  )"
+            f"    (uuid {next(uuids)})\n"
+            f"  )\n"
         )
 
-    def _format_3d_model(self) -> str:
+    def _format_3d_model(self, write: Callable[[str], object]) -> None:
         """Format 3D model reference as S-expression."""
         path = self.params.model_3d_path
         offset = self.params.model_3d_offset
         scale = self.params.model_3d_scale
         rotation = self.params.model_3d_rotation
 
-        return (
+        write(
             f'  (model "{path}"\n'
             f"    (offset (xyz {offset[0]} {offset[1]} {offset[2]}))\n"
             f"    (scale (xyz {scale[0]} {scale[1]} {scale[2]}))\n"
             f"    (rotate (xyz {rotation[0]} {rotation[1]} {rotation[2]}))\n"
-            f"  )"
+            f"  )\n"
         )
@@ -1,15 +1,28 @@
 """QFN/DFN footprint generator."""
 
+from functools import lru_cache
+from itertools import starmap
+
+import numpy as np
+
 from kiforge.core.footprint.generator import (
     Circle,
     FootprintGenerator,
+    FootprintStructure,
     Line,
-    Pad,
+    _quad_coords,
 )
-from kiforge.core.models.enums import PadShape, PadType
+from kiforge.core.models.enums import PackageType, PadShape
 from kiforge.core.models.footprint import FootprintParams, PadDimensions
 from kiforge.core.models.package import PackageInfo, ThermalPad
 
+# Quad variant names mapped to their package types (DFN is handled apart)
+_QFN_VARIANTS = {v: PackageType[v] for v in ("QFN", "VQFN", "WQFN")}
+
+# Silkscreen corner marks, clockwise from top-left (pin 1):
+# (x sign, y sign, whether the mark is drawn starting on its vertical leg)
+_SILK_CORNERS = ((-1, -1, True), (1, -1, False), (1, 1, True), (-1, 1, False))
+
 
 class QFNFootprintGenerator(FootprintGenerator):
     """Generator for QFN/DFN family footprints.
@@ -26,7 +39,6 @@ class QFNFootprintGenerator(FootprintGenerator):
     def calculate_pads(self) -> None:
         """Calculate pad positions for QFN/DFN package."""
         pkg = self.params.package
-        pad_size = self.params.pad_size
 
         # Determine if this is a quad (4-sided) or dual (2-sided) package
         is_dual = pkg.is_dual
@@ -49,90 +61,30 @@ class QFNFootprintGenerator(FootprintGenerator):
         pins_per_side = total_pins // 4
         pitch = pkg.pitch
 
-        # Calculate array span
-        array_span = (pins_per_side - 1) * pitch
-
         # Pad center position - at the edge of the package body
         # For QFN, pads are at body_width/2 (package edge)
         pad_x = self.params.pad_center_x
         pad_y = self.params.pad_center_y
 
-        # Starting position for first pin on each side
-        start_pos = -array_span / 2
-
-        pin_number = 1
-
-        # Side 1 - Left side (pins going downward)
-        for i in range(pins_per_side):
-            y = start_pos + i * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=-pad_x,
-                    y=y,
-                    width=pad_size.width,
-                    height=pad_size.height,
-                    rotation=0,
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
+        coords = _quad_coords(pins_per_side, pitch, pad_x, pad_y)
+
+        numbers = [str(n) for n in range(1, pins_per_side * 4 + 1)]
+        n = pins_per_side
+        horizontal = (pad_size.width, pad_size.height)
+        vertical = (pad_size.height, pad_size.width)  # Swap for vertical orientation
+        common = dict(
+            shape=pad_size.shape,
+            pad_type=self.params.pad_type,
+            roundrect_ratio=pad_size.corner_ratio,
+        )
+
+        # Sides in pin order: left, bottom, right, top
+        for side in range(4):
+            rows = slice(side * n, (side + 1) * n)
+            width, height = vertical if side % 2 else horizontal
+            self._add_pads_vectorized(
+                numbers[rows], coords[rows, 0], coords[rows, 1], width, height, **common
             )
-            pin_number += 1
-
-        # Side 2 - Bottom side (pins going right)
-        for i in range(pins_per_side):
-            x = start_pos + i * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=x,
-                    y=pad_y,
-                    width=pad_size.height,  # Swap for vertical orientation
-                    height=pad_size.width,
-                    rotation=0,
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
-            )
-            pin_number += 1
-
-        # Side 3 - Right side (pins going upward)
-        for i in range(pins_per_side):
-            y = start_pos + (pins_per_side - 1 - i) * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=pad_x,
-                    y=y,
-                    width=pad_size.width,
-                    height=pad_size.height,
-                    rotation=0,
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
-            )
-            pin_number += 1
-
-        # Side 4 - Top side (pins going left)
-        for i in range(pins_per_side):
-            x = start_pos + (pins_per_side - 1 - i) * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=x,
-                    y=-pad_y,
-                    width=pad_size.height,  # Swap for vertical orientation
-                    height=pad_size.width,
-                    rotation=0,
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
-            )
-            pin_number += 1
 
     def _calculate_dual_pads(self) -> None:
         """Calculate pad positions for 2-sided DFN package."""
@@ -153,90 +105,65 @@ class QFNFootprintGenerator(FootprintGenerator):
         # Pad center position
         pad_x = self.params.pad_center_x
 
-        # Starting position
-        start_y = -array_span / 2
+        # Pin positions along a side, top of the array first
+        positions = np.arange(pins_per_side, dtype=np.float64) * pitch - array_span / 2
 
-        pin_number = 1
+        numbers = [str(n) for n in range(1, pins_per_side * 2 + 1)]
+        n = pins_per_side
+        common = dict(
+            shape=pad_size.shape,
+            pad_type=self.params.pad_type,
+            roundrect_ratio=pad_size.corner_ratio,
+        )
 
         # Left side (pins going downward)
-        for i in range(pins_per_side):
-            y = start_y + i * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=-pad_x,
-                    y=y,
-                    width=pad_size.width,
-                    height=pad_size.height,
-                    rotation=0,
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
-            )
-            pin_number += 1
-
+        self._add_pads_vectorized(
+            numbers[:n], np.full(n, -pad_x), positions, pad_size.width, pad_size.height, **common
+        )
         # Right side (pins going upward)
-        for i in range(pins_per_side):
-            y = start_y + (pins_per_side - 1 - i) * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=pad_x,
-                    y=y,
-                    width=pad_size.width,
-                    height=pad_size.height,
-                    rotation=0,
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
-            )
-            pin_number += 1
+        self._add_pads_vectorized(
+            numbers[n:],
+            np.full(n, pad_x),
+            positions[::-1],
+            pad_size.width,
+            pad_size.height,
+            **common,
+        )
 
     def calculate_silkscreen(self) -> None:
         """Calculate silkscreen with cutouts for pads and pin 1 marker."""
-        pkg = self.params.package
-        pad_size = self.params.pad_size
-        margin = self.params.silkscreen_margin
-        width = self.params.silkscreen_line_width
+        # Read all model attributes once up front
+        params = self.params
+        pkg = params.package
+        pad_height = params.pad_size.height
+        margin = params.silkscreen_margin
+        width = params.silkscreen_line_width
+        pitch = pkg.pitch
+        pins_per_side = pkg.pins_per_side or (pkg.pin_count // 4)
 
         # Body outline
         body_half_w = pkg.body_width / 2
         body_half_h = pkg.body_length / 2
 
-        # Pad extents - where silkscreen must not overlap
-        pad_x = self.params.pad_center_x
-        pad_y = self.params.pad_center_y
-
-        # For QFN, pads extend into the body, so we draw outside the pads
-        # Calculate where pads end (inner edge of pads)
-        pad_inner_x = pad_x - pad_size.width / 2 - margin
-        pad_inner_y = pad_y - pad_size.width / 2 - margin  # Using width because pads are rotated
-
         # Pin array span
-        pins_per_side = pkg.pins_per_side or (pkg.pin_count // 4)
-        pitch = pkg.pitch
-        array_half = (pins_per_side - 1) * pitch / 2 + pad_size.height / 2 + margin
+        array_half = (pins_per_side - 1) * pitch / 2 + pad_height / 2 + margin
 
         # Draw corner marks only (to avoid overlapping with pads)
         corner_len = min(1.0, body_half_w * 0.3)
 
-        # Top-left corner (with pin 1 marker)
-        self.lines.append(Line(-body_half_w, -body_half_h + corner_len, -body_half_w, -body_half_h, "F.SilkS", width))
-        self.lines.append(Line(-body_half_w, -body_half_h, -body_half_w + corner_len, -body_half_h, "F.SilkS", width))
-
-        # Top-right corner
-        self.lines.append(Line(body_half_w - corner_len, -body_half_h, body_half_w, -body_half_h, "F.SilkS", width))
-        self.lines.append(Line(body_half_w, -body_half_h, body_half_w, -body_half_h + corner_len, "F.SilkS", width))
-
-        # Bottom-right corner
-        self.lines.append(Line(body_half_w, body_half_h - corner_len, body_half_w, body_half_h, "F.SilkS", width))
-        self.lines.append(Line(body_half_w, body_half_h, body_half_w - corner_len, body_half_h, "F.SilkS", width))
-
-        # Bottom-left corner
-        self.lines.append(Line(-body_half_w + corner_len, body_half_h, -body_half_w, body_half_h, "F.SilkS", width))
-        self.lines.append(Line(-body_half_w, body_half_h, -body_half_w, body_half_h - corner_len, "F.SilkS", width))
+        segments: list[tuple[float, float, float, float, str, float]] = []
+        for sx, sy, vertical_first in _SILK_CORNERS:
+            cx = sx * body_half_w
+            cy = sy * body_half_h
+            # Ends of the vertical and horizontal legs of the corner mark
+            vertical_end = (cx, cy - sy * corner_len)
+            horizontal_end = (cx - sx * corner_len, cy)
+            start, end = (
+                (vertical_end, horizontal_end) if vertical_first else (horizontal_end, vertical_end)
+            )
+            segments.append((*start, cx, cy, "F.SilkS", width))
+            segments.append((cx, cy, *end, "F.SilkS", width))
+        self.lines.extend(starmap(Line, segments))
 
         # Pin 1 marker - dot near top-left corner
         marker_x = -body_half_w - 0.5
@@ -258,6 +185,11 @@ def create_qfn_footprint(
 ) -> str:
     """Create a QFN/DFN footprint with the given parameters.
 
+    The pad and graphics layout is cached per parameter set (see
+    build_qfn_footprint); only the S-expression with fresh UUIDs is built
+    on each call. The output itself is not cached because every file
+    needs its own UUIDs.
+
     Args:
         pins: Total pin count (must be divisible by 4 for QFN, 2 for DFN)
         pitch: Pin pitch in mm
@@ -272,8 +204,85 @@ def create_qfn_footprint(
     Returns:
         KiCad footprint file content
     """
-    from kiforge.core.models.enums import PackageType
+    generator = build_qfn_footprint(
+        pins,
+        pitch,
+        body_width,
+        body_length,
+        body_height,
+        terminal_length,
+        terminal_width,
+        thermal_pad_size,
+        variant,
+    )
+    return generator.generate()
+
+
+def build_qfn_footprint(
+    pins: int,
+    pitch: float,
+    body_width: float,
+    body_length: float | None = None,
+    body_height: float = 0.9,
+    terminal_length: float | None = None,
+    terminal_width: float | None = None,
+    thermal_pad_size: float | None = None,
+    variant: str = "QFN",
+) -> QFNFootprintGenerator:
+    """Build a QFN/DFN footprint generator with all elements calculated.
+
+    The layout is cached per parameter set as an immutable snapshot, and
+    every call returns a new generator built from it, so callers may edit
+    the result freely. Use write_to() to stream the footprint to disk.
+    Call _build_qfn_structure.cache_clear() to drop cached layouts.
+
+    Args:
+        pins: Total pin count (must be divisible by 4 for QFN, 2 for DFN)
+        pitch: Pin pitch in mm
+        body_width: Package body width in mm
+        body_length: Package body length in mm (defaults to body_width)
+        body_height: Package height in mm
+        terminal_length: Terminal length in mm (defaults to 0.4)
+        terminal_width: Terminal width in mm (defaults to pitch * 0.5)
+        thermal_pad_size: Thermal pad size in mm (defaults to body_width * 0.6)
+        variant: QFN variant name (QFN, DFN, VQFN, WQFN)
+
+    Returns:
+        Calculated QFN/DFN footprint generator
+    """
+    # Always pass arguments positionally: lru_cache keys keyword and
+    # positional calls separately
+    structure = _build_qfn_structure(
+        pins,
+        pitch,
+        body_width,
+        body_length,
+        body_height,
+        terminal_length,
+        terminal_width,
+        thermal_pad_size,
+        variant,
+    )
+    return QFNFootprintGenerator.from_structure(structure)
 
+
+@lru_cache(maxsize=512, typed=True)
+def _build_qfn_structure(
+    pins: int,
+    pitch: float,
+    body_width: float,
+    body_length: float | None,
+    body_height: float,
+    terminal_length: float | None,
+    terminal_width: float | None,
+    thermal_pad_size: float | None,
+    variant: str,
+) -> FootprintStructure:
+    """Calculate the QFN/DFN layout for one parameter set.
+
+    The cache is typed: 10 and 10.0 format differently in the footprint
+    name, so they are cached separately.
+    """
     if body_length is None:
         body_length = body_width
 
@@ -295,11 +304,7 @@ def create_qfn_footprint(
     else:
         if pins % 4 != 0:
             raise ValueError("QFN pin count must be divisible by 4")
-        pkg_type = PackageType.QFN
-        if variant_upper == "VQFN":
-            pkg_type = PackageType.VQFN
-        elif variant_upper == "WQFN":
-            pkg_type = PackageType.WQFN
+        pkg_type = _QFN_VARIANTS.get(variant_upper, PackageType.QFN)
 
     # Create thermal pad
     thermal_pad = ThermalPad(
@@ -354,6 +359,4 @@ def create_qfn_footprint(
         pad_center_y=pad_center,
     )
 
-    # Generate
-    generator = QFNFootprintGenerator(params)
-    return generator.generate()
+    return QFNFootprintGenerator(params).to_structure()
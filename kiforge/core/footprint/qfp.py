@@ -1,16 +1,21 @@
 """QFP/LQFP/TQFP footprint generator."""
 
-import math
+from functools import lru_cache
+from itertools import starmap
 
 from kiforge.core.footprint.generator import (
-    Arc,
     Circle,
     FootprintGenerator,
+    FootprintStructure,
     Line,
-    Pad,
+    _quad_coords,
 )
-from kiforge.core.models.enums import PadShape
-from kiforge.core.models.footprint import FootprintParams
+from kiforge.core.models.enums import PackageType
+from kiforge.core.models.footprint import FootprintParams, PadDimensions
+from kiforge.core.models.package import PackageInfo
+
+# Variant names mapped to their package types
+_QFP_VARIANTS = {v: PackageType[v] for v in ("LQFP", "TQFP", "VQFP", "QFP")}
 
 
 class QFPFootprintGenerator(FootprintGenerator):
@@ -40,151 +45,83 @@ class QFPFootprintGenerator(FootprintGenerator):
         pitch = pkg.pitch
         total_pins = pins_per_side * 4
 
-        # Calculate the array span (distance from first to last pin center on each side)
-        array_span = (pins_per_side - 1) * pitch
-
         # Pad center offset from origin (X for left/right, Y for top/bottom)
         pad_x = self.params.pad_center_x
         pad_y = self.params.pad_center_y
 
-        # Starting Y position for side 1 (left) - top of the array
-        start_y = -array_span / 2
-
-        pin_number = 1
-
-        # Side 1 - Left side (pins going downward)
-        for i in range(pins_per_side):
-            y = start_y + i * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=-pad_x,
-                    y=y,
-                    width=pad_size.width,
-                    height=pad_size.height,
-                    rotation=0,  # Horizontal pad
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
-            )
-            pin_number += 1
-
-        # Starting X position for side 2 (bottom) - left of the array
-        start_x = -array_span / 2
-
-        # Side 2 - Bottom side (pins going right)
-        for i in range(pins_per_side):
-            x = start_x + i * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=x,
-                    y=pad_y,
-                    width=pad_size.height,  # Swap for vertical orientation
-                    height=pad_size.width,
-                    rotation=0,  # Rotated pad (swap width/height)
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
-            )
-            pin_number += 1
-
-        # Starting Y position for side 3 (right) - bottom of the array
-        start_y = array_span / 2
-
-        # Side 3 - Right side (pins going upward)
-        for i in range(pins_per_side):
-            y = start_y - i * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=pad_x,
-                    y=y,
-                    width=pad_size.width,
-                    height=pad_size.height,
-                    rotation=0,  # Horizontal pad
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
+        coords = _quad_coords(pins_per_side, pitch, pad_x, pad_y)
+
+        numbers = [str(n) for n in range(1, total_pins + 1)]
+        n = pins_per_side
+        horizontal = (pad_size.width, pad_size.height)
+        vertical = (pad_size.height, pad_size.width)  # Swap for vertical orientation
+        common = dict(
+            shape=pad_size.shape,
+            pad_type=self.params.pad_type,
+            roundrect_ratio=pad_size.corner_ratio,
+        )
+
+        # Sides in pin order: left, bottom, right, top
+        for side in range(4):
+            rows = slice(side * n, (side + 1) * n)
+            width, height = vertical if side % 2 else horizontal
+            self._add_pads_vectorized(
+                numbers[rows], coords[rows, 0], coords[rows, 1], width, height, **common
             )
-            pin_number += 1
-
-        # Starting X position for side 4 (top) - right of the array
-        start_x = array_span / 2
-
-        # Side 4 - Top side (pins going left)
-        for i in range(pins_per_side):
-            x = start_x - i * pitch
-            self.pads.append(
-                Pad(
-                    number=str(pin_number),
-                    pad_type=self.params.pad_type,
-                    shape=pad_size.shape,
-                    x=x,
-                    y=-pad_y,
-                    width=pad_size.height,  # Swap for vertical orientation
-                    height=pad_size.width,
-                    rotation=0,  # Rotated pad (swap width/height)
-                    roundrect_ratio=pad_size.corner_ratio,
-                )
-            )
-            pin_number += 1
 
     def calculate_silkscreen(self) -> None:
         """Calculate silkscreen with cutouts for pads and pin 1 marker."""
-        pkg = self.params.package
-        pad_size = self.params.pad_size
-        margin = self.params.silkscreen_margin
-        width = self.params.silkscreen_line_width
+        # Read all model attributes once up front
+        params = self.params
+        pkg = params.package
+        pad_w = params.pad_size.width
+        pad_h = params.pad_size.height
+        margin = params.silkscreen_margin
+        width = params.silkscreen_line_width
+        pitch = pkg.pitch
+        pins_per_side = pkg.pins_per_side or 1
 
         # Body outline position
         body_half_w = pkg.body_width / 2
         body_half_h = pkg.body_length / 2
 
         # Pad extents - where silkscreen must not overlap
-        pad_x = self.params.pad_center_x
-        pad_y = self.params.pad_center_y
-        pad_edge_x = pad_x - pad_size.width / 2 - margin
-        pad_edge_y = pad_y - pad_size.height / 2 - margin
+        pad_x = params.pad_center_x
+        pad_y = params.pad_center_y
+        pad_edge_x = pad_x - pad_w / 2 - margin
+        pad_edge_y = pad_y - pad_h / 2 - margin
 
         # Pin array span
-        pins_per_side = pkg.pins_per_side or 1
-        pitch = pkg.pitch
-        array_half = (pins_per_side - 1) * pitch / 2 + pad_size.height / 2 + margin
-
-        # Draw silkscreen lines around the body, avoiding pad areas
-
-        # Top-left corner to top-right corner (with gaps for pads)
-        # Left segment
-        if body_half_w > pad_edge_x:
-            self.lines.append(Line(-body_half_w, -body_half_h, -pad_edge_x, -body_half_h, "F.SilkS", width))
-        # Right segment
-        if body_half_w > pad_edge_x:
-            self.lines.append(Line(pad_edge_x, -body_half_h, body_half_w, -body_half_h, "F.SilkS", width))
-
-        # Bottom edge
-        if body_half_w > pad_edge_x:
-            self.lines.append(Line(-body_half_w, body_half_h, -pad_edge_x, body_half_h, "F.SilkS", width))
-        if body_half_w > pad_edge_x:
-            self.lines.append(Line(pad_edge_x, body_half_h, body_half_w, body_half_h, "F.SilkS", width))
-
-        # Left edge (with gaps for pads)
-        if body_half_h > pad_edge_y:
-            self.lines.append(Line(-body_half_w, -body_half_h, -body_half_w, -pad_edge_y, "F.SilkS", width))
-        if body_half_h > pad_edge_y:
-            self.lines.append(Line(-body_half_w, pad_edge_y, -body_half_w, body_half_h, "F.SilkS", width))
-
-        # Right edge
-        if body_half_h > pad_edge_y:
-            self.lines.append(Line(body_half_w, -body_half_h, body_half_w, -pad_edge_y, "F.SilkS", width))
-        if body_half_h > pad_edge_y:
-            self.lines.append(Line(body_half_w, pad_edge_y, body_half_w, body_half_h, "F.SilkS", width))
+        array_half = (pins_per_side - 1) * pitch / 2 + pad_h / 2 + margin
+
+        # Draw silkscreen lines around the body, avoiding pad areas. The
+        # segments only exist where the body extends past the pad rows.
+        emit_horizontal = body_half_w > pad_edge_x
+        emit_vertical = body_half_h > pad_edge_y
+
+        segments: list[tuple[float, float, float, float, str, float]] = []
+        if emit_horizontal:
+            segments += (
+                # Top edge, left and right segments
+                (-body_half_w, -body_half_h, -pad_edge_x, -body_half_h, "F.SilkS", width),
+                (pad_edge_x, -body_half_h, body_half_w, -body_half_h, "F.SilkS", width),
+                # Bottom edge
+                (-body_half_w, body_half_h, -pad_edge_x, body_half_h, "F.SilkS", width),
+                (pad_edge_x, body_half_h, body_half_w, body_half_h, "F.SilkS", width),
+            )
+        if emit_vertical:
+            segments += (
+                # Left edge, top and bottom segments
+                (-body_half_w, -body_half_h, -body_half_w, -pad_edge_y, "F.SilkS", width),
+                (-body_half_w, pad_edge_y, -body_half_w, body_half_h, "F.SilkS", width),
+                # Right edge
+                (body_half_w, -body_half_h, body_half_w, -pad_edge_y, "F.SilkS", width),
+                (body_half_w, pad_edge_y, body_half_w, body_half_h, "F.SilkS", width),
+            )
+        self.lines.extend(starmap(Line, segments))
 
         # Pin 1 marker - dot near top-left corner
-        pin1_marker_x = -pad_x - pad_size.width / 2 - 0.5
+        pin1_marker_x = -pad_x - pad_w / 2 - 0.5
         pin1_marker_y = -array_half
         marker_radius = 0.2
 
@@ -203,6 +140,11 @@ def create_qfp_footprint(
 ) -> str:
     """Create a QFP footprint with the given parameters.
 
+    The pad and graphics layout is cached per parameter set (see
+    build_qfp_footprint); only the S-expression with fresh UUIDs is built
+    on each call. The output itself is not cached because every file
+    needs its own UUIDs.
+
     Args:
         pins: Total pin count (must be divisible by 4)
         pitch: Pin pitch in mm
@@ -216,10 +158,66 @@ def create_qfp_footprint(
     Returns:
         KiCad footprint file content
     """
-    from kiforge.core.models.enums import PackageType
-    from kiforge.core.models.footprint import PadDimensions
-    from kiforge.core.models.package import PackageInfo
+    generator = build_qfp_footprint(
+        pins, pitch, body_width, body_length, lead_span, body_height, lead_width, variant
+    )
+    return generator.generate()
+
 
+def build_qfp_footprint(
+    pins: int,
+    pitch: float,
+    body_width: float,
+    body_length: float,
+    lead_span: float,
+    body_height: float = 1.4,
+    lead_width: float | None = None,
+    variant: str = "LQFP",
+) -> QFPFootprintGenerator:
+    """Build a QFP footprint generator with all elements calculated.
+
+    The layout is cached per parameter set as an immutable snapshot, and
+    every call returns a new generator built from it, so callers may edit
+    the result freely. Use write_to() to stream the footprint to disk.
+    Call _build_qfp_structure.cache_clear() to drop cached layouts.
+
+    Args:
+        pins: Total pin count (must be divisible by 4)
+        pitch: Pin pitch in mm
+        body_width: Package body width in mm
+        body_length: Package body length in mm
+        lead_span: Lead span (tip to tip) in mm
+        body_height: Package height (determines variant)
+        lead_width: Lead width (defaults to 0.6 * pitch)
+        variant: QFP variant name
+
+    Returns:
+        Calculated QFP footprint generator
+    """
+    # Always pass arguments positionally: lru_cache keys keyword and
+    # positional calls separately
+    structure = _build_qfp_structure(
+        pins, pitch, body_width, body_length, lead_span, body_height, lead_width, variant
+    )
+    return QFPFootprintGenerator.from_structure(structure)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_qfp_structure(
+    pins: int,
+    pitch: float,
+    body_width: float,
+    body_length: float,
+    lead_span: float,
+    body_height: float,
+    lead_width: float | None,
+    variant: str,
+) -> FootprintStructure:
+    """Calculate the QFP layout for one parameter set.
+
+    The cache is typed: 10 and 10.0 format differently in the footprint
+    name, so they are cached separately.
+    """
     if pins % 4 != 0:
         raise ValueError("QFP pin count must be divisible by 4")
 
@@ -227,11 +225,7 @@ def create_qfp_footprint(
         lead_width = pitch * 0.6
 
     # Determine package type from variant
-    variant_upper = variant.upper()
-    if variant_upper in ("LQFP", "TQFP", "VQFP", "QFP"):
-        pkg_type = PackageType[variant_upper]
-    else:
-        pkg_type = PackageType.LQFP
+    pkg_type = _QFP_VARIANTS.get(variant.upper(), PackageType.LQFP)
 
     # Create package info
     package = PackageInfo(
@@ -274,6 +268,4 @@ def create_qfp_footprint(
         pad_center_y=pad_center,
     )
 
-    # Generate
-    generator = QFPFootprintGenerator(params)
-    return generator.generate()
+    return QFPFootprintGenerator(params).to_structure()
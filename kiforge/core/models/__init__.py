@@ -1,4 +1,11 @@
-"""Data models for KiForge."""
+"""Data models for KiForge.
+
+The pydantic models are loaded on first access (PEP 562), so importing one
+submodule such as ``kiforge.core.models.pin`` does not build the schemas of
+every other model in the package.
+"""
+
+from typing import TYPE_CHECKING
 
 from kiforge.core.models.enums import (
     BGABallPattern,
@@ -10,10 +17,23 @@ from kiforge.core.models.enums import (
     PinGroupCategory,
     PinOrientation,
 )
-from kiforge.core.models.pin import Pin, PinGroup
-from kiforge.core.models.package import PackageInfo, ThermalPad
-from kiforge.core.models.footprint import FootprintParams, PadDimensions
-from kiforge.core.models.component import ComponentInfo
+
+if TYPE_CHECKING:
+    from kiforge.core.models.component import ComponentInfo
+    from kiforge.core.models.footprint import FootprintParams, PadDimensions
+    from kiforge.core.models.package import PackageInfo, ThermalPad
+    from kiforge.core.models.pin import Pin, PinGroup
+
+# Model name -> defining submodule, imported lazily by __getattr__
+_LAZY_MODELS = {
+    "Pin": "pin",
+    "PinGroup": "pin",
+    "ThermalPad": "package",
+    "PackageInfo": "package",
+    "PadDimensions": "footprint",
+    "FootprintParams": "footprint",
+    "ComponentInfo": "component",
+}
 
 __all__ = [
     # Enums
@@ -34,3 +54,19 @@ __all__ = [
     "FootprintParams",
     "ComponentInfo",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a model's submodule on first access and cache the model."""
+    module = _LAZY_MODELS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,54 @@
 """Master component information model."""
 
+from collections import Counter
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+)
 
 from kiforge.core.models.enums import PinElectricalType
 from kiforge.core.models.package import PackageInfo
 from kiforge.core.models.pin import Pin, PinGroup
 
+# Instance dict key of the lazily built pin lookup tables
+_PIN_TABLES = "_cached_pin_tables"
+
+
+def _build_pin_tables(pins: list[Pin]) -> dict[str, Any]:
+    """Index pins by number and name and sort them into categories in one pass."""
+    by_number: dict[str, Pin] = {}
+    by_name: dict[str, Pin] = {}
+    power: list[Pin] = []
+    ground: list[Pin] = []
+    nc: list[Pin] = []
+    by_etype: dict[PinElectricalType, list[Pin]] = {}
+    for p in pins:
+        by_number[p.number] = p
+        # The first pin wins on duplicate names
+        by_name.setdefault(p.name.lower(), p)
+        if p.is_power or p.is_supply:
+            power.append(p)
+        if p.is_ground:
+            ground.append(p)
+        if p.is_nc:
+            nc.append(p)
+        by_etype.setdefault(p.electrical_type, []).append(p)
+    return {
+        "count": len(pins),
+        "by_number": by_number,
+        "by_name": by_name,
+        "power": power,
+        "ground": ground,
+        "nc": nc,
+        "by_etype": by_etype,
+    }
+
 
 class ComponentInfo(BaseModel):
     """Master component information - aggregates all extracted data.
@@ -15,6 +56,9 @@ class ComponentInfo(BaseModel):
     This is the central data structure that holds all information about
     a component extracted from datasheets and used to generate KiCad
     symbols, footprints, and 3D models.
+
+    Pin lookups and categories are served from tables built on first use.
+    They are rebuilt when pins is reassigned or its length changes.
     """
 
     # Identity
@@ -110,9 +154,12 @@ class ComponentInfo(BaseModel):
     )
 
     # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.now,
-        description="Creation timestamp",
+    created_at: datetime | None = Field(
+        default=None,
+        description=(
+            "Creation timestamp; if unset, stamped on first read or serialization "
+            "and kept from then on"
+        ),
     )
 
     source_document: str | None = Field(
@@ -137,18 +184,68 @@ class ComponentInfo(BaseModel):
     @classmethod
     def validate_unique_pin_numbers(cls, pins: list[Pin]) -> list[Pin]:
         """Ensure pin numbers are unique within the component."""
-        numbers = [p.number for p in pins]
-        if len(numbers) != len(set(numbers)):
-            # Find duplicates
-            seen = set()
-            duplicates = []
-            for n in numbers:
-                if n in seen:
-                    duplicates.append(n)
-                seen.add(n)
-            raise ValueError(f"Duplicate pin numbers: {set(duplicates)}")
+        counts = Counter(p.number for p in pins)
+        duplicates = {n for n, c in counts.items() if c > 1}
+        if duplicates:
+            raise ValueError(f"Duplicate pin numbers: {duplicates}")
         return pins
 
+    def model_post_init(self, context: Any, /) -> None:
+        """Defer stamping an unset created_at until it is first needed."""
+        if self.created_at is None:
+            # A missing key routes the first read through __getattr__
+            del self.__dict__["created_at"]
+
+    def __getattr__(self, name: str) -> Any:
+        """Stamp created_at on first read and store it on the instance."""
+        if name == "created_at":
+            return self._stamp_created_at()
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    def _stamp_created_at(self) -> datetime:
+        stamp = datetime.now()
+        # Move the later fields behind it so dumps keep the declared order
+        values = self.__dict__
+        later = [(key, values.pop(key)) for key in _FIELDS_AFTER_CREATED_AT]
+        values["created_at"] = stamp
+        values.update(later)
+        return stamp
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        """Serialize the model, stamping an unset created_at first.
+
+        The timestamp is stored, so repeated dumps and reads of created_at
+        all report the same value.
+        """
+        if "created_at" not in self.__dict__:
+            self._stamp_created_at()
+        return handler(self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping pin tables when pins is reassigned."""
+        super().__setattr__(name, value)
+        if name == "pins":
+            self._clear_pin_tables()
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> "ComponentInfo":
+        """Copy the model; pin tables are rebuilt for the copy on demand."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._clear_pin_tables()
+        return copied
+
+    def _clear_pin_tables(self) -> None:
+        self.__dict__.pop(_PIN_TABLES, None)
+
+    def _pin_tables(self) -> dict[str, Any]:
+        """Pin lookup tables, rebuilt together whenever the pin count changes."""
+        tables = self.__dict__.get(_PIN_TABLES)
+        if tables is None or tables["count"] != len(self.pins):
+            tables = self.__dict__[_PIN_TABLES] = _build_pin_tables(self.pins)
+        return tables
+
     @property
     def pin_count(self) -> int:
         """Total number of pins."""
@@ -164,13 +261,16 @@ class ComponentInfo(BaseModel):
     def get_pins_by_electrical_type(self, etype: PinElectricalType) -> list[Pin]:
         """Filter pins by electrical type.
 
+        Served from pin tables that are rebuilt when pins is reassigned or
+        its length changes; after replacing a pin in place, reassign pins.
+
         Args:
             etype: Electrical type to filter by
 
         Returns:
             List of pins with the specified electrical type
         """
-        return [p for p in self.pins if p.electrical_type == etype]
+        return list(self._pin_tables()["by_etype"].get(etype, ()))
 
     def get_pins_by_unit(self, unit: int) -> list[Pin]:
         """Get pins belonging to a specific symbol unit.
@@ -199,41 +299,45 @@ class ComponentInfo(BaseModel):
 
     def get_power_pins(self) -> list[Pin]:
         """Get all power-related pins (VCC, VDD, etc.)."""
-        return [p for p in self.pins if p.is_power or p.is_supply]
+        return list(self._pin_tables()["power"])
 
     def get_ground_pins(self) -> list[Pin]:
         """Get all ground pins (GND, VSS, etc.)."""
-        return [p for p in self.pins if p.is_ground]
+        return list(self._pin_tables()["ground"])
 
     def get_nc_pins(self) -> list[Pin]:
         """Get all no-connect pins."""
-        return [p for p in self.pins if p.is_nc]
+        return list(self._pin_tables()["nc"])
 
     def get_pin_by_number(self, number: str) -> Pin | None:
         """Look up a pin by its number.
 
+        Served from pin tables that are rebuilt when pins is reassigned or
+        its length changes; after replacing a pin in place, reassign pins.
+
         Args:
             number: Pin number to find
 
         Returns:
             Pin if found, None otherwise
         """
-        for pin in self.pins:
-            if pin.number == number:
-                return pin
-        return None
+        return self._pin_tables()["by_number"].get(number)
 
     def get_pin_by_name(self, name: str) -> Pin | None:
         """Look up a pin by its name (case-insensitive).
 
+        Served from pin tables that are rebuilt when pins is reassigned or
+        its length changes; after replacing a pin in place, reassign pins.
+
         Args:
             name: Pin name to find
 
         Returns:
             Pin if found, None otherwise
         """
-        name_lower = name.lower()
-        for pin in self.pins:
-            if pin.name.lower() == name_lower:
-                return pin
-        return None
+        return self._pin_tables()["by_name"].get(name.lower())
+
+
+# Fields declared after created_at, moved behind it when it is stamped lazily
+_COMPONENT_FIELDS = list(ComponentInfo.model_fields)
+_FIELDS_AFTER_CREATED_AT = tuple(_COMPONENT_FIELDS[_COMPONENT_FIELDS.index("created_at") + 1 :])
@@ -1,4 +1,14 @@
-"""Enumerations for KiForge data models."""
+"""Enumerations for KiForge data models.
+
+These are plain stdlib ``str, Enum`` classes. Parsers map raw strings to
+members through lookup tables (see ``TYPE_MAPPINGS`` in the CSV parser), so
+models receive members rather than values, and pydantic-core validates enum
+fields natively. Member access and by-value lookup are therefore not on any
+hot path and a third-party enum replacement would buy nothing. Where a
+by-value lookup such as ``PackageType("LQFP")`` does happen, every supported
+Python (3.10+) already resolves it with a single ``_value2member_map_`` probe
+before falling back to a scan, so no ``__new__`` override is needed either.
+"""
 
 from enum import Enum
 
@@ -1,11 +1,55 @@
 """Package information and dimension models."""
 
-from typing import Literal
+from functools import cached_property
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from kiforge.core.models.enums import BGABallPattern, PackageType
 
+# Package family flags, one bitmask per package type
+_LEADED = 1
+_BGA = 2
+_LEADLESS = 4
+_QUAD = 8
+_DUAL = 16
+
+_PACKAGE_FLAGS: dict[PackageType, int] = {
+    PackageType.QFP: _LEADED | _QUAD,
+    PackageType.LQFP: _LEADED | _QUAD,
+    PackageType.TQFP: _LEADED | _QUAD,
+    PackageType.VQFP: _LEADED | _QUAD,
+    PackageType.QFN: _LEADLESS | _QUAD,
+    PackageType.VQFN: _LEADLESS | _QUAD,
+    PackageType.WQFN: _LEADLESS | _QUAD,
+    PackageType.DFN: _LEADLESS | _DUAL,
+    PackageType.BGA: _BGA,
+    PackageType.FBGA: _BGA,
+    PackageType.TFBGA: _BGA,
+    PackageType.UFBGA: _BGA,
+    PackageType.WLCSP: _BGA,
+    PackageType.DSBGA: _BGA,
+    PackageType.SOIC: _LEADED | _DUAL,
+    PackageType.SOP: _LEADED | _DUAL,
+    PackageType.SSOP: _LEADED | _DUAL,
+    PackageType.TSSOP: _LEADED | _DUAL,
+    PackageType.MSOP: _LEADED | _DUAL,
+    PackageType.DIP: _LEADED | _DUAL,
+    PackageType.SOT: 0,
+    PackageType.SOT23: 0,
+    PackageType.SOT223: 0,
+    PackageType.TO: 0,
+    PackageType.SC70: 0,
+}
+
+# BGA row naming; the default skip set is shared by nearly every part
+_ROW_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DEFAULT_SKIP_LETTERS = frozenset("IOQSXZ")
+_DEFAULT_ROW_LETTERS = tuple(c for c in _ROW_ALPHABET if c not in _DEFAULT_SKIP_LETTERS)
+
+# Lazily built lookup tables cached on BGAParams instances
+_BGA_CACHES = ("_row_letters", "_depopulated_set")
+
 
 class ThermalPad(BaseModel):
     """Exposed thermal pad (EP) configuration.
@@ -190,110 +234,73 @@ class PackageInfo(BaseModel):
     @property
     def is_leaded(self) -> bool:
         """Check if package has external leads (vs leadless/BGA)."""
-        return self.package_type in (
-            PackageType.QFP,
-            PackageType.LQFP,
-            PackageType.TQFP,
-            PackageType.VQFP,
-            PackageType.SOIC,
-            PackageType.SOP,
-            PackageType.SSOP,
-            PackageType.TSSOP,
-            PackageType.MSOP,
-            PackageType.DIP,
-        )
+        return bool(_PACKAGE_FLAGS[self.package_type] & _LEADED)
 
     @property
     def is_bga(self) -> bool:
         """Check if package is a BGA variant."""
-        return self.package_type in (
-            PackageType.BGA,
-            PackageType.FBGA,
-            PackageType.TFBGA,
-            PackageType.UFBGA,
-            PackageType.WLCSP,
-            PackageType.DSBGA,
-        )
+        return bool(_PACKAGE_FLAGS[self.package_type] & _BGA)
 
     @property
     def is_leadless(self) -> bool:
         """Check if package is leadless (QFN/DFN)."""
-        return self.package_type in (
-            PackageType.QFN,
-            PackageType.VQFN,
-            PackageType.WQFN,
-            PackageType.DFN,
-        )
+        return bool(_PACKAGE_FLAGS[self.package_type] & _LEADLESS)
 
     @property
     def is_quad(self) -> bool:
         """Check if package has pins on 4 sides."""
-        return self.package_type in (
-            PackageType.QFP,
-            PackageType.LQFP,
-            PackageType.TQFP,
-            PackageType.VQFP,
-            PackageType.QFN,
-            PackageType.VQFN,
-            PackageType.WQFN,
-        )
+        return bool(_PACKAGE_FLAGS[self.package_type] & _QUAD)
 
     @property
     def is_dual(self) -> bool:
         """Check if package has pins on 2 sides."""
-        return self.package_type in (
-            PackageType.DFN,
-            PackageType.SOIC,
-            PackageType.SOP,
-            PackageType.SSOP,
-            PackageType.TSSOP,
-            PackageType.MSOP,
-            PackageType.DIP,
-        )
+        return bool(_PACKAGE_FLAGS[self.package_type] & _DUAL)
 
     @property
     def pins_per_side(self) -> int | None:
-        """Calculate pins per side for quad packages."""
-        if not self.is_quad:
+        """Calculate pins per side for quad packages (thermal pad excluded)."""
+        if not _PACKAGE_FLAGS[self.package_type] & _QUAD:
             return None
-        # Subtract thermal pad if present
-        effective_pins = self.pin_count
-        if self.has_thermal_pad:
-            effective_pins -= 1
-        return effective_pins // 4
+        return (self.pin_count - (self.thermal_pad is not None)) // 4
 
     @property
     def pins_per_row(self) -> int | None:
-        """Calculate pins per row for dual packages."""
-        if not self.is_dual:
+        """Calculate pins per row for dual packages (thermal pad excluded)."""
+        if not _PACKAGE_FLAGS[self.package_type] & _DUAL:
             return None
-        # Subtract thermal pad if present
-        effective_pins = self.pin_count
-        if self.has_thermal_pad:
-            effective_pins -= 1
-        return effective_pins // 2
-
-    def generate_ipc_name(self) -> str:
-        """Generate IPC-7351B compliant footprint name."""
-        parts = [self.package_type.value]
-
-        # Pin count
-        pin_str = str(self.pin_count)
-        if self.has_thermal_pad:
-            pin_str += "-1EP"
-        parts.append(f"-{pin_str}")
+        return (self.pin_count - (self.thermal_pad is not None)) // 2
 
-        # Body size
-        parts.append(f"_{self.body_width}x{self.body_length}mm")
+    def cache_key(self) -> tuple:
+        """Hashable key covering every field, for memoizing on a package.
 
-        # Pitch
-        parts.append(f"_P{self.pitch}mm")
-
-        # Thermal pad size
-        if self.has_thermal_pad and self.thermal_pad:
-            parts.append(f"_EP{self.thermal_pad.width}x{self.thermal_pad.height}mm")
+        PackageInfo itself is unhashable (it is mutable and holds a list),
+        so callers can key ``lru_cache`` and dicts on this tuple instead.
+        The thermal pad contributes its field values and
+        depopulated_positions becomes a tuple.
+        """
+        key = []
+        for name in type(self).model_fields:
+            value = getattr(self, name)
+            if isinstance(value, ThermalPad):
+                value = tuple(value.__dict__.values())
+            elif isinstance(value, list):
+                value = tuple(value)
+            key.append(value)
+        return tuple(key)
 
-        return "".join(parts)
+    def generate_ipc_name(self) -> str:
+        """Generate IPC-7351B compliant footprint name."""
+        tp = self.thermal_pad
+        if tp is None:
+            return (
+                f"{self.package_type.value}-{self.pin_count}"
+                f"_{self.body_width}x{self.body_length}mm_P{self.pitch}mm"
+            )
+        return (
+            f"{self.package_type.value}-{self.pin_count}-1EP"
+            f"_{self.body_width}x{self.body_length}mm_P{self.pitch}mm"
+            f"_EP{tp.width}x{tp.height}mm"
+        )
 
 
 class QFPParams(BaseModel):
@@ -472,6 +479,37 @@ class BGAParams(BaseModel):
         """Actual ball count accounting for depopulation."""
         return self.max_balls - len(self.depopulated_balls)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping cached lookups when their source changes."""
+        super().__setattr__(name, value)
+        if name in ("skip_letters", "depopulated_balls"):
+            self._clear_caches()
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> "BGAParams":
+        """Copy the model; cached lookups are rebuilt for the copy on demand."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._clear_caches()
+        return copied
+
+    def _clear_caches(self) -> None:
+        for name in _BGA_CACHES:
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def _row_letters(self) -> tuple[str, ...]:
+        """Alphabet used for row naming, with skip_letters removed."""
+        skip = frozenset(self.skip_letters)
+        if skip == _DEFAULT_SKIP_LETTERS:
+            return _DEFAULT_ROW_LETTERS
+        return tuple(c for c in _ROW_ALPHABET if c not in skip)
+
+    @cached_property
+    def _depopulated_set(self) -> frozenset[str]:
+        """Depopulated positions for O(1) membership tests."""
+        return frozenset(self.depopulated_balls)
+
     def get_row_letter(self, row_index: int) -> str:
         """Convert row index to letter, skipping specified letters.
 
@@ -481,13 +519,13 @@ class BGAParams(BaseModel):
         Returns:
             Row letter (e.g., 'A', 'B', 'C', skipping 'I', 'O', etc.)
         """
-        letters = [c for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if c not in self.skip_letters]
-        if row_index < len(letters):
+        letters = self._row_letters
+        n = len(letters)
+        if row_index < n:
             return letters[row_index]
         # For >26 rows, use AA, AB, etc.
-        first = row_index // len(letters) - 1
-        second = row_index % len(letters)
-        return letters[first] + letters[second]
+        first, second = divmod(row_index, n)
+        return letters[first - 1] + letters[second]
 
     def is_ball_populated(self, row: str, column: int) -> bool:
         """Check if a ball position is populated.
@@ -500,4 +538,4 @@ class BGAParams(BaseModel):
             True if the position should have a ball
         """
         position = f"{row}{column}"
-        return position not in self.depopulated_balls
+        return position not in self._depopulated_set
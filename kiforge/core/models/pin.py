@@ -1,6 +1,11 @@
 """Pin and PinGroup data models."""
 
-from pydantic import BaseModel, Field, field_validator
+import re
+import sys
+from functools import cached_property, lru_cache
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, BaseModel, Field
 
 from kiforge.core.models.enums import (
     PinElectricalType,
@@ -9,6 +14,26 @@ from kiforge.core.models.enums import (
     PinOrientation,
 )
 
+_POWER_TYPES = frozenset({PinElectricalType.POWER_INPUT, PinElectricalType.POWER_OUTPUT})
+
+# Substring heuristics for power pin names: one scan classifies a name as
+# ground and/or supply. Tokens that contain a shorter one (agnd/dgnd,
+# avss/dvss, avdd/dvdd) are covered by it. No ground token can overlap a
+# supply token, so non-overlapping matching finds every class present.
+_NAME_CLASS_RE = re.compile(
+    r"(?P<ground>gnd|vss|ground)|(?P<supply>vcc|vdd|vbat|v\+|vin|vcore)", re.IGNORECASE
+)
+_NAME_GROUND = 1
+_NAME_SUPPLY = 2
+_NAME_BITS = {"ground": _NAME_GROUND, "supply": _NAME_SUPPLY}
+
+# Cached properties derived from the pin name
+_NAME_CACHES = ("_name_class", "upper_name")
+
+# Pin numbers and names such as "GND" repeat across pins and components;
+# interned strings compare by identity first.
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
 
 class Pin(BaseModel):
     """A single pin on a component.
@@ -17,15 +42,16 @@ class Pin(BaseModel):
     pins and footprint pads.
     """
 
-    model_config = {"frozen": True}  # Pins are immutable value objects
+    # Pins are immutable value objects; string fields are stripped natively
+    model_config = {"frozen": True, "str_strip_whitespace": True}
 
     # Identity
-    number: str = Field(
+    number: _InternedStr = Field(
         ...,
         min_length=1,
         description="Pin number/designator (e.g., '1', 'A1', 'EP')",
     )
-    name: str = Field(
+    name: _InternedStr = Field(
         ...,
         min_length=1,
         description="Pin name/function (e.g., 'VCC', 'GPIO0', 'MOSI')",
@@ -76,43 +102,75 @@ class Pin(BaseModel):
         description="Whether pin is hidden in symbol (e.g., stacked power pins)",
     )
 
-    @field_validator("number", "name", mode="before")
-    @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        """Strip leading/trailing whitespace from pin number and name."""
-        if isinstance(v, str):
-            return v.strip()
-        return v
-
     @property
     def is_power(self) -> bool:
         """Check if this is a power-related pin."""
-        return self.electrical_type in (
-            PinElectricalType.POWER_INPUT,
-            PinElectricalType.POWER_OUTPUT,
-        )
+        return self.electrical_type in _POWER_TYPES
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> "Pin":
+        """Copy the pin; name-derived caches are redone for the copy on demand."""
+        copied = super().model_copy(update=update, deep=deep)
+        for cache in _NAME_CACHES:
+            copied.__dict__.pop(cache, None)
+        return copied
+
+    @cached_property
+    def upper_name(self) -> str:
+        """Uppercased pin name, computed once per pin for name-based matching."""
+        return self.name.upper()
+
+    @cached_property
+    def _name_class(self) -> int:
+        """Ground/supply bitmask for the pin name, from a single regex scan."""
+        mask = 0
+        for m in _NAME_CLASS_RE.finditer(self.name):
+            mask |= _NAME_BITS[m.lastgroup]
+        return mask
 
     @property
     def is_ground(self) -> bool:
         """Heuristic check for ground pins based on name."""
-        name_lower = self.name.lower()
-        return any(
-            gnd in name_lower for gnd in ["gnd", "vss", "ground", "agnd", "dgnd", "avss", "dvss"]
-        )
+        return bool(self._name_class & _NAME_GROUND)
 
     @property
     def is_supply(self) -> bool:
         """Heuristic check for power supply pins based on name."""
-        name_lower = self.name.lower()
-        return any(
-            pwr in name_lower
-            for pwr in ["vcc", "vdd", "avdd", "dvdd", "vbat", "v+", "vin", "vcore"]
-        )
+        return bool(self._name_class & _NAME_SUPPLY)
 
     @property
     def is_nc(self) -> bool:
         """Check if this is a no-connect pin."""
-        return self.electrical_type == PinElectricalType.NOT_CONNECTED
+        return self.electrical_type is PinElectricalType.NOT_CONNECTED
+
+    @classmethod
+    def create(cls, number: str, name: str, **fields: Any) -> "Pin":
+        """Create a pin that shares its non-number fields with identical pins.
+
+        Large parts repeat pins such as VSS/VDD dozens of times with only the
+        number changing. The first call for a given name and field set builds
+        and validates a template pin; later calls copy it with the new number,
+        so field values (including the alternate_names list) are shared
+        between the pins. Pins are frozen, so sharing is safe as long as
+        callers do not mutate those lists in place.
+
+        Args:
+            number: Pin number/designator
+            name: Pin name
+            **fields: Any other Pin fields
+
+        Returns:
+            New Pin with the given number
+
+        Raises:
+            ValueError: If number is empty after stripping whitespace
+        """
+        number = number.strip()
+        if not number:
+            raise ValueError("Pin number must not be empty")
+        key = tuple(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(fields.items())
+        )
+        return _pin_template(name, key).model_copy(update={"number": sys.intern(number)})
 
 
 class PinGroup(BaseModel):
@@ -164,6 +222,40 @@ class PinGroup(BaseModel):
         """Filter pins by electrical type."""
         return [p for p in self.pins if p.electrical_type == electrical_type]
 
+    def filtered(self, **criteria: object) -> "PinGroup":
+        """Return a copy of this group keeping only pins matching all criteria.
+
+        Each keyword names a Pin attribute and the value it must equal, e.g.
+        ``group.filtered(electrical_type=PinElectricalType.INPUT, unit=2)``.
+
+        The copy is built with ``model_construct`` and skips validation. The
+        pins and group fields come from this already-validated group, so
+        only use it for reshaping validated models.
+
+        Args:
+            **criteria: Pin attribute names mapped to required values
+
+        Returns:
+            New PinGroup with the same metadata and the matching pins
+        """
+        pins = [
+            p for p in self.pins if all(getattr(p, k) == v for k, v in criteria.items())
+        ]
+        return PinGroup.model_construct(
+            name=self.name,
+            category=self.category,
+            pins=pins,
+            preferred_side=self.preferred_side,
+            unit=self.unit,
+            sort_order=self.sort_order,
+        )
+
     def get_pin_numbers(self) -> list[str]:
         """Get list of all pin numbers in this group."""
         return [p.number for p in self.pins]
+
+
+@lru_cache(maxsize=1024)
+def _pin_template(name: str, fields: tuple[tuple[str, Any], ...]) -> Pin:
+    """Validated template pin shared by Pin.create for one name and field set."""
+    return Pin(number="0", name=name, **dict(fields))
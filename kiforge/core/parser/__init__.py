@@ -1,7 +1,12 @@
 """Datasheet and pinout parsing."""
 
-from kiforge.core.parser.csv_parser import create_component_from_csv, parse_pinout_csv
+from kiforge.core.parser.csv_parser import (
+    create_component_from_csv,
+    parse_pinout_csv,
+    parse_pinout_csv_soa,
+)
 from kiforge.core.parser.inference import (
+    infer_many,
     infer_pin_electrical_type,
     infer_pin_graphic_style,
     infer_pin_group_category,
@@ -9,8 +14,10 @@ from kiforge.core.parser.inference import (
 
 __all__ = [
     "parse_pinout_csv",
+    "parse_pinout_csv_soa",
     "create_component_from_csv",
     "infer_pin_electrical_type",
     "infer_pin_graphic_style",
     "infer_pin_group_category",
+    "infer_many",
 ]
@@ -1,16 +1,32 @@
 """CSV pinout file parser."""
 
 import csv
+import sys
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
+from typing import TextIO
+
+import numpy as np
 
 from kiforge.core.models.component import ComponentInfo
 from kiforge.core.models.enums import PinElectricalType, PinGraphicStyle
 from kiforge.core.models.pin import Pin
-from kiforge.core.parser.inference import (
-    infer_pin_electrical_type,
-    infer_pin_graphic_style,
-)
+from kiforge.core.parser.inference import infer_many
+from kiforge.core.parser.utils import gc_paused
+
+
+# Enum <-> small-integer codes used by the structured-array loader
+ETYPES = tuple(PinElectricalType)
+ETYPE_CODES = {t: i for i, t in enumerate(ETYPES)}
+GRAPHIC_STYLES = tuple(PinGraphicStyle)
+STYLE_CODES = {s: i for i, s in enumerate(GRAPHIC_STYLES)}
 
+# Delimiters recognized when detecting the CSV dialect
+_DELIMITERS = ",;\t"
+
+# Alternate names may be separated by ";" as well as ","
+_SEMI_TO_COMMA = str.maketrans(";", ",")
 
 # Common column name variations
 PIN_NUMBER_COLUMNS = ["pin", "pin_number", "pin_num", "number", "num", "#", "pin#", "no", "no."]
@@ -66,62 +82,110 @@ TYPE_MAPPINGS = {
 }
 
 
+@lru_cache(maxsize=256)
 def _normalize_column_name(name: str) -> str:
     """Normalize a column name for matching."""
     return name.lower().strip().replace(" ", "_").replace("-", "_")
 
 
-def _find_column(headers: list[str], candidates: list[str]) -> int | None:
+# Candidate column names, normalized once at import
+_PIN_NUMBER_KEYS = tuple(_normalize_column_name(c) for c in PIN_NUMBER_COLUMNS)
+_PIN_NAME_KEYS = tuple(_normalize_column_name(c) for c in PIN_NAME_COLUMNS)
+_PIN_TYPE_KEYS = tuple(_normalize_column_name(c) for c in PIN_TYPE_COLUMNS)
+_PIN_DESC_KEYS = tuple(_normalize_column_name(c) for c in PIN_DESC_COLUMNS)
+_PIN_ALT_KEYS = tuple(_normalize_column_name(c) for c in PIN_ALT_COLUMNS)
+
+
+def _find_column(normalized_headers: list[str], candidates: tuple[str, ...]) -> int | None:
     """Find the index of a column matching any of the candidates.
 
+    A header matches a candidate when it equals or contains it; candidates
+    are tried in order and the first matching header wins.
+
     Args:
-        headers: List of header names
-        candidates: List of candidate column names to match
+        normalized_headers: Header names already passed through
+            _normalize_column_name, so a file's headers are normalized once
+            for all column lookups
+        candidates: Normalized candidate column names, in priority order
 
     Returns:
         Column index or None if not found
     """
-    normalized_headers = [_normalize_column_name(h) for h in headers]
-
     for candidate in candidates:
-        normalized_candidate = _normalize_column_name(candidate)
         for i, header in enumerate(normalized_headers):
-            if header == normalized_candidate or normalized_candidate in header:
+            if candidate in header:
                 return i
 
     return None
 
 
+@lru_cache(maxsize=256)
 def _parse_pin_type(type_str: str) -> PinElectricalType:
     """Parse a pin type string to PinElectricalType.
 
+    Type spellings repeat heavily across rows, so results are memoized.
+
     Args:
         type_str: Type string from CSV
 
     Returns:
         Corresponding PinElectricalType
     """
-    normalized = type_str.lower().strip()
-    return TYPE_MAPPINGS.get(normalized, PinElectricalType.UNSPECIFIED)
+    # Most files already use the lowercase spellings; try those as-is first
+    etype = TYPE_MAPPINGS.get(type_str)
+    if etype is None:
+        etype = TYPE_MAPPINGS.get(type_str.lower().strip(), PinElectricalType.UNSPECIFIED)
+    return etype
 
 
-def parse_pinout_csv(
-    csv_path: str | Path,
-    delimiter: str = ",",
-    encoding: str = "utf-8",
-) -> list[Pin]:
-    """Parse a CSV file containing pinout information.
+def _detect_delimiter(f: TextIO, default: str) -> str:
+    """Detect the delimiter of a pinout CSV and rewind the file.
 
-    Supports common CSV formats with flexible column naming.
-    At minimum, expects pin number and pin name columns.
+    A candidate delimiter is accepted when it occurs equally often in the
+    header and the first data row, and more often than any other such
+    candidate. Otherwise (delimiters inside header names, a single line, a
+    tie) csv.Sniffer decides from a sample of the file.
 
     Args:
-        csv_path: Path to CSV file
-        delimiter: CSV delimiter character
-        encoding: File encoding
+        f: CSV file opened in text mode, positioned at the start
+        default: Delimiter to use if detection fails
 
     Returns:
-        List of Pin objects
+        The detected delimiter, or default
+    """
+    header_line = f.readline()
+    first_row = f.readline()
+    f.seek(0)
+
+    counts = {}
+    for d in _DELIMITERS:
+        count = header_line.count(d)
+        if count and count == first_row.count(d):
+            counts[d] = count
+    if counts:
+        best = max(counts.values())
+        winners = [d for d, count in counts.items() if count == best]
+        if len(winners) == 1:
+            return winners[0]
+
+    sample = f.read(1024)
+    f.seek(0)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=_DELIMITERS).delimiter
+    except csv.Error:
+        return default
+
+
+def _iter_pin_rows(
+    csv_path: str | Path,
+    delimiter: str,
+    encoding: str,
+) -> Iterator[tuple[str, str, PinElectricalType, str | None, list[str]]]:
+    """Yield normalized pin fields for each usable row of a pinout CSV.
+
+    Each item is ``(number, name, electrical_type, description,
+    alternates)`` with number and name stripped and non-empty. The
+    electrical type is UNSPECIFIED when the file gives none.
 
     Raises:
         ValueError: If required columns are missing
@@ -131,25 +195,15 @@ def parse_pinout_csv(
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    pins = []
-
     with open(path, encoding=encoding, newline="") as f:
-        # Try to detect the dialect
-        sample = f.read(1024)
-        f.seek(0)
-
-        try:
-            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
-            reader = csv.reader(f, dialect)
-        except csv.Error:
-            reader = csv.reader(f, delimiter=delimiter)
+        reader = csv.reader(f, delimiter=_detect_delimiter(f, delimiter))
 
         # Read headers
-        headers = next(reader)
+        headers = [_normalize_column_name(h) for h in next(reader)]
 
         # Find required columns
-        num_col = _find_column(headers, PIN_NUMBER_COLUMNS)
-        name_col = _find_column(headers, PIN_NAME_COLUMNS)
+        num_col = _find_column(headers, _PIN_NUMBER_KEYS)
+        name_col = _find_column(headers, _PIN_NAME_KEYS)
 
         if num_col is None:
             raise ValueError(
@@ -161,14 +215,14 @@ def parse_pinout_csv(
             )
 
         # Find optional columns
-        type_col = _find_column(headers, PIN_TYPE_COLUMNS)
-        desc_col = _find_column(headers, PIN_DESC_COLUMNS)
-        alt_col = _find_column(headers, PIN_ALT_COLUMNS)
+        type_col = _find_column(headers, _PIN_TYPE_KEYS)
+        desc_col = _find_column(headers, _PIN_DESC_KEYS)
+        alt_col = _find_column(headers, _PIN_ALT_KEYS)
 
         # Parse rows
-        for row_num, row in enumerate(reader, start=2):
+        for row in reader:
             # Skip empty rows
-            if not row or all(cell.strip() == "" for cell in row):
+            if not "".join(row).strip():
                 continue
 
             # Get required fields
@@ -192,26 +246,88 @@ def parse_pinout_csv(
                 alt_str = row[alt_col].strip()
                 if alt_str:
                     # Split on common separators
-                    alternates = [a.strip() for a in alt_str.replace(";", ",").split(",") if a.strip()]
+                    alternates = [
+                        s for a in alt_str.translate(_SEMI_TO_COMMA).split(",") if (s := a.strip())
+                    ]
 
-            # Determine electrical type
+            # Electrical type given by the file, if any
+            electrical_type = PinElectricalType.UNSPECIFIED
             if type_col is not None and type_col < len(row):
-                type_str = row[type_col].strip()
-                electrical_type = _parse_pin_type(type_str)
-                if electrical_type == PinElectricalType.UNSPECIFIED:
-                    # Fall back to inference
-                    electrical_type = infer_pin_electrical_type(pin_name)
-            else:
-                electrical_type = infer_pin_electrical_type(pin_name)
-
-            # Infer graphic style
-            graphic_style = infer_pin_graphic_style(pin_name)
-
-            pin = Pin(
-                number=pin_number,
-                name=pin_name,
-                electrical_type=electrical_type,
-                graphic_style=graphic_style,
+                electrical_type = _parse_pin_type(row[type_col].strip())
+
+            yield pin_number, pin_name, electrical_type, description, alternates
+
+
+def _read_pin_rows(
+    csv_path: str | Path,
+    delimiter: str,
+    encoding: str,
+) -> list[tuple[str, str, PinElectricalType, PinGraphicStyle, str | None, list[str]]]:
+    """Read all usable rows of a pinout CSV and infer what the file leaves out.
+
+    Graphic styles, and electrical types the file does not give, are
+    inferred for all pin names in one infer_many() call.
+
+    Returns:
+        List of ``(number, name, electrical_type, graphic_style,
+        description, alternates)`` tuples
+
+    Raises:
+        ValueError: If required columns are missing
+        FileNotFoundError: If file doesn't exist
+    """
+    rows = list(_iter_pin_rows(csv_path, delimiter, encoding))
+    inferred_types, styles, _ = infer_many([row[1] for row in rows])
+    unspecified = PinElectricalType.UNSPECIFIED
+    return [
+        (
+            number,
+            name,
+            inferred if etype is unspecified else etype,
+            style,
+            description,
+            alternates,
+        )
+        for (number, name, etype, description, alternates), inferred, style in zip(
+            rows, inferred_types, styles
+        )
+    ]
+
+
+def parse_pinout_csv(
+    csv_path: str | Path,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+) -> list[Pin]:
+    """Parse a CSV file containing pinout information.
+
+    Supports common CSV formats with flexible column naming.
+    At minimum, expects pin number and pin name columns.
+
+    Args:
+        csv_path: Path to CSV file
+        delimiter: CSV delimiter character
+        encoding: File encoding
+
+    Returns:
+        List of Pin objects
+
+    Raises:
+        ValueError: If required columns are missing
+        FileNotFoundError: If file doesn't exist
+    """
+    # Every field is already stripped, non-empty and typed by the row reader,
+    # so skip per-row validation; intern like Pin's validator does.
+    pins = []
+    with gc_paused():
+        for number, name, etype, style, description, alternates in _read_pin_rows(
+            csv_path, delimiter, encoding
+        ):
+            pin = Pin.model_construct(
+                number=sys.intern(number),
+                name=sys.intern(name),
+                electrical_type=etype,
+                graphic_style=style,
                 description=description,
                 alternate_names=alternates,
             )
@@ -220,6 +336,44 @@ def parse_pinout_csv(
     return pins
 
 
+def parse_pinout_csv_soa(
+    csv_path: str | Path,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+) -> np.ndarray:
+    """Parse a pinout CSV into a NumPy structured array, one record per pin.
+
+    A column-oriented alternative to :func:`parse_pinout_csv` for very large
+    parts: no Pin objects are created, and filters such as
+    ``pins[pins["etype"] == ETYPE_CODES[PinElectricalType.INPUT]]`` run as
+    vectorized masks. Electrical type and graphic style are stored as
+    indexes into ``ETYPES`` and ``GRAPHIC_STYLES``. String fields are sized
+    to the longest value, so nothing is truncated.
+
+    Args:
+        csv_path: Path to CSV file
+        delimiter: CSV delimiter character
+        encoding: File encoding
+
+    Returns:
+        Structured array with fields number, name, etype and style
+
+    Raises:
+        ValueError: If required columns are missing
+        FileNotFoundError: If file doesn't exist
+    """
+    rows = [
+        (number, name, ETYPE_CODES[etype], STYLE_CODES[style])
+        for number, name, etype, style, _, _ in _read_pin_rows(csv_path, delimiter, encoding)
+    ]
+    num_len = max((len(r[0]) for r in rows), default=1)
+    name_len = max((len(r[1]) for r in rows), default=1)
+    dtype = np.dtype(
+        [("number", f"U{num_len}"), ("name", f"U{name_len}"), ("etype", "u1"), ("style", "u1")]
+    )
+    return np.array(rows, dtype=dtype)
+
+
 def create_component_from_csv(
     csv_path: str | Path,
     component_name: str,
@@ -6,15 +6,18 @@ units based on I/O bank, function, and other criteria.
 
 import csv
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 
 from kiforge.core.models.component import ComponentInfo
 from kiforge.core.models.enums import PinElectricalType, PinGraphicStyle, PinGroupCategory
 from kiforge.core.models.pin import Pin, PinGroup
+from kiforge.core.parser.utils import gc_paused
 
 
-@dataclass
+@dataclass(slots=True)
 class FPGAUnitConfig:
     """Configuration for an FPGA symbol unit."""
 
@@ -24,7 +27,7 @@ class FPGAUnitConfig:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FPGAPinInfo:
     """Extended pin information for FPGA pins."""
 
@@ -38,7 +41,40 @@ class FPGAPinInfo:
     dqs: str | None = None
     electrical_type: PinElectricalType = PinElectricalType.UNSPECIFIED
     unit: int = 1
+    # Uppercased name, computed once for the classification helpers
+    name_upper: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.name_upper = self.name.upper()
+
+
+# Name split into prefix, number and optional letter for natural sorting
+_PIN_SORT_RE = re.compile(r"([A-Z_]+)(\d+)([A-Z])?")
+
+# Electrical types of FPGA pins recognised by exact (uppercased) name
+_FPGA_EXACT_TYPES = {
+    # NC pins
+    "NC": PinElectricalType.NOT_CONNECTED,
+    "N/C": PinElectricalType.NOT_CONNECTED,
+    "-": PinElectricalType.NOT_CONNECTED,
+    # Configuration outputs
+    "DONE": PinElectricalType.OUTPUT,
+    # Configuration inputs
+    "PROGRAMN": PinElectricalType.INPUT,
+    "INITN": PinElectricalType.INPUT,
+    "JTAG_EN": PinElectricalType.INPUT,
+    # JTAG
+    "TCK": PinElectricalType.INPUT,
+    "TMS": PinElectricalType.INPUT,
+    "TDI": PinElectricalType.INPUT,
+    "TDO": PinElectricalType.OUTPUT,
+}
+
+# JTAG and configuration pins, by name or by a dual-function substring
+_JTAG_PINS = frozenset({"TCK", "TDI", "TDO", "TMS", "TRST", "JTAG_EN"})
+_JTAG_FUNC_RE = re.compile("TCK|TDI|TDO|TMS|TRST|SCLK|SSI|SSO|SCSN")
+_CONFIG_PINS = frozenset({"DONE", "PROGRAMN", "INITN", "CCLK", "CFG", "CRESETB"})
+_CONFIG_FUNC_RE = re.compile("DONE|PROGRAMN|INITN|MCLK|MISO|MOSI|MCSN|MSDO")
 
 # Standard FPGA unit assignments
 FPGA_UNIT_POWER = 1  # Power and ground (common)
@@ -46,6 +82,24 @@ FPGA_UNIT_CONFIG = 2  # Configuration pins
 FPGA_UNIT_JTAG = 3  # JTAG interface
 FPGA_UNIT_BANK_START = 4  # I/O banks start here
 
+# Bank identifier -> unit number
+_BANK_UNITS = {
+    # Standard I/O banks
+    "0": FPGA_UNIT_BANK_START + 0,
+    "1": FPGA_UNIT_BANK_START + 1,
+    "2": FPGA_UNIT_BANK_START + 2,
+    "3": FPGA_UNIT_BANK_START + 3,
+    "4": FPGA_UNIT_BANK_START + 4,
+    "5": FPGA_UNIT_BANK_START + 5,
+    "6": FPGA_UNIT_BANK_START + 6,
+    "7": FPGA_UNIT_BANK_START + 7,
+    # Special function banks
+    "60": FPGA_UNIT_BANK_START + 8,   # DPHY0
+    "61": FPGA_UNIT_BANK_START + 9,   # DPHY1
+    "70": FPGA_UNIT_BANK_START + 10,  # ADC
+    "80": FPGA_UNIT_BANK_START + 11,  # SerDes
+}
+
 
 def _parse_lvds_field(lvds_str: str) -> tuple[str | None, bool]:
     """Parse LVDS column to extract pair partner and polarity.
@@ -70,43 +124,30 @@ def _parse_lvds_field(lvds_str: str) -> tuple[str | None, bool]:
     return None, False
 
 
-def _infer_fpga_electrical_type(name: str, bank: str | None) -> PinElectricalType:
+def _infer_fpga_electrical_type(
+    name: str, bank: str | None, name_upper: str | None = None
+) -> PinElectricalType:
     """Infer electrical type for FPGA pins.
 
     Args:
         name: Pin name
         bank: Bank identifier
+        name_upper: Precomputed ``name.upper()``, if the caller has it
 
     Returns:
         Inferred electrical type
     """
-    name_upper = name.upper()
-
-    # Power pins
-    if name_upper.startswith(("VCC", "VBAT")):
-        return PinElectricalType.POWER_INPUT
+    if name_upper is None:
+        name_upper = name.upper()
 
-    # Ground pins
-    if name_upper.startswith(("VSS", "GND")):
+    # Power and ground pins
+    if name_upper.startswith(("VCC", "VBAT", "VSS", "GND")):
         return PinElectricalType.POWER_INPUT
 
-    # NC pins
-    if name_upper in ("NC", "N/C", "-"):
-        return PinElectricalType.NOT_CONNECTED
-
-    # Configuration outputs
-    if name_upper in ("DONE",):
-        return PinElectricalType.OUTPUT
-
-    # Configuration inputs
-    if name_upper in ("PROGRAMN", "INITN", "JTAG_EN"):
-        return PinElectricalType.INPUT
-
-    # JTAG
-    if name_upper in ("TCK", "TMS", "TDI"):
-        return PinElectricalType.INPUT
-    if name_upper in ("TDO",):
-        return PinElectricalType.OUTPUT
+    # NC, configuration and JTAG pins by exact name
+    etype = _FPGA_EXACT_TYPES.get(name_upper)
+    if etype is not None:
+        return etype
 
     # Clock pins
     if "CLK" in name_upper or "OSC" in name_upper:
@@ -120,10 +161,8 @@ def _infer_fpga_electrical_type(name: str, bank: str | None) -> PinElectricalTyp
     if name_upper.startswith("ADC_"):
         return PinElectricalType.INPUT
 
-    # General I/O pins (PL, PR, PT, PB prefixes for Lattice)
-    if re.match(r"^P[LRTB]\d+[AB]?$", name_upper):
-        return PinElectricalType.BIDIRECTIONAL
-
+    # General I/O pins (PL, PR, PT, PB prefixes for Lattice) and anything
+    # unrecognised are bidirectional; no pattern test is needed to decide that
     return PinElectricalType.BIDIRECTIONAL
 
 
@@ -136,7 +175,7 @@ def _classify_fpga_pin(pin_info: FPGAPinInfo) -> tuple[int, PinGroupCategory]:
     Returns:
         Tuple of (unit_number, category)
     """
-    name = pin_info.name.upper()
+    name = pin_info.name_upper
     bank = pin_info.bank
     dual_func = (pin_info.dual_function or "").upper()
 
@@ -155,15 +194,11 @@ def _classify_fpga_pin(pin_info: FPGAPinInfo) -> tuple[int, PinGroupCategory]:
         return FPGA_UNIT_POWER, PinGroupCategory.NC
 
     # JTAG pins - unit 3
-    jtag_pins = {"TCK", "TDI", "TDO", "TMS", "TRST", "JTAG_EN"}
-    jtag_funcs = {"TCK", "TDI", "TDO", "TMS", "TRST", "SCLK", "SSI", "SSO", "SCSN"}
-    if name in jtag_pins or any(f in dual_func for f in jtag_funcs):
+    if name in _JTAG_PINS or _JTAG_FUNC_RE.search(dual_func):
         return FPGA_UNIT_JTAG, PinGroupCategory.JTAG
 
     # Configuration pins - unit 2
-    config_pins = {"DONE", "PROGRAMN", "INITN", "CCLK", "CFG", "CRESETB"}
-    config_funcs = {"DONE", "PROGRAMN", "INITN", "MCLK", "MISO", "MOSI", "MCSN", "MSDO"}
-    if name in config_pins or any(f in dual_func for f in config_funcs):
+    if name in _CONFIG_PINS or _CONFIG_FUNC_RE.search(dual_func):
         return FPGA_UNIT_CONFIG, PinGroupCategory.CONFIG
 
     # SerDes pins - by bank
@@ -197,23 +232,7 @@ def _bank_to_unit(bank: str) -> int:
     Returns:
         Unit number
     """
-    bank_mapping = {
-        # Standard I/O banks
-        "0": FPGA_UNIT_BANK_START + 0,
-        "1": FPGA_UNIT_BANK_START + 1,
-        "2": FPGA_UNIT_BANK_START + 2,
-        "3": FPGA_UNIT_BANK_START + 3,
-        "4": FPGA_UNIT_BANK_START + 4,
-        "5": FPGA_UNIT_BANK_START + 5,
-        "6": FPGA_UNIT_BANK_START + 6,
-        "7": FPGA_UNIT_BANK_START + 7,
-        # Special function banks
-        "60": FPGA_UNIT_BANK_START + 8,   # DPHY0
-        "61": FPGA_UNIT_BANK_START + 9,   # DPHY1
-        "70": FPGA_UNIT_BANK_START + 10,  # ADC
-        "80": FPGA_UNIT_BANK_START + 11,  # SerDes
-    }
-    return bank_mapping.get(bank, FPGA_UNIT_POWER)
+    return _BANK_UNITS.get(bank, FPGA_UNIT_POWER)
 
 
 def get_fpga_unit_names() -> dict[int, str]:
@@ -241,6 +260,35 @@ def get_fpga_unit_names() -> dict[int, str]:
     }
 
 
+def _data_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the lines of a vendor CSV that are not comments or empty.
+
+    Lines are filtered lazily so the file is never held in memory as a list.
+    """
+    for line in lines:
+        stripped = line.strip()
+        # Skip comments, and lines with no cell content (padding rows of bare
+        # commas vary in width between vendors and devices)
+        if not stripped.strip(",") or stripped.startswith(("#", '"#')):
+            continue
+        yield line
+
+
+def _split_rows(lines: Iterable[str]) -> Iterator[list[str]]:
+    """Split vendor CSV lines into cells.
+
+    Vendor pinout files are machine-generated and data lines rarely contain
+    quotes, so unquoted lines are split directly on commas; lines with a
+    quote character go through csv.reader. Quoted fields spanning several
+    lines are not supported.
+    """
+    for line in lines:
+        if '"' in line:
+            yield from csv.reader((line,))
+        else:
+            yield line.rstrip("\r\n").split(",")
+
+
 def parse_lattice_fpga_csv(
     csv_path: str | Path,
     package_column: str | None = None,
@@ -261,33 +309,26 @@ def parse_lattice_fpga_csv(
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    fpga_pins: list[FPGAPinInfo] = []
     package_columns: list[str] = []
+    # Pins are classified and built row by row; per unit, (sort key, pin)
+    # pairs are kept so each unit is sorted once at the end
+    pins: list[Pin] = []
+    keyed_by_unit: dict[int, list[tuple[tuple, Pin]]] = {}
 
-    with open(path, encoding=encoding, newline="") as f:
-        # Skip comment lines and empty lines at the start
-        lines = []
-        for line in f:
-            stripped = line.strip()
-            # Skip lines that are comments or empty
-            if stripped.startswith("#") or stripped.startswith('"#') or not stripped or stripped == ",,,,,,,,,,,,,":
-                continue
-            lines.append(line)
-
-        if not lines:
+    with gc_paused(), open(path, encoding=encoding, newline="") as f:
+        # Parse as CSV, streaming lines past the comment/empty-line filter
+        reader = _split_rows(_data_lines(f))
+        headers = next(reader, None)
+        if headers is None:
             raise ValueError("No data rows found in CSV")
 
-        # Parse as CSV
-        reader = csv.reader(lines)
-        headers = next(reader)
-
         # Find column indices
         col_indices = {h.strip(): i for i, h in enumerate(headers)}
 
         # Identify package columns (columns after DQS that aren't empty)
-        dqs_idx = col_indices.get("DQS", len(headers))
+        last_info_idx = col_indices.get("DQS", len(headers))
         for i, h in enumerate(headers):
-            if i > dqs_idx and h.strip():
+            if i > last_info_idx and h.strip():
                 package_columns.append(h.strip())
 
         # Select package column for pin numbers
@@ -299,65 +340,60 @@ def parse_lattice_fpga_csv(
             # Use first package column
             pkg_col_idx = col_indices[package_columns[0]]
         else:
-            pkg_col_idx = None
+            pkg_col_idx = -1
+
+        # Resolve the remaining column indices once; -1 marks a missing column
+        func_idx = col_indices.get("Pin/Ball Funcion", col_indices.get("Pin/Ball Function", 1))
+        bank_idx = col_indices.get("BANK", -1)
+        dual_idx = col_indices.get("Dual Function", -1)
+        lvds_idx = col_indices.get("LVDS", -1)
+        hs_idx = col_indices.get("HIGHSPEED", -1)
+        dqs_idx = col_indices.get("DQS", -1)
 
         # Parse rows
         for row in reader:
-            if not row or len(row) < 2:
+            row_len = len(row)
+            if row_len < 2:
                 continue
 
             # Get basic fields
-            padn = row[col_indices.get("PADN", 0)].strip()
-            func = row[col_indices.get("Pin/Ball Funcion", col_indices.get("Pin/Ball Function", 1))].strip()
+            func = row[func_idx].strip()
 
             # Skip if no function
             if not func or func == "-":
                 continue
 
+            # Get pin number from package column
+            pin_number = row[pkg_col_idx].strip() if 0 <= pkg_col_idx < row_len else ""
+
+            # Skip pins not present in selected package
+            if not pin_number or pin_number == "-":
+                continue
+
             # Get bank
-            bank_idx = col_indices.get("BANK", None)
-            bank = row[bank_idx].strip() if bank_idx and bank_idx < len(row) else None
+            bank = row[bank_idx].strip() if 0 <= bank_idx < row_len else None
             if bank == "-":
                 bank = None
 
             # Get dual function
-            dual_idx = col_indices.get("Dual Function", None)
-            dual_func = row[dual_idx].strip() if dual_idx and dual_idx < len(row) else None
+            dual_func = row[dual_idx].strip() if 0 <= dual_idx < row_len else None
             if dual_func == "-":
                 dual_func = None
 
             # Get LVDS info
-            lvds_idx = col_indices.get("LVDS", None)
-            lvds_str = row[lvds_idx].strip() if lvds_idx and lvds_idx < len(row) else ""
+            lvds_str = row[lvds_idx].strip() if 0 <= lvds_idx < row_len else ""
             lvds_partner, is_true = _parse_lvds_field(lvds_str)
 
             # Get highspeed flag
-            hs_idx = col_indices.get("HIGHSPEED", None)
-            highspeed = False
-            if hs_idx and hs_idx < len(row):
-                hs_val = row[hs_idx].strip().upper()
-                highspeed = hs_val in ("TRUE", "YES", "1")
+            highspeed = (
+                0 <= hs_idx < row_len and row[hs_idx].strip().upper() in ("TRUE", "YES", "1")
+            )
 
             # Get DQS
-            dqs_idx_val = col_indices.get("DQS", None)
-            dqs = row[dqs_idx_val].strip() if dqs_idx_val and dqs_idx_val < len(row) else None
+            dqs = row[dqs_idx].strip() if 0 <= dqs_idx < row_len else None
             if dqs == "-" or dqs == "":
                 dqs = None
 
-            # Get pin number from package column
-            pin_number = None
-            if pkg_col_idx and pkg_col_idx < len(row):
-                pin_number = row[pkg_col_idx].strip()
-                if pin_number == "-" or not pin_number:
-                    pin_number = None
-
-            # Skip pins not present in selected package
-            if not pin_number:
-                continue
-
-            # Infer electrical type
-            elec_type = _infer_fpga_electrical_type(func, bank)
-
             fpga_pin = FPGAPinInfo(
                 number=pin_number,
                 name=func,
@@ -367,63 +403,63 @@ def parse_lattice_fpga_csv(
                 is_true_of=is_true,
                 highspeed=highspeed,
                 dqs=dqs,
-                electrical_type=elec_type,
             )
-            fpga_pins.append(fpga_pin)
 
-    # Classify pins into units
-    for fpga_pin in fpga_pins:
-        unit, category = _classify_fpga_pin(fpga_pin)
-        fpga_pin.unit = unit
+            # Infer electrical type
+            fpga_pin.electrical_type = _infer_fpga_electrical_type(
+                func, bank, fpga_pin.name_upper
+            )
 
-    # Convert to Pin objects and group by unit
-    pins: list[Pin] = []
-    pins_by_unit: dict[int, list[Pin]] = {}
+            # Classify into a unit
+            fpga_pin.unit, _ = _classify_fpga_pin(fpga_pin)
+
+            # Determine graphic style
+            graphic_style = PinGraphicStyle.LINE
+            if fpga_pin.name_upper.startswith(("CLK", "TCK")):
+                graphic_style = PinGraphicStyle.CLOCK
+            elif fpga_pin.name_upper.endswith("N") and fpga_pin.lvds_pair:
+                # Active low for negative differential
+                graphic_style = PinGraphicStyle.LINE  # Could use INVERTED if preferred
+
+            # Build alternate names from dual function
+            alternates = []
+            if fpga_pin.dual_function:
+                alternates = [fpga_pin.dual_function]
+
+            pin = Pin(
+                number=fpga_pin.number,
+                name=fpga_pin.name,
+                electrical_type=fpga_pin.electrical_type,
+                graphic_style=graphic_style,
+                alternate_names=alternates,
+                unit=fpga_pin.unit,
+            )
+            pins.append(pin)
 
-    for fpga_pin in fpga_pins:
-        # Determine graphic style
-        graphic_style = PinGraphicStyle.LINE
-        if fpga_pin.name.upper().startswith(("CLK", "TCK")):
-            graphic_style = PinGraphicStyle.CLOCK
-        elif fpga_pin.name.upper().endswith("N") and fpga_pin.lvds_pair:
-            # Active low for negative differential
-            graphic_style = PinGraphicStyle.LINE  # Could use INVERTED if preferred
-
-        # Build alternate names from dual function
-        alternates = []
-        if fpga_pin.dual_function:
-            alternates = [fpga_pin.dual_function]
-
-        pin = Pin(
-            number=fpga_pin.number,
-            name=fpga_pin.name,
-            electrical_type=fpga_pin.electrical_type,
-            graphic_style=graphic_style,
-            alternate_names=alternates,
-            unit=fpga_pin.unit,
-        )
-        pins.append(pin)
-
-        if fpga_pin.unit not in pins_by_unit:
-            pins_by_unit[fpga_pin.unit] = []
-        pins_by_unit[fpga_pin.unit].append(pin)
+            keyed_by_unit.setdefault(fpga_pin.unit, []).append(
+                (_pin_sort_key(fpga_pin.name_upper), pin)
+            )
 
     # Sort pins within each unit for consistent ordering
-    for unit_pins in pins_by_unit.values():
-        unit_pins.sort(key=lambda p: _pin_sort_key(p))
+    pins_by_unit: dict[int, list[Pin]] = {}
+    for unit, keyed in keyed_by_unit.items():
+        keyed.sort(key=itemgetter(0))
+        pins_by_unit[unit] = [pin for _, pin in keyed]
 
     return pins, pins_by_unit
 
 
-def _pin_sort_key(pin: Pin) -> tuple:
+def _pin_sort_key(name: str) -> tuple:
     """Generate a sort key for consistent pin ordering.
 
     Orders by:
     1. Power pins first
     2. Ground pins
     3. Then alphabetically by name
+
+    Args:
+        name: Uppercased pin name
     """
-    name = pin.name.upper()
 
     # Power first
     if name.startswith(("VCC", "VBAT")):
@@ -436,7 +472,7 @@ def _pin_sort_key(pin: Pin) -> tuple:
         return (9, name)
 
     # Extract numeric suffix for natural sorting
-    match = re.match(r"([A-Z_]+)(\d+)([A-Z])?", name)
+    match = _PIN_SORT_RE.match(name)
     if match:
         prefix, num, suffix = match.groups()
         return (2, prefix, int(num), suffix or "")
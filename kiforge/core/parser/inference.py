@@ -1,80 +1,182 @@
 """Pin type inference from names and context."""
 
+import re
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import TypeVar
+
 from kiforge.core.models.enums import PinElectricalType, PinGraphicStyle, PinGroupCategory
 
+_T = TypeVar("_T")
 
-def infer_pin_electrical_type(pin_name: str) -> PinElectricalType:
-    """Infer electrical type from pin name.
+# Signal names matched both as a prefix and as a "_"-separated suffix
+_OUTPUT_NAMES = ("OUT", "TXD", "TX", "MOSI", "SCK", "SCLK", "DO", "DOUT", "SDO", "TDO")
+_INPUT_NAMES = ("IN", "RXD", "RX", "MISO", "DI", "DIN", "SDI", "TDI", "TCK", "TMS")
 
-    Uses common naming conventions to guess the electrical type of a pin.
+# Analog prefixes shared by the type and category rules
+_ANALOG_PREFIXES = ("AIN", "AOUT", "ADC", "DAC", "VREF", "AN")
+
+# Name rules in priority order: (prefixes, "_"-separated suffixes, result).
+# The first rule with a matching prefix or suffix wins.
+_ELECTRICAL_TYPE_RULES: tuple[tuple[tuple[str, ...], tuple[str, ...], PinElectricalType], ...] = (
+    # Power supply pins
+    (
+        ("VCC", "VDD", "VBAT", "AVDD", "DVDD", "V+", "VIN", "VCORE", "VCCA", "VCCD"),
+        (),
+        PinElectricalType.POWER_INPUT,
+    ),
+    # Ground pins
+    (
+        ("GND", "VSS", "AVSS", "DVSS", "AGND", "DGND", "V-", "PGND", "GNDA", "GNDD"),
+        (),
+        PinElectricalType.POWER_INPUT,
+    ),
+    # NC pins (no connect)
+    (("NC", "N/C", "DNC", "N.C.", "RSVD", "RESERVED"), (), PinElectricalType.NOT_CONNECTED),
+    # Clock pins (typically input)
+    (("CLK", "CLOCK", "OSC", "XTAL", "EXTAL", "XI", "XO", "CLKIN"), (), PinElectricalType.INPUT),
+    # Reset pins (typically input, active low)
+    (("RST", "RESET", "NRST", "~RST", "RSTN", "MR", "MCLR"), (), PinElectricalType.INPUT),
+    # Output indicators
+    (_OUTPUT_NAMES, _OUTPUT_NAMES, PinElectricalType.OUTPUT),
+    # Input indicators
+    (_INPUT_NAMES, _INPUT_NAMES, PinElectricalType.INPUT),
+    # GPIO / Port pins (bidirectional)
+    (
+        ("GPIO", "PORT", "IO", "P0", "P1", "P2", "P3", "PA", "PB", "PC", "PD", "PE", "PF"),
+        (),
+        PinElectricalType.BIDIRECTIONAL,
+    ),
+    # SDA/SWD are bidirectional
+    (("SDA", "SWDIO", "D+", "D-", "DP", "DM", "USB"), (), PinElectricalType.BIDIRECTIONAL),
+    # Open drain outputs (interrupts often open-drain)
+    (("INT", "IRQ", "NMI", "ALERT", "BUSY"), (), PinElectricalType.OPEN_COLLECTOR),
+    # Analog pins
+    (_ANALOG_PREFIXES, (), PinElectricalType.PASSIVE),
+)
+
+_GROUP_CATEGORY_RULES: tuple[tuple[tuple[str, ...], tuple[str, ...], PinGroupCategory], ...] = (
+    # Power and ground
+    (("VCC", "VDD", "VBAT", "AVDD", "DVDD", "V+", "VIN", "VCORE"), (), PinGroupCategory.POWER),
+    (("GND", "VSS", "AVSS", "DVSS", "AGND", "DGND", "V-"), (), PinGroupCategory.GROUND),
+    # Communication interfaces
+    (
+        (
+            "SPI", "I2C", "UART", "USART", "CAN", "USB", "ETH",
+            "MOSI", "MISO", "SCL", "SDA", "TX", "RX",
+        ),
+        (),
+        PinGroupCategory.COMMUNICATION,
+    ),
+    # Debug interfaces
+    (
+        ("JTAG", "SWD", "TDI", "TDO", "TCK", "TMS", "TRST", "SWDIO", "SWCLK"),
+        (),
+        PinGroupCategory.DEBUG,
+    ),
+    # Clock
+    (("CLK", "CLOCK", "OSC", "XTAL"), (), PinGroupCategory.CLOCK),
+    # Control signals
+    (
+        ("EN", "ENABLE", "RST", "RESET", "CS", "CE", "WR", "RD", "OE", "WE"),
+        (),
+        PinGroupCategory.CONTROL,
+    ),
+    # Analog
+    (_ANALOG_PREFIXES, (), PinGroupCategory.ANALOG),
+    # GPIO (bidirectional)
+    (("GPIO", "PORT", "IO", "P0", "P1", "PA", "PB"), (), PinGroupCategory.BIDIRECTIONAL),
+)
+
+# Active-low names: ~RST, /CS, CS_N, OE_B, WR# (NRST-style names are
+# checked separately so any uppercase letter may follow the N)
+_INVERTED_RE = re.compile(r"[~/]|.*(?:_[NB]|#)\Z", re.DOTALL)
+
+# Clock names: CLK, or a clock token after the last underscore (SPI_SCK)
+_CLOCK_RE = re.compile(r"(?:.*_)?(?:CLK|CLOCK|SCK|SCLK|TCK)\Z", re.DOTALL)
+
+# Fallback categories when no name rule matches
+_ELECTRICAL_TYPE_CATEGORIES = {
+    PinElectricalType.INPUT: PinGroupCategory.INPUT,
+    PinElectricalType.OUTPUT: PinGroupCategory.OUTPUT,
+    PinElectricalType.BIDIRECTIONAL: PinGroupCategory.BIDIRECTIONAL,
+}
+
+
+def _compile_rules(
+    rules: Sequence[tuple[tuple[str, ...], tuple[str, ...], _T]],
+) -> tuple[re.Pattern[str], tuple[_T, ...]]:
+    """Compile name rules into one anchored regex and its results.
+
+    Rule i becomes capturing group i + 1, and alternation is tried left to
+    right, so ``match.lastindex`` identifies the first rule that matches.
 
     Args:
-        pin_name: Pin name string
+        rules: (prefixes, suffixes, result) tuples in priority order
 
     Returns:
-        Best-guess PinElectricalType
+        Tuple of (compiled pattern, results indexed by group number - 1)
     """
-    name = pin_name.upper().strip()
+    groups = []
+    for prefixes, suffixes, _ in rules:
+        group = "|".join(map(re.escape, prefixes))
+        if suffixes:
+            group += r"|.*_(?:" + "|".join(map(re.escape, suffixes)) + r")\Z"
+        groups.append(f"({group})")
+    return re.compile("|".join(groups), re.DOTALL), tuple(result for _, _, result in rules)
 
-    # Power supply pins
-    power_patterns = ["VCC", "VDD", "VBAT", "AVDD", "DVDD", "V+", "VIN", "VCORE", "VCCA", "VCCD"]
-    if any(name == pat or name.startswith(pat + "_") or name.startswith(pat) for pat in power_patterns):
-        return PinElectricalType.POWER_INPUT
 
-    # Ground pins
-    ground_patterns = ["GND", "VSS", "AVSS", "DVSS", "AGND", "DGND", "V-", "PGND", "GNDA", "GNDD"]
-    if any(name == pat or name.startswith(pat + "_") or name.startswith(pat) for pat in ground_patterns):
-        return PinElectricalType.POWER_INPUT
+_ELECTRICAL_TYPE_RE, _ELECTRICAL_TYPES = _compile_rules(_ELECTRICAL_TYPE_RULES)
+_GROUP_CATEGORY_RE, _GROUP_CATEGORIES = _compile_rules(_GROUP_CATEGORY_RULES)
 
-    # NC pins (no connect)
-    nc_patterns = ["NC", "N/C", "DNC", "N.C.", "RSVD", "RESERVED"]
-    if any(name == pat or name.startswith(pat) for pat in nc_patterns):
-        return PinElectricalType.NOT_CONNECTED
 
-    # Clock pins (typically input)
-    clock_patterns = ["CLK", "CLOCK", "OSC", "XTAL", "EXTAL", "XI", "XO", "CLKIN"]
-    if any(name == pat or name.startswith(pat + "_") or name.startswith(pat) for pat in clock_patterns):
-        return PinElectricalType.INPUT
+def _electrical_type(name: str) -> PinElectricalType:
+    """Electrical type for an uppercased, stripped pin name."""
+    match = _ELECTRICAL_TYPE_RE.match(name)
+    if match is None:
+        return PinElectricalType.UNSPECIFIED
+    return _ELECTRICAL_TYPES[match.lastindex - 1]
 
-    # Reset pins (typically input, active low)
-    reset_patterns = ["RST", "RESET", "NRST", "~RST", "RSTN", "MR", "MCLR"]
-    if any(name == pat or name.startswith(pat + "_") or name.startswith(pat) for pat in reset_patterns):
-        return PinElectricalType.INPUT
 
-    # Output indicators
-    output_patterns = ["OUT", "TXD", "TX", "MOSI", "SCK", "SCLK", "DO", "DOUT", "SDO", "TDO"]
-    if any(name == pat or name.endswith("_" + pat) or name.startswith(pat) for pat in output_patterns):
-        return PinElectricalType.OUTPUT
+def _graphic_style(name: str) -> PinGraphicStyle:
+    """Graphic style for an uppercased, stripped pin name."""
+    if _INVERTED_RE.match(name) or (name[:1] == "N" and name[1:2].isupper()):
+        return PinGraphicStyle.INVERTED
+    if _CLOCK_RE.match(name):
+        return PinGraphicStyle.CLOCK
+    return PinGraphicStyle.LINE
 
-    # Input indicators
-    input_patterns = ["IN", "RXD", "RX", "MISO", "DI", "DIN", "SDI", "TDI", "TCK", "TMS"]
-    if any(name == pat or name.endswith("_" + pat) or name.startswith(pat) for pat in input_patterns):
-        return PinElectricalType.INPUT
 
-    # GPIO / Port pins (bidirectional)
-    gpio_patterns = ["GPIO", "PORT", "IO", "P0", "P1", "P2", "P3", "PA", "PB", "PC", "PD", "PE", "PF"]
-    if any(name.startswith(pat) for pat in gpio_patterns):
-        return PinElectricalType.BIDIRECTIONAL
+def _group_category(name: str, electrical_type: PinElectricalType) -> PinGroupCategory:
+    """Group category for an uppercased, stripped pin name."""
+    # Check electrical type first
+    if electrical_type == PinElectricalType.NOT_CONNECTED:
+        return PinGroupCategory.NC
 
-    # SDA/SWD are bidirectional
-    bidir_patterns = ["SDA", "SWDIO", "D+", "D-", "DP", "DM", "USB"]
-    if any(name == pat or name.startswith(pat) for pat in bidir_patterns):
-        return PinElectricalType.BIDIRECTIONAL
+    match = _GROUP_CATEGORY_RE.match(name)
+    if match is not None:
+        return _GROUP_CATEGORIES[match.lastindex - 1]
 
-    # Open drain outputs (interrupts often open-drain)
-    od_patterns = ["INT", "IRQ", "NMI", "ALERT", "BUSY"]
-    if any(name.startswith(pat) for pat in od_patterns):
-        return PinElectricalType.OPEN_COLLECTOR
+    # By electrical type
+    return _ELECTRICAL_TYPE_CATEGORIES.get(electrical_type, PinGroupCategory.OTHER)
 
-    # Analog pins
-    analog_patterns = ["AIN", "AOUT", "ADC", "DAC", "VREF", "AN"]
-    if any(name.startswith(pat) for pat in analog_patterns):
-        return PinElectricalType.PASSIVE
 
-    # Default: unspecified
-    return PinElectricalType.UNSPECIFIED
+@lru_cache(maxsize=4096)
+def infer_pin_electrical_type(pin_name: str) -> PinElectricalType:
+    """Infer electrical type from pin name.
+
+    Uses common naming conventions to guess the electrical type of a pin.
 
+    Args:
+        pin_name: Pin name string
 
+    Returns:
+        Best-guess PinElectricalType
+    """
+    return _electrical_type(pin_name.upper().strip())
+
+
+@lru_cache(maxsize=4096)
 def infer_pin_graphic_style(pin_name: str) -> PinGraphicStyle:
     """Infer graphic style from pin name conventions.
 
@@ -84,25 +186,10 @@ def infer_pin_graphic_style(pin_name: str) -> PinGraphicStyle:
     Returns:
         Best-guess PinGraphicStyle
     """
-    name = pin_name.upper().strip()
-
-    # Active-low indicators
-    if name.startswith("~") or name.startswith("/"):
-        return PinGraphicStyle.INVERTED
-    if name.startswith("N") and len(name) > 1 and name[1].isupper():
-        # NRST, NCS, etc.
-        return PinGraphicStyle.INVERTED
-    if name.endswith("_N") or name.endswith("_B") or name.endswith("#"):
-        return PinGraphicStyle.INVERTED
-
-    # Clock pins
-    clock_patterns = ["CLK", "CLOCK", "SCK", "SCLK", "TCK"]
-    if any(name == pat or name.endswith("_" + pat) for pat in clock_patterns):
-        return PinGraphicStyle.CLOCK
-
-    return PinGraphicStyle.LINE
+    return _graphic_style(pin_name.upper().strip())
 
 
+@lru_cache(maxsize=4096)
 def infer_pin_group_category(pin_name: str, electrical_type: PinElectricalType) -> PinGroupCategory:
     """Infer pin group category from name and electrical type.
 
@@ -113,57 +200,35 @@ def infer_pin_group_category(pin_name: str, electrical_type: PinElectricalType)
     Returns:
         Best-guess PinGroupCategory
     """
-    name = pin_name.upper().strip()
-
-    # Check electrical type first
-    if electrical_type == PinElectricalType.NOT_CONNECTED:
-        return PinGroupCategory.NC
-
-    # Power and ground
-    power_patterns = ["VCC", "VDD", "VBAT", "AVDD", "DVDD", "V+", "VIN", "VCORE"]
-    if any(name.startswith(pat) for pat in power_patterns):
-        return PinGroupCategory.POWER
-
-    ground_patterns = ["GND", "VSS", "AVSS", "DVSS", "AGND", "DGND", "V-"]
-    if any(name.startswith(pat) for pat in ground_patterns):
-        return PinGroupCategory.GROUND
+    return _group_category(pin_name.upper().strip(), electrical_type)
 
-    # Communication interfaces
-    comm_patterns = ["SPI", "I2C", "UART", "USART", "CAN", "USB", "ETH", "MOSI", "MISO", "SCL", "SDA", "TX", "RX"]
-    if any(name.startswith(pat) for pat in comm_patterns):
-        return PinGroupCategory.COMMUNICATION
 
-    # Debug interfaces
-    debug_patterns = ["JTAG", "SWD", "TDI", "TDO", "TCK", "TMS", "TRST", "SWDIO", "SWCLK"]
-    if any(name.startswith(pat) for pat in debug_patterns):
-        return PinGroupCategory.DEBUG
+@lru_cache(maxsize=4096)
+def _infer_all(pin_name: str) -> tuple[PinElectricalType, PinGraphicStyle, PinGroupCategory]:
+    """All three inferences for one name, normalizing it once."""
+    name = pin_name.upper().strip()
+    etype = _electrical_type(name)
+    return etype, _graphic_style(name), _group_category(name, etype)
 
-    # Clock
-    clock_patterns = ["CLK", "CLOCK", "OSC", "XTAL"]
-    if any(name.startswith(pat) for pat in clock_patterns):
-        return PinGroupCategory.CLOCK
 
-    # Control signals
-    ctrl_patterns = ["EN", "ENABLE", "RST", "RESET", "CS", "CE", "WR", "RD", "OE", "WE"]
-    if any(name.startswith(pat) for pat in ctrl_patterns):
-        return PinGroupCategory.CONTROL
+def infer_many(
+    pin_names: Iterable[str],
+) -> tuple[list[PinElectricalType], list[PinGraphicStyle], list[PinGroupCategory]]:
+    """Infer electrical type, graphic style and group category for many pins.
 
-    # Analog
-    analog_patterns = ["AIN", "AOUT", "ADC", "DAC", "VREF", "AN"]
-    if any(name.startswith(pat) for pat in analog_patterns):
-        return PinGroupCategory.ANALOG
+    Each name is normalized once and classified by all three rule sets in a
+    single memoized call; the group category is inferred from the name and
+    the inferred electrical type, as infer_pin_group_category would be.
 
-    # GPIO (bidirectional)
-    gpio_patterns = ["GPIO", "PORT", "IO", "P0", "P1", "PA", "PB"]
-    if any(name.startswith(pat) for pat in gpio_patterns):
-        return PinGroupCategory.BIDIRECTIONAL
+    Args:
+        pin_names: Pin name strings
 
-    # By electrical type
-    if electrical_type == PinElectricalType.INPUT:
-        return PinGroupCategory.INPUT
-    if electrical_type == PinElectricalType.OUTPUT:
-        return PinGroupCategory.OUTPUT
-    if electrical_type == PinElectricalType.BIDIRECTIONAL:
-        return PinGroupCategory.BIDIRECTIONAL
-
-    return PinGroupCategory.OTHER
+    Returns:
+        Tuple of (electrical types, graphic styles, group categories), each
+        a list parallel to pin_names
+    """
+    results = [_infer_all(name) for name in pin_names]
+    if not results:
+        return [], [], []
+    etypes, styles, categories = map(list, zip(*results))
+    return etypes, styles, categories
@@ -0,0 +1,22 @@
+"""Helpers shared by the pinout parsers."""
+
+import gc
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Suspend cyclic garbage collection for a bulk allocation burst.
+
+    Parsers build thousands of acyclic objects in a tight loop, each of which
+    counts towards a generation-0 collection. Collection is re-enabled on
+    exit only if it was enabled on entry.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
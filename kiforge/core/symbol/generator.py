@@ -1,15 +1,19 @@
 """KiCad schematic symbol generator."""
 
-import uuid
+import re
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+
 from kiforge.core.models.component import ComponentInfo
-from kiforge.core.models.enums import PinElectricalType, PinGraphicStyle, PinOrientation
+from kiforge.core.models.enums import PinElectricalType, PinOrientation
 from kiforge.core.models.pin import Pin
 
 # KiCad 8 format version (YYYYMMDD)
 KICAD_VERSION = 20241229
+GENERATOR_VERSION = datetime.now().strftime("%Y%m%d")
 
 # Standard symbol dimensions
 PIN_LENGTH = 2.54  # 100 mils
@@ -17,6 +21,58 @@ PIN_SPACING = 2.54  # 100 mils (1 grid unit)
 FONT_SIZE = 1.27  # 50 mils
 LINE_WIDTH = 0.254  # 10 mils
 
+_FONT = f"(font (size {FONT_SIZE} {FONT_SIZE}))"
+
+# Pin text that is the same for every pin, formatted once
+_PIN_LENGTH_LINE = f"        (length {PIN_LENGTH})\n"
+_PIN_TEXT_EFFECTS = f"(effects {_FONT})"
+
+# Symbol properties with the font pre-baked; slots are reference prefix,
+# x, reference y, value, x, value y, footprint, datasheet, description.
+_PROPERTIES_TEMPLATE = (
+    '    (property "Reference" "%s"\n'
+    "      (at %.2f %.2f 0)\n"
+    f"      (effects {_FONT} (justify left))\n"
+    "    )\n"
+    '    (property "Value" "%s"\n'
+    "      (at %.2f %.2f 0)\n"
+    f"      (effects {_FONT} (justify left))\n"
+    "    )\n"
+    '    (property "Footprint" "%s"\n'
+    "      (at 0 0 0)\n"
+    f"      (effects {_FONT} hide)\n"
+    "    )\n"
+    '    (property "Datasheet" "%s"\n'
+    "      (at 0 0 0)\n"
+    f"      (effects {_FONT} hide)\n"
+    "    )\n"
+    '    (property "Description" "%s"\n'
+    "      (at 0 0 0)\n"
+    f"      (effects {_FONT} hide)\n"
+    "    )\n"
+)
+
+# Differential pair names: base name plus a P/N or A/B suffix
+_DIFF_PAIR_RE = re.compile(r"(.+?)([PN]|[AB])$")
+
+# Pin categories of the single-unit layout
+_BUCKET_COUNT = 7
+(
+    _POWER_BUCKET,
+    _GROUND_BUCKET,
+    _INPUT_BUCKET,
+    _OUTPUT_BUCKET,
+    _BIDIR_BUCKET,
+    _NC_BUCKET,
+    _OTHER_BUCKET,
+) = range(_BUCKET_COUNT)
+_TYPE_BUCKETS = {
+    PinElectricalType.INPUT: _INPUT_BUCKET,
+    PinElectricalType.OUTPUT: _OUTPUT_BUCKET,
+    PinElectricalType.BIDIRECTIONAL: _BIDIR_BUCKET,
+    PinElectricalType.NOT_CONNECTED: _NC_BUCKET,
+}
+
 
 @dataclass
 class SymbolPin:
@@ -28,6 +84,43 @@ class SymbolPin:
     orientation: PinOrientation = PinOrientation.RIGHT
 
 
+@dataclass(slots=True)
+class SidePins:
+    """Pins along one side of a symbol body, stored as coordinate arrays.
+
+    All pins on a side share one orientation and are spaced PIN_SPACING
+    apart, centered on the body, so coordinates are computed with a single
+    ``np.arange`` instead of one SymbolPin per pin. Iterating yields
+    SymbolPin views for callers that want per-pin objects.
+    """
+
+    orientation: PinOrientation = PinOrientation.RIGHT
+    pins: list[Pin] = field(default_factory=list)
+    xs: np.ndarray = field(default_factory=lambda: np.empty(0))
+    ys: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    @classmethod
+    def vertical(cls, pins: list[Pin], x: float, orientation: PinOrientation) -> "SidePins":
+        """Stack pins top to bottom at a fixed x (left and right sides)."""
+        n = len(pins)
+        ys = (n - 1) * PIN_SPACING / 2 - np.arange(n, dtype=np.float64) * PIN_SPACING
+        return cls(orientation, pins, np.full(n, x), ys)
+
+    @classmethod
+    def horizontal(cls, pins: list[Pin], y: float, orientation: PinOrientation) -> "SidePins":
+        """Line pins up left to right at a fixed y (top and bottom sides)."""
+        n = len(pins)
+        xs = -(n - 1) * PIN_SPACING / 2 + np.arange(n, dtype=np.float64) * PIN_SPACING
+        return cls(orientation, pins, xs, np.full(n, y))
+
+    def __len__(self) -> int:
+        return len(self.pins)
+
+    def __iter__(self) -> Iterator[SymbolPin]:
+        for pin, x, y in zip(self.pins, self.xs.tolist(), self.ys.tolist()):
+            yield SymbolPin(pin=pin, x=x, y=y, orientation=self.orientation)
+
+
 @dataclass
 class SymbolLayout:
     """Layout information for a symbol unit."""
@@ -36,10 +129,10 @@ class SymbolLayout:
     name: str = ""  # Unit name (e.g., "Bank 0", "JTAG")
     width: float = 10.16  # Default 400 mils
     height: float = 10.16
-    left_pins: list[SymbolPin] = field(default_factory=list)
-    right_pins: list[SymbolPin] = field(default_factory=list)
-    top_pins: list[SymbolPin] = field(default_factory=list)
-    bottom_pins: list[SymbolPin] = field(default_factory=list)
+    left_pins: SidePins = field(default_factory=lambda: SidePins(PinOrientation.RIGHT))
+    right_pins: SidePins = field(default_factory=lambda: SidePins(PinOrientation.LEFT))
+    top_pins: SidePins = field(default_factory=lambda: SidePins(PinOrientation.DOWN))
+    bottom_pins: SidePins = field(default_factory=lambda: SidePins(PinOrientation.UP))
     is_power_unit: bool = False  # If True, unit contains only power/ground pins
 
 
@@ -71,15 +164,17 @@ class SymbolGenerator:
 
         For multi-unit symbols, creates separate layouts per unit.
         """
-        # Check if this is a multi-unit symbol
-        units = set(pin.unit for pin in self.component.pins)
+        # Group pins by unit in one pass
+        pins_by_unit: dict[int, list[Pin]] = {}
+        for pin in self.component.pins:
+            pins_by_unit.setdefault(pin.unit, []).append(pin)
 
-        if len(units) <= 1:
+        if len(pins_by_unit) <= 1:
             # Single unit - use simple layout
             self._layout_single_unit(self.component.pins, unit=1)
         else:
             # Multi-unit - layout each unit separately
-            self._layout_multi_unit(units)
+            self._layout_multi_unit(pins_by_unit)
 
     def _layout_single_unit(self, pins: list[Pin], unit: int = 1, unit_name: str = "") -> None:
         """Layout pins for a single unit.
@@ -89,34 +184,21 @@ class SymbolGenerator:
             unit: Unit number
             unit_name: Optional unit name for labeling
         """
-        # Group pins by category
-        power_pins = []
-        ground_pins = []
-        input_pins = []
-        output_pins = []
-        bidir_pins = []
-        nc_pins = []
-        other_pins = []
-
+        # Group pins by category: ground/supply by name, the rest by type
+        buckets: list[list[Pin]] = [[] for _ in range(_BUCKET_COUNT)]
         for pin in pins:
             if pin.is_ground:
-                ground_pins.append(pin)
+                bucket = _GROUND_BUCKET
             elif pin.is_supply:
-                power_pins.append(pin)
-            elif pin.electrical_type == PinElectricalType.INPUT:
-                input_pins.append(pin)
-            elif pin.electrical_type == PinElectricalType.OUTPUT:
-                output_pins.append(pin)
-            elif pin.electrical_type == PinElectricalType.BIDIRECTIONAL:
-                bidir_pins.append(pin)
-            elif pin.electrical_type == PinElectricalType.NOT_CONNECTED:
-                nc_pins.append(pin)
+                bucket = _POWER_BUCKET
             else:
-                other_pins.append(pin)
+                bucket = _TYPE_BUCKETS.get(pin.electrical_type, _OTHER_BUCKET)
+            buckets[bucket].append(pin)
 
         # Sort pins within each category by name for consistent ordering
-        for pin_list in [power_pins, ground_pins, input_pins, output_pins, bidir_pins, nc_pins, other_pins]:
+        for pin_list in buckets:
             pin_list.sort(key=lambda p: (p.name, p.number))
+        power_pins, ground_pins, input_pins, output_pins, bidir_pins, nc_pins, other_pins = buckets
 
         # Distribute bidirectional pins between left and right
         left_bidir = bidir_pins[: len(bidir_pins) // 2]
@@ -148,48 +230,26 @@ class SymbolGenerator:
             name=unit_name,
             width=width,
             height=height,
+            # Left pins: connection on left, pointing into symbol from left
+            left_pins=SidePins.vertical(left_side, -width / 2 - PIN_LENGTH, PinOrientation.RIGHT),
+            # Right pins: connection on right, pointing into symbol from right
+            right_pins=SidePins.vertical(right_side, width / 2 + PIN_LENGTH, PinOrientation.LEFT),
+            # Top pins: connection on top, pointing down into symbol
+            top_pins=SidePins.horizontal(top_side, height / 2 + PIN_LENGTH, PinOrientation.DOWN),
+            # Bottom pins: connection on bottom, pointing up into symbol
+            bottom_pins=SidePins.horizontal(
+                bottom_side, -height / 2 - PIN_LENGTH, PinOrientation.UP
+            ),
             is_power_unit=is_power,
         )
 
-        # Position left pins (connection on left, pointing into symbol from left)
-        y_start = (len(left_side) - 1) * PIN_SPACING / 2
-        for i, pin in enumerate(left_side):
-            y = y_start - i * PIN_SPACING
-            layout.left_pins.append(
-                SymbolPin(pin=pin, x=-width / 2 - PIN_LENGTH, y=y, orientation=PinOrientation.RIGHT)
-            )
-
-        # Position right pins (connection on right, pointing into symbol from right)
-        y_start = (len(right_side) - 1) * PIN_SPACING / 2
-        for i, pin in enumerate(right_side):
-            y = y_start - i * PIN_SPACING
-            layout.right_pins.append(
-                SymbolPin(pin=pin, x=width / 2 + PIN_LENGTH, y=y, orientation=PinOrientation.LEFT)
-            )
-
-        # Position top pins (connection on top, pointing down into symbol)
-        x_start = -(len(top_side) - 1) * PIN_SPACING / 2
-        for i, pin in enumerate(top_side):
-            x = x_start + i * PIN_SPACING
-            layout.top_pins.append(
-                SymbolPin(pin=pin, x=x, y=height / 2 + PIN_LENGTH, orientation=PinOrientation.DOWN)
-            )
-
-        # Position bottom pins (connection on bottom, pointing up into symbol)
-        x_start = -(len(bottom_side) - 1) * PIN_SPACING / 2
-        for i, pin in enumerate(bottom_side):
-            x = x_start + i * PIN_SPACING
-            layout.bottom_pins.append(
-                SymbolPin(pin=pin, x=x, y=-height / 2 - PIN_LENGTH, orientation=PinOrientation.UP)
-            )
-
         self.layouts.append(layout)
 
-    def _layout_multi_unit(self, units: set[int]) -> None:
+    def _layout_multi_unit(self, pins_by_unit: dict[int, list[Pin]]) -> None:
         """Layout pins for a multi-unit symbol.
 
         Args:
-            units: Set of unit numbers present in the component
+            pins_by_unit: Component pins grouped by unit number
         """
         # Try to import unit names from FPGA parser if available
         try:
@@ -198,17 +258,10 @@ class SymbolGenerator:
         except ImportError:
             unit_names = {}
 
-        # Sort units for consistent ordering
-        sorted_units = sorted(units)
-
-        # Layout each unit
-        for unit_num in sorted_units:
-            unit_pins = [p for p in self.component.pins if p.unit == unit_num]
-            if not unit_pins:
-                continue
-
+        # Layout each unit, sorted for consistent ordering
+        for unit_num in sorted(pins_by_unit):
             unit_name = unit_names.get(unit_num, f"Unit {unit_num}")
-            self._layout_unit_pins(unit_pins, unit_num, unit_name)
+            self._layout_unit_pins(pins_by_unit[unit_num], unit_num, unit_name)
 
     def _layout_unit_pins(self, pins: list[Pin], unit: int, unit_name: str = "") -> None:
         """Layout pins for a specific unit with FPGA-aware organization.
@@ -240,12 +293,12 @@ class SymbolGenerator:
         right_signals = []
 
         for pin in signal_pins:
-            name = pin.name.upper()
+            name = pin.upper_name
             # Positive differential or input-like
-            if name.endswith("P") or name.endswith("A") or pin.electrical_type == PinElectricalType.INPUT:
+            if name.endswith(("P", "A")) or pin.electrical_type == PinElectricalType.INPUT:
                 left_signals.append(pin)
             # Negative differential or output-like
-            elif name.endswith("N") or name.endswith("B") or pin.electrical_type == PinElectricalType.OUTPUT:
+            elif name.endswith(("N", "B")) or pin.electrical_type == PinElectricalType.OUTPUT:
                 right_signals.append(pin)
             else:
                 # Distribute evenly
@@ -273,43 +326,21 @@ class SymbolGenerator:
             name=unit_name,
             width=width,
             height=height,
+            left_pins=SidePins.vertical(
+                left_signals, -width / 2 - PIN_LENGTH, PinOrientation.RIGHT
+            ),
+            right_pins=SidePins.vertical(
+                right_signals, width / 2 + PIN_LENGTH, PinOrientation.LEFT
+            ),
+            # Top (power)
+            top_pins=SidePins.horizontal(power_pins, height / 2 + PIN_LENGTH, PinOrientation.DOWN),
+            # Bottom (ground + NC)
+            bottom_pins=SidePins.horizontal(
+                ground_pins + nc_pins, -height / 2 - PIN_LENGTH, PinOrientation.UP
+            ),
             is_power_unit=is_power,
         )
 
-        # Position pins
-        # Left side
-        y_start = (len(left_signals) - 1) * PIN_SPACING / 2
-        for i, pin in enumerate(left_signals):
-            y = y_start - i * PIN_SPACING
-            layout.left_pins.append(
-                SymbolPin(pin=pin, x=-width / 2 - PIN_LENGTH, y=y, orientation=PinOrientation.RIGHT)
-            )
-
-        # Right side
-        y_start = (len(right_signals) - 1) * PIN_SPACING / 2
-        for i, pin in enumerate(right_signals):
-            y = y_start - i * PIN_SPACING
-            layout.right_pins.append(
-                SymbolPin(pin=pin, x=width / 2 + PIN_LENGTH, y=y, orientation=PinOrientation.LEFT)
-            )
-
-        # Top (power)
-        x_start = -(len(power_pins) - 1) * PIN_SPACING / 2
-        for i, pin in enumerate(power_pins):
-            x = x_start + i * PIN_SPACING
-            layout.top_pins.append(
-                SymbolPin(pin=pin, x=x, y=height / 2 + PIN_LENGTH, orientation=PinOrientation.DOWN)
-            )
-
-        # Bottom (ground + NC)
-        bottom_pins = ground_pins + nc_pins
-        x_start = -(len(bottom_pins) - 1) * PIN_SPACING / 2
-        for i, pin in enumerate(bottom_pins):
-            x = x_start + i * PIN_SPACING
-            layout.bottom_pins.append(
-                SymbolPin(pin=pin, x=x, y=-height / 2 - PIN_LENGTH, orientation=PinOrientation.UP)
-            )
-
         self.layouts.append(layout)
 
     def _sort_with_diff_pairs(self, pins: list[Pin]) -> list[Pin]:
@@ -323,30 +354,24 @@ class SymbolGenerator:
         Returns:
             Sorted list with pairs adjacent
         """
-        import re
-
         # Build a map of base names to pins
         pairs: dict[str, list[Pin]] = {}
         singles: list[Pin] = []
 
         for pin in pins:
-            name = pin.name.upper()
             # Check for differential pair naming
-            match = re.match(r"(.+?)([PN]|[AB])$", name)
+            match = _DIFF_PAIR_RE.match(pin.upper_name)
             if match:
-                base = match.group(1)
-                if base not in pairs:
-                    pairs[base] = []
-                pairs[base].append(pin)
+                pairs.setdefault(match.group(1), []).append(pin)
             else:
                 singles.append(pin)
 
         # Build sorted output: pairs first (P before N), then singles
         result = []
-        for base in sorted(pairs.keys()):
+        for base in sorted(pairs):
             pair_pins = pairs[base]
             # Sort so P/A comes before N/B
-            pair_pins.sort(key=lambda p: (0 if p.name.upper().endswith(("P", "A")) else 1, p.name))
+            pair_pins.sort(key=lambda p: (not p.upper_name.endswith(("P", "A")), p.name))
             result.extend(pair_pins)
 
         # Add singles, sorted by name
@@ -358,127 +383,98 @@ class SymbolGenerator:
     def generate(self) -> str:
         """Generate the complete symbol library file.
 
+        All writers append to a single shared buffer which is joined once
+        at the end, avoiding per-section intermediate strings.
+
         Returns:
             KiCad symbol library file content
         """
         # Calculate layout
         self.layout_pins()
 
-        # Build output
-        lines = []
+        out: list[str] = []
+        self._write_library(out.append)
+        return "".join(out)
 
+    def _write_library(self, write: Callable[[str], object]) -> None:
+        """Emit the symbol library piece by piece through write()."""
         # Library header
-        lines.append("(kicad_symbol_lib")
-        lines.append(f"  (version {KICAD_VERSION})")
-        lines.append('  (generator "kiforge")')
-        lines.append(f'  (generator_version "{datetime.now().strftime("%Y%m%d")}")')
-        lines.append("")
+        write("(kicad_symbol_lib\n")
+        write(f"  (version {KICAD_VERSION})\n")
+        write('  (generator "kiforge")\n')
+        write(f'  (generator_version "{GENERATOR_VERSION}")\n')
+        write("\n")
 
         # Symbol definition
-        lines.append(self._generate_symbol())
-
-        lines.append(")")
-
-        return "\n".join(lines)
+        self._write_symbol(write)
 
-    def _generate_symbol(self) -> str:
-        """Generate the symbol definition."""
-        lines = []
-        name = self.component.name
+        write(")")
 
-        lines.append(f'  (symbol "{name}"')
+    def _write_symbol(self, write: Callable[[str], object]) -> None:
+        """Write the symbol definition."""
+        write(f'  (symbol "{self.component.name}"\n')
 
         # Multi-unit symbols need special flags
         if len(self.layouts) > 1:
-            lines.append("    (pin_numbers hide)")
-            lines.append("    (pin_names (offset 1.016))")
+            write("    (pin_numbers hide)\n")
+            write("    (pin_names (offset 1.016))\n")
 
-        lines.append("    (exclude_from_sim no)")
-        lines.append("    (in_bom yes)")
-        lines.append("    (on_board yes)")
+        write("    (exclude_from_sim no)\n")
+        write("    (in_bom yes)\n")
+        write("    (on_board yes)\n")
 
         # Properties
-        lines.append(self._generate_properties())
+        self._write_properties(write)
 
         # For multi-unit, each unit has its own body
         if len(self.layouts) > 1:
-            # Generate per-unit graphics and pins
+            # Write per-unit graphics and pins
             for layout in self.layouts:
-                lines.append(self._generate_unit_body(layout))
-                lines.append(self._generate_unit_pins(layout))
+                self._write_unit_body(layout, write)
+                self._write_unit_pins(layout, write)
         else:
             # Single unit - shared graphics
-            lines.append(self._generate_body_graphics())
+            self._write_body_graphics(write)
             for layout in self.layouts:
-                lines.append(self._generate_unit_pins(layout))
+                self._write_unit_pins(layout, write)
 
-        lines.append("  )")
+        write("  )\n")
 
-        return "\n".join(lines)
-
-    def _generate_properties(self) -> str:
-        """Generate symbol properties."""
-        lines = []
+    def _write_properties(self, write: Callable[[str], object]) -> None:
+        """Write symbol properties."""
         comp = self.component
         layout = self.layouts[0] if self.layouts else SymbolLayout()
 
-        # Reference - top left of symbol
+        # Reference at the top left of the symbol, value just below it
         ref_x = -layout.width / 2
         ref_y = layout.height / 2 + 1.27
-        lines.append(
-            f'    (property "Reference" "{comp.reference_prefix}"'
-            f"\n      (at {ref_x:.2f} {ref_y:.2f} 0)"
-            f"\n      (effects (font (size {FONT_SIZE} {FONT_SIZE})) (justify left))"
-            f"\n    )"
-        )
-
-        # Value - below reference
         val_y = ref_y - 2.54
-        lines.append(
-            f'    (property "Value" "{comp.name}"'
-            f"\n      (at {ref_x:.2f} {val_y:.2f} 0)"
-            f"\n      (effects (font (size {FONT_SIZE} {FONT_SIZE})) (justify left))"
-            f"\n    )"
-        )
 
-        # Footprint
         footprint = ""
         if comp.primary_package:
             footprint = f"KiForge:{comp.primary_package.generate_ipc_name()}"
-        lines.append(
-            f'    (property "Footprint" "{footprint}"'
-            f"\n      (at 0 0 0)"
-            f"\n      (effects (font (size {FONT_SIZE} {FONT_SIZE})) hide)"
-            f"\n    )"
-        )
-
-        # Datasheet
-        datasheet = comp.datasheet_url or ""
-        lines.append(
-            f'    (property "Datasheet" "{datasheet}"'
-            f"\n      (at 0 0 0)"
-            f"\n      (effects (font (size {FONT_SIZE} {FONT_SIZE})) hide)"
-            f"\n    )"
-        )
 
-        # Description
-        lines.append(
-            f'    (property "Description" "{comp.description}"'
-            f"\n      (at 0 0 0)"
-            f"\n      (effects (font (size {FONT_SIZE} {FONT_SIZE})) hide)"
-            f"\n    )"
+        write(
+            _PROPERTIES_TEMPLATE
+            % (
+                comp.reference_prefix,
+                ref_x,
+                ref_y,
+                comp.name,
+                ref_x,
+                val_y,
+                footprint,
+                comp.datasheet_url or "",
+                comp.description,
+            )
         )
 
-        return "\n".join(lines)
-
-    def _generate_body_graphics(self) -> str:
-        """Generate the symbol body rectangle (shared across units)."""
-        lines = []
+    def _write_body_graphics(self, write: Callable[[str], object]) -> None:
+        """Write the symbol body rectangle (shared across units)."""
         layout = self.layouts[0] if self.layouts else SymbolLayout()
-        name = self.component.name
 
         # Unit 0 = shared graphics, Style 1 = normal
-        lines.append(f'    (symbol "{name}_0_1"')
+        write(f'    (symbol "{self.component.name}_0_1"\n')
 
         # Body rectangle
         x1 = -layout.width / 2
@@ -486,24 +482,19 @@ class SymbolGenerator:
         x2 = layout.width / 2
         y2 = -layout.height / 2
 
-        lines.append(
+        write(
             f"      (rectangle (start {x1:.2f} {y1:.2f}) (end {x2:.2f} {y2:.2f})"
             f"\n        (stroke (width {LINE_WIDTH}) (type default))"
             f"\n        (fill (type background))"
-            f"\n      )"
+            f"\n      )\n"
         )
 
-        lines.append("    )")
-
-        return "\n".join(lines)
-
-    def _generate_unit_body(self, layout: SymbolLayout) -> str:
-        """Generate body graphics for a specific unit (multi-unit symbols)."""
-        lines = []
-        name = self.component.name
+        write("    )\n")
 
+    def _write_unit_body(self, layout: SymbolLayout, write: Callable[[str], object]) -> None:
+        """Write body graphics for a specific unit (multi-unit symbols)."""
         # Unit N, Style 0 = unit-specific graphics
-        lines.append(f'    (symbol "{name}_{layout.unit}_0"')
+        write(f'    (symbol "{self.component.name}_{layout.unit}_0"\n')
 
         # Body rectangle
         x1 = -layout.width / 2
@@ -511,67 +502,61 @@ class SymbolGenerator:
         x2 = layout.width / 2
         y2 = -layout.height / 2
 
-        lines.append(
+        write(
             f"      (rectangle (start {x1:.2f} {y1:.2f}) (end {x2:.2f} {y2:.2f})"
             f"\n        (stroke (width {LINE_WIDTH}) (type default))"
             f"\n        (fill (type background))"
-            f"\n      )"
+            f"\n      )\n"
         )
 
         # Add unit name label inside the rectangle
         if layout.name:
             label_y = y1 - 1.27  # Just below top edge
-            lines.append(
+            write(
                 f'      (text "{layout.name}"'
                 f"\n        (at 0 {label_y:.2f} 0)"
                 f"\n        (effects (font (size {FONT_SIZE} {FONT_SIZE})))"
-                f"\n      )"
+                f"\n      )\n"
             )
 
-        lines.append("    )")
-
-        return "\n".join(lines)
-
-    def _generate_unit_pins(self, layout: SymbolLayout) -> str:
-        """Generate pins for a symbol unit."""
-        lines = []
-        name = self.component.name
+        write("    )\n")
 
+    def _write_unit_pins(self, layout: SymbolLayout, write: Callable[[str], object]) -> None:
+        """Write pins for a symbol unit."""
         # Unit N, Style 1
-        lines.append(f'    (symbol "{name}_{layout.unit}_1"')
+        write(f'    (symbol "{self.component.name}_{layout.unit}_1"\n')
 
         # All pins from all sides
-        all_pins = layout.left_pins + layout.right_pins + layout.top_pins + layout.bottom_pins
-
-        for sym_pin in all_pins:
-            lines.append(self._generate_pin(sym_pin))
+        for side in (layout.left_pins, layout.right_pins, layout.top_pins, layout.bottom_pins):
+            angle = side.orientation.value
+            for pin, x, y in zip(side.pins, side.xs.tolist(), side.ys.tolist()):
+                self._write_pin(pin, x, y, angle, write)
 
-        lines.append("    )")
+        write("    )\n")
 
-        return "\n".join(lines)
-
-    def _generate_pin(self, sym_pin: SymbolPin) -> str:
-        """Generate a single pin definition."""
-        pin = sym_pin.pin
-        etype = pin.electrical_type.value
-        gstyle = pin.graphic_style.value
-
-        # Pin angle based on orientation
-        angle = sym_pin.orientation.value
+    def _write_pin(
+        self, pin: Pin, x: float, y: float, angle: str, write: Callable[[str], object]
+    ) -> None:
+        """Write a single pin definition.
 
+        Args:
+            pin: Pin to emit
+            x: Connection point x coordinate
+            y: Connection point y coordinate
+            angle: Pin angle in degrees, from the side's PinOrientation
+            write: Output sink
+        """
         # Escape special characters in pin name
         pin_name = pin.name.replace('"', '\\"')
 
-        lines = [
-            f"      (pin {etype} {gstyle}",
-            f"        (at {sym_pin.x:.2f} {sym_pin.y:.2f} {angle})",
-            f"        (length {PIN_LENGTH})",
-            f'        (name "{pin_name}" (effects (font (size {FONT_SIZE} {FONT_SIZE}))))',
-            f'        (number "{pin.number}" (effects (font (size {FONT_SIZE} {FONT_SIZE}))))',
-            "      )",
-        ]
-
-        return "\n".join(lines)
+        write(
+            f"      (pin {pin.electrical_type.value} {pin.graphic_style.value}\n"
+            f"        (at {x:.2f} {y:.2f} {angle})\n"
+            f"{_PIN_LENGTH_LINE}"
+            f'        (name "{pin_name}" {_PIN_TEXT_EFFECTS})\n'
+            f'        (number "{pin.number}" {_PIN_TEXT_EFFECTS})\n'
+            "      )\n"
+        )
 
 
 def create_symbol(component: ComponentInfo) -> str:
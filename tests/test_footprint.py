@@ -1,10 +1,36 @@
 """Tests for footprint generator."""
 
+import re
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
 
-from kiforge.core.footprint.qfp import QFPFootprintGenerator, create_qfp_footprint
-from kiforge.core.footprint.qfn import QFNFootprintGenerator, create_qfn_footprint
-from kiforge.core.footprint.generator import FootprintGenerator, Pad, Line
+from kiforge.core.footprint.qfp import (
+    QFPFootprintGenerator,
+    _build_qfp_structure,
+    build_qfp_footprint,
+    create_qfp_footprint,
+)
+from kiforge.core.footprint.qfn import (
+    QFNFootprintGenerator,
+    _build_qfn_structure,
+    build_qfn_footprint,
+    create_qfn_footprint,
+)
+from kiforge.core.footprint.generator import (
+    Arc,
+    Circle,
+    FootprintGenerator,
+    Line,
+    Pad,
+    Text,
+    _fmt,
+    _gen_uuids,
+    _quad_coords,
+)
 from kiforge.core.models.enums import PackageType, PadShape, PadType
 from kiforge.core.models.package import PackageInfo, ThermalPad
 from kiforge.core.models.footprint import FootprintParams, PadDimensions
@@ -101,6 +127,36 @@ class TestQFPFootprintGenerator:
             dy = left_pads[i + 1].y - left_pads[i].y
             assert abs(dy - 0.5) < 0.001, f"Pitch between pads {i+1} and {i+2} should be 0.5mm"
 
+    def test_qfp_reversed_sides_mirror_forward_sides(self):
+        params = self.create_lqfp48_params()
+        generator = QFPFootprintGenerator(params)
+        generator.calculate_pads()
+
+        pads = generator.pads
+        assert [p.y for p in pads[24:36]] == [p.y for p in pads[0:12]][::-1]
+        assert [p.x for p in pads[36:48]] == [p.x for p in pads[12:24]][::-1]
+
+    def test_qfp_generate_twice(self):
+        params = self.create_lqfp48_params()
+        generator = QFPFootprintGenerator(params)
+        generator.generate()
+        content = generator.generate()
+
+        assert len(generator.pads) == 48
+        assert content.count("(pad ") == 48
+
+    def test_qfp_generate_reflects_pad_edits(self):
+        params = self.create_lqfp48_params()
+        generator = QFPFootprintGenerator(params)
+        generator.calculate_all()
+        generator.pads[0].shape = PadShape.RECTANGLE
+        generator.pads[1].pad_type = PadType.THRU_HOLE
+        content = generator.generate()
+
+        assert '(pad "1" smd rect\n' in content
+        assert '(pad "2" thru_hole roundrect\n' in content
+        assert content.count("(roundrect_rratio") == 47
+
     def test_qfp_generate_output_format(self):
         params = self.create_lqfp48_params()
         generator = QFPFootprintGenerator(params)
@@ -312,6 +368,219 @@ class TestLineDataclass:
         assert line.width == 0.12
 
 
+class TestPrimitiveLayout:
+    """Tests that footprint primitives stay compact slotted objects."""
+
+    @pytest.mark.parametrize(
+        "primitive",
+        [
+            Pad("1", PadType.SMD, PadShape.RECTANGLE, 0.0, 0.0, 1.0, 1.0),
+            Line(0.0, 0.0, 1.0, 1.0, "F.SilkS", 0.12),
+            Circle(0.0, 0.0, 0.5, "F.SilkS", 0.12),
+            Arc(0.0, 0.0, 0.5, 0.5, 1.0, 0.0, "F.SilkS", 0.12),
+            Text("reference", "REF**", 0.0, 0.0, "F.SilkS"),
+        ],
+    )
+    def test_no_instance_dict(self, primitive):
+        assert not hasattr(primitive, "__dict__")
+        with pytest.raises(AttributeError):
+            primitive.unexpected = 1
+
+
+class TestAddPadsVectorized:
+    """Tests for bulk pad construction from coordinate arrays."""
+
+    def test_add_pads_from_arrays(self):
+        params = TestQFPFootprintGenerator().create_lqfp48_params()
+        generator = QFPFootprintGenerator(params)
+        xs = np.full(4, -4.25)
+        ys = np.arange(4) * 0.5 - 0.75
+        generator._add_pads_vectorized(
+            ["1", "2", "3", "4"], xs, ys, 1.5, 0.28, PadShape.ROUNDRECT, PadType.SMD
+        )
+
+        assert [p.number for p in generator.pads] == ["1", "2", "3", "4"]
+        assert [p.y for p in generator.pads] == [-0.75, -0.25, 0.25, 0.75]
+        assert all(type(p.x) is float for p in generator.pads)
+        assert generator.pads[0].layers == ("F.Cu", "F.Paste", "F.Mask")
+
+    def test_add_pads_shared_fields(self):
+        params = TestQFPFootprintGenerator().create_lqfp48_params()
+        generator = QFPFootprintGenerator(params)
+        generator._add_pads_vectorized(
+            ["EP", "EP"], np.zeros(2), np.ones(2), 0.5, 0.5, PadShape.CIRCLE, PadType.THRU_HOLE,
+            layers=["*.Cu"], drill=0.3, property_heatsink=True,
+        )
+
+        assert all(p.drill == 0.3 and p.property_heatsink for p in generator.pads)
+        assert all(p.layers == ("*.Cu",) for p in generator.pads)
+
+    def test_add_pads_unknown_field(self):
+        params = TestQFPFootprintGenerator().create_lqfp48_params()
+        generator = QFPFootprintGenerator(params)
+        with pytest.raises(TypeError):
+            generator._add_pads_vectorized(
+                ["1"], np.zeros(1), np.zeros(1), 1.0, 1.0, PadShape.RECTANGLE, PadType.SMD,
+                colour="red",
+            )
+
+    def test_add_pads_length_mismatch(self):
+        params = TestQFPFootprintGenerator().create_lqfp48_params()
+        generator = QFPFootprintGenerator(params)
+        with pytest.raises(ValueError):
+            generator._add_pads_vectorized(
+                ["1"], np.zeros(2), np.zeros(2), 1.0, 1.0, PadShape.RECTANGLE, PadType.SMD
+            )
+
+
+class TestFootprintCache:
+    """Tests for memoized footprint structure."""
+
+    def test_repeated_calls_reuse_structure(self):
+        _build_qfp_structure.cache_clear()
+        params = dict(pins=64, pitch=0.5, body_width=10.0, body_length=10.0, lead_span=12.0)
+        first = create_qfp_footprint(**params)
+        second = create_qfp_footprint(**params)
+
+        assert _build_qfp_structure.cache_info().hits == 1
+        # Same geometry, fresh UUIDs
+        assert re.sub(r"\(uuid \S+\)", "", first) == re.sub(r"\(uuid \S+\)", "", second)
+        assert first != second
+
+    def test_int_and_float_dimensions_are_cached_separately(self):
+        _build_qfp_structure.cache_clear()
+        as_float = build_qfp_footprint(44, 0.8, 10.0, 10.0, 12.0)
+        as_int = build_qfp_footprint(44, 0.8, 10, 10, 12)
+
+        assert as_float.params.footprint_name == "LQFP-44_10.0x10.0mm_P0.8mm"
+        assert as_int.params.footprint_name == "LQFP-44_10x10mm_P0.8mm"
+
+    def test_keyword_and_positional_calls_share_cache(self):
+        _build_qfp_structure.cache_clear()
+        _build_qfn_structure.cache_clear()
+        create_qfp_footprint(48, 0.5, 7.0, 7.0, 9.0)
+        build_qfp_footprint(pins=48, pitch=0.5, body_width=7.0, body_length=7.0, lead_span=9.0)
+        create_qfn_footprint(32, 0.5, 5.0)
+        build_qfn_footprint(pins=32, pitch=0.5, body_width=5.0)
+
+        assert _build_qfp_structure.cache_info().currsize == 1
+        assert _build_qfp_structure.cache_info().hits == 1
+        assert _build_qfn_structure.cache_info().currsize == 1
+        assert _build_qfn_structure.cache_info().hits == 1
+
+    def test_edits_to_built_generator_do_not_reach_cache(self):
+        _build_qfp_structure.cache_clear()
+        generator = build_qfp_footprint(32, 0.8, 7.0, 7.0, 9.0, 1.4, None, "LQFP")
+        generator.pads.pop()
+        generator.pads[0].x = 100.0
+        generator.params.tags.append("edited")
+
+        fresh = build_qfp_footprint(32, 0.8, 7.0, 7.0, 9.0, 1.4, None, "LQFP")
+        assert fresh is not generator
+        assert len(fresh.pads) == 32
+        assert fresh.pads[0].x != 100.0
+        assert "edited" not in fresh.params.tags
+        assert create_qfp_footprint(32, 0.8, 7.0, 7.0, 9.0).count("(pad ") == 32
+
+    def test_qfn_edits_to_built_generator_do_not_reach_cache(self):
+        _build_qfn_structure.cache_clear()
+        build_qfn_footprint(16, 0.5, 3.0).lines.clear()
+
+        assert build_qfn_footprint(16, 0.5, 3.0).lines
+
+
+class TestWriteTo:
+    """Tests for streaming footprint output to disk."""
+
+    def test_write_to_matches_generate(self, tmp_path):
+        generator = build_qfn_footprint(pins=16, pitch=0.5, body_width=3.0)
+        path = tmp_path / "QFN-16.kicad_mod"
+        generator.write_to(path)
+
+        written = path.read_text()
+        built = generator._build_sexpr()
+        assert written.startswith('(footprint "QFN-16-1EP')
+        assert written.endswith(")")
+        assert re.sub(r"\(uuid \S+\)", "", written) == re.sub(r"\(uuid \S+\)", "", built)
+
+
+    def test_write_to_calculates_elements(self, tmp_path):
+        generator = build_qfn_footprint(pins=16, pitch=0.5, body_width=3.0)
+        fresh = QFNFootprintGenerator(generator.params)
+        path = tmp_path / "QFN-16.kicad_mod"
+        fresh.write_to(path)
+
+        assert path.read_text().count("(pad ") == len(generator.pads)
+
+
+class TestGenUuids:
+    """Tests for batched UUID generation."""
+
+    def test_uuid_count_and_uniqueness(self):
+        uuids = _gen_uuids(100)
+        assert len(uuids) == 100
+        assert len(set(uuids)) == 100
+
+    def test_uuid_format(self):
+        for value in _gen_uuids(20):
+            parsed = uuid.UUID(value)
+            assert str(parsed) == value
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
+    def test_footprint_uuids_unique(self):
+        content = create_qfn_footprint(pins=32, pitch=0.5, body_width=5.0)
+        uuids = [line.split()[1].rstrip(")") for line in content.splitlines() if "(uuid " in line]
+        assert len(uuids) == len(set(uuids))
+        assert len(uuids) > 0
+
+    def test_shared_generator_is_safe_across_threads(self):
+        generator = build_qfn_footprint(pins=32, pitch=0.5, body_width=5.0)
+        # Switch threads often so calls interleave mid-output
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                outputs = list(pool.map(lambda _: generator._build_sexpr(), range(200)))
+        finally:
+            sys.setswitchinterval(interval)
+
+        for content in outputs:
+            uuids = re.findall(r"\(uuid (\S+)\)", content)
+            assert len(uuids) == len(set(uuids))
+            assert content.endswith(")")
+
+
+class TestQuadCoords:
+    """Tests for the four-sided pad coordinate kernel."""
+
+    def test_shape_and_pin_order(self):
+        coords = _quad_coords(3, 0.5, 4.0, 3.0)
+        assert coords.shape == (12, 2)
+        # Left side going down, bottom going right
+        assert coords[:3].tolist() == [[-4.0, -0.5], [-4.0, 0.0], [-4.0, 0.5]]
+        assert coords[3:6].tolist() == [[-0.5, 3.0], [0.0, 3.0], [0.5, 3.0]]
+        # Right side going up, top going left
+        assert coords[6:9].tolist() == [[4.0, 0.5], [4.0, 0.0], [4.0, -0.5]]
+        assert coords[9:].tolist() == [[0.5, -3.0], [0.0, -3.0], [-0.5, -3.0]]
+
+
+class TestFmt:
+    """Tests for compact coordinate formatting."""
+
+    def test_trailing_zeros_stripped(self):
+        assert _fmt(-3.5) == "-3.5"
+        assert _fmt(4.25) == "4.25"
+        assert _fmt(1.0) == "1"
+
+    def test_zero(self):
+        assert _fmt(0.0) == "0"
+        assert _fmt(-0.00001) == "0"
+
+    def test_rounds_to_four_decimals(self):
+        assert _fmt(1.234567) == "1.2346"
+
+
 class TestQFNFootprintGenerator:
     """Tests for QFN footprint generator."""
 
@@ -525,6 +794,16 @@ class TestDFNFootprintGenerator:
         for pad in right_pads:
             assert pad.x > 0, f"Pad {pad.number} should be on right side"
 
+    def test_dfn_right_side_mirrors_left(self):
+        params = self.create_dfn8_params()
+        generator = QFNFootprintGenerator(params)
+        generator.calculate_pads()
+
+        # Right side runs upward through the same rows as the left side
+        left_ys = [pad.y for pad in generator.pads[:4]]
+        right_ys = [pad.y for pad in generator.pads[4:8]]
+        assert right_ys == left_ys[::-1]
+
     def test_dfn_no_top_bottom_pads(self):
         params = self.create_dfn8_params()
         generator = QFNFootprintGenerator(params)
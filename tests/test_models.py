@@ -1,5 +1,9 @@
 """Tests for data models."""
 
+import sys
+import time
+from datetime import datetime
+
 import pytest
 from pydantic import ValidationError
 
@@ -47,6 +51,12 @@ class TestPin:
         assert pin.number == "1"
         assert pin.name == "VCC"
 
+    def test_pin_number_and_name_interned(self):
+        # Build the strings at runtime so they are not compile-time constants
+        pin = Pin(number="".join(["EP", "12"]), name="".join(["PA", "12"]))
+        assert pin.number is sys.intern("EP12")
+        assert pin.name is sys.intern("PA12")
+
     def test_pin_empty_number_fails(self):
         with pytest.raises(ValidationError):
             Pin(number="", name="VCC")
@@ -82,6 +92,24 @@ class TestPin:
         gnd_pin = Pin(number="3", name="GND")
         assert gnd_pin.is_supply is False
 
+    def test_pin_ground_and_supply_in_one_name(self):
+        pin = Pin(number="1", name="VDD_GND")
+        assert pin.is_ground is True
+        assert pin.is_supply is True
+
+    def test_pin_name_class_follows_copy(self):
+        pin = Pin(number="1", name="GND")
+        assert pin.is_ground is True
+        copied = pin.model_copy(update={"name": "VCC"})
+        assert copied.is_ground is False
+        assert copied.is_supply is True
+        assert pin == Pin(number="1", name="GND")
+
+    def test_pin_upper_name_follows_copy(self):
+        pin = Pin(number="1", name="lvds_p")
+        assert pin.upper_name == "LVDS_P"
+        assert pin.model_copy(update={"name": "clk_n"}).upper_name == "CLK_N"
+
     def test_pin_is_nc(self):
         nc_pin = Pin(number="1", name="NC", electrical_type=PinElectricalType.NOT_CONNECTED)
         assert nc_pin.is_nc is True
@@ -89,6 +117,21 @@ class TestPin:
         io_pin = Pin(number="2", name="IO", electrical_type=PinElectricalType.BIDIRECTIONAL)
         assert io_pin.is_nc is False
 
+    def test_pin_create_shares_fields(self):
+        a = Pin.create(" 10 ", "VSS", electrical_type=PinElectricalType.POWER_INPUT)
+        b = Pin.create("11", "VSS", electrical_type=PinElectricalType.POWER_INPUT)
+        assert a.number == "10"
+        assert b.number == "11"
+        assert a == Pin(number="10", name="VSS", electrical_type=PinElectricalType.POWER_INPUT)
+        assert a.alternate_names is b.alternate_names
+
+        c = Pin.create("12", "PA0", alternate_names=["TX"])
+        assert c.alternate_names == ["TX"]
+        assert c.is_ground is False
+
+        with pytest.raises(ValueError):
+            Pin.create("  ", "VSS")
+
     def test_pin_is_immutable(self):
         pin = Pin(number="1", name="VCC")
         with pytest.raises(ValidationError):
@@ -120,6 +163,23 @@ class TestPinGroup:
         assert len(power_pins) == 2
         assert all(p.electrical_type == PinElectricalType.POWER_INPUT for p in power_pins)
 
+    def test_pin_group_filtered(self):
+        pins = [
+            Pin(number="1", name="VCC", electrical_type=PinElectricalType.POWER_INPUT),
+            Pin(number="2", name="IO", electrical_type=PinElectricalType.BIDIRECTIONAL),
+            Pin(number="3", name="VDD", electrical_type=PinElectricalType.POWER_INPUT, unit=2),
+        ]
+        group = PinGroup(name="Mixed", category=PinGroupCategory.POWER, pins=pins, unit=2)
+
+        power = group.filtered(electrical_type=PinElectricalType.POWER_INPUT)
+        assert power.get_pin_numbers() == ["1", "3"]
+        assert power.name == "Mixed"
+        assert power.category == PinGroupCategory.POWER
+        assert power.unit == 2
+        unit2 = group.filtered(electrical_type=PinElectricalType.POWER_INPUT, unit=2)
+        assert unit2.get_pin_numbers() == ["3"]
+        assert group.pin_count == 3
+
     def test_pin_group_get_pin_numbers(self):
         pins = [
             Pin(number="1", name="A"),
@@ -226,6 +286,43 @@ class TestPackageInfo:
         assert "10.0x10.0" in ipc_name
         assert "P0.5" in ipc_name
 
+    def test_every_package_type_has_family_flags(self):
+        for package_type in PackageType:
+            pkg = PackageInfo(
+                package_type=package_type,
+                package_name="X",
+                pin_count=8,
+                pitch=0.5,
+                body_width=3.0,
+                body_length=3.0,
+                body_height=1.0,
+            )
+            assert not (pkg.is_quad and pkg.is_dual)
+            assert not (pkg.is_bga and (pkg.is_leaded or pkg.is_leadless))
+
+    def test_package_cache_key(self):
+        def make(**overrides):
+            fields = dict(
+                package_type=PackageType.BGA,
+                package_name="BGA-16",
+                pin_count=16,
+                pitch=0.8,
+                body_width=4.0,
+                body_length=4.0,
+                body_height=1.0,
+                thermal_pad=ThermalPad(width=2.0, height=2.0),
+                depopulated_positions=["A1"],
+            )
+            fields.update(overrides)
+            return PackageInfo(**fields)
+
+        key = make().cache_key()
+        assert hash(key) == hash(make().cache_key())
+        assert key == make().cache_key()
+        assert key != make(depopulated_positions=["A2"]).cache_key()
+        assert key != make(thermal_pad=ThermalPad(width=2.0, height=2.0, via_count_x=4)).cache_key()
+        assert key != make(thermal_pad=None).cache_key()
+
     def test_dual_package_pins_per_row(self):
         pkg = PackageInfo(
             package_type=PackageType.SOIC,
@@ -344,6 +441,10 @@ class TestBGAParams:
         assert params.get_row_letter(1) == "B"
         assert params.get_row_letter(7) == "H"
         assert params.get_row_letter(8) == "J"  # Skips I
+        assert params.get_row_letter(19) == "Y"
+        assert params.get_row_letter(20) == "AA"  # 20 letters after skips
+        assert params.get_row_letter(21) == "AB"
+        assert params.get_row_letter(40) == "BA"
 
     def test_bga_is_ball_populated(self):
         params = BGAParams(
@@ -360,6 +461,30 @@ class TestBGAParams:
         assert params.is_ball_populated("A", 2) is True
         assert params.is_ball_populated("B", 2) is False
 
+    def test_bga_lookups_follow_reassignment(self):
+        params = BGAParams(
+            ball_pitch=0.8,
+            ball_diameter=0.45,
+            rows=4,
+            columns=4,
+            body_width=5.0,
+            body_length=5.0,
+            body_height=1.0,
+            depopulated_balls=["A1"],
+        )
+        assert params.get_row_letter(8) == "J"
+        assert params.is_ball_populated("A", 1) is False
+
+        params.skip_letters = []
+        params.depopulated_balls = ["B2"]
+        assert params.get_row_letter(8) == "I"
+        assert params.is_ball_populated("A", 1) is True
+        assert params.is_ball_populated("B", 2) is False
+
+        copied = params.model_copy(update={"depopulated_balls": ["C3"]})
+        assert copied.is_ball_populated("B", 2) is True
+        assert copied.is_ball_populated("C", 3) is False
+
 
 class TestComponentInfo:
     """Tests for ComponentInfo model."""
@@ -435,6 +560,73 @@ class TestComponentInfo:
         assert pin is not None
         assert pin.number == "1"
 
+    def test_component_created_at_stamped_once_on_serialization(self):
+        comp = ComponentInfo(name="TEST")
+        first = comp.model_dump()["created_at"]
+        time.sleep(0.01)
+        second = comp.model_dump()["created_at"]
+
+        assert isinstance(first, datetime)
+        assert second == first
+        assert comp.created_at == first
+        assert comp.model_dump(exclude_none=True)["created_at"] == first
+        assert f'"created_at":"{first.isoformat()}"' in comp.model_dump_json()
+        assert "created_at" not in comp.model_dump(exclude={"created_at"})
+
+    def test_component_created_at_stamped_once_on_read(self):
+        comp = ComponentInfo(name="TEST")
+        stamp = comp.created_at
+        time.sleep(0.01)
+
+        assert isinstance(stamp, datetime)
+        assert comp.created_at == stamp
+        assert comp.model_dump()["created_at"] == stamp
+        # Field order is unchanged by the lazy stamp
+        assert list(comp.model_dump()) == list(ComponentInfo.model_fields)
+
+    def test_component_created_at_kept_when_set(self):
+        stamp = datetime(2024, 1, 2, 3, 4, 5)
+        comp = ComponentInfo(name="TEST", created_at=stamp)
+        assert comp.model_dump()["created_at"] == stamp
+        assert ComponentInfo.model_validate_json(comp.model_dump_json()).created_at == stamp
+
+    def test_component_pin_categories_are_copies(self):
+        pins = [
+            Pin(number="1", name="GND", electrical_type=PinElectricalType.POWER_INPUT),
+            Pin(number="2", name="NC", electrical_type=PinElectricalType.NOT_CONNECTED),
+        ]
+        comp = ComponentInfo(name="TEST", pins=pins)
+
+        comp.get_ground_pins().clear()
+        assert len(comp.get_ground_pins()) == 1
+        assert len(comp.get_nc_pins()) == 1
+        assert comp.get_pins_by_electrical_type(PinElectricalType.OUTPUT) == []
+
+    def test_component_pin_index_follows_reassignment(self):
+        comp = ComponentInfo(name="TEST", pins=[Pin(number="1", name="VCC")])
+        assert comp.get_pin_by_number("1") is not None
+
+        comp.pins = [Pin(number="2", name="GND")]
+        assert comp.get_pin_by_number("1") is None
+        assert comp.get_pin_by_name("gnd").number == "2"
+
+        copied = comp.model_copy(update={"pins": [Pin(number="3", name="IO")]})
+        assert copied.get_pin_by_number("3") is not None
+        assert copied.get_pin_by_number("2") is None
+
+    def test_component_pin_tables_follow_in_place_edits(self):
+        comp = ComponentInfo(name="TEST", pins=[Pin(number="1", name="A")])
+        assert comp.get_pin_by_name("a") is not None
+
+        comp.pins.append(Pin(number="2", name="B", electrical_type=PinElectricalType.NOT_CONNECTED))
+        assert comp.get_pin_by_number("2").name == "B"
+        assert comp.get_pin_by_name("B").number == "2"
+        assert [p.number for p in comp.get_nc_pins()] == ["2"]
+
+        comp.pins.pop(0)
+        assert comp.get_pin_by_number("1") is None
+        assert comp.get_pin_by_name("a") is None
+
     def test_component_with_package(self):
         pkg = PackageInfo(
             package_type=PackageType.LQFP,
@@ -447,3 +639,25 @@ class TestComponentInfo:
         )
         comp = ComponentInfo(name="TEST", packages=[pkg])
         assert comp.primary_package == pkg
+
+
+class TestSchemaBuild:
+    """Tests that model validators are built once, at import time."""
+
+    def test_models_are_complete_at_import(self):
+        from kiforge.core.models.footprint import FootprintParams, PadDimensions
+
+        models = (
+            Pin,
+            PinGroup,
+            ThermalPad,
+            PackageInfo,
+            QFPParams,
+            QFNParams,
+            BGAParams,
+            PadDimensions,
+            FootprintParams,
+            ComponentInfo,
+        )
+        for model in models:
+            assert model.__pydantic_complete__, model.__name__
@@ -1,17 +1,34 @@
 """Tests for CSV parser and pin inference."""
 
+import gc
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from kiforge.core.models.enums import PinElectricalType, PinGraphicStyle, PinGroupCategory
+from kiforge.core.models.pin import Pin
 from kiforge.core.parser.inference import (
+    infer_many,
     infer_pin_electrical_type,
     infer_pin_graphic_style,
     infer_pin_group_category,
 )
-from kiforge.core.parser.csv_parser import parse_pinout_csv, create_component_from_csv
+from kiforge.core.parser.csv_parser import (
+    ETYPE_CODES,
+    ETYPES,
+    GRAPHIC_STYLES,
+    create_component_from_csv,
+    parse_pinout_csv,
+    parse_pinout_csv_soa,
+)
+from kiforge.core.parser.fpga_csv_parser import (
+    FPGA_UNIT_BANK_START,
+    FPGA_UNIT_CONFIG,
+    FPGA_UNIT_JTAG,
+    FPGA_UNIT_POWER,
+    parse_lattice_fpga_csv,
+)
 
 
 class TestPinTypeInference:
@@ -94,6 +111,13 @@ class TestPinTypeInference:
         assert infer_pin_electrical_type("ADC1") == PinElectricalType.PASSIVE
         assert infer_pin_electrical_type("VREF") == PinElectricalType.PASSIVE
 
+    def test_suffix_rules_follow_rule_order(self):
+        # "_IN"/"_TX" suffixes outrank the later GPIO and communication prefixes
+        assert infer_pin_electrical_type("GPIO_IN") == PinElectricalType.INPUT
+        assert infer_pin_electrical_type("UART_TX") == PinElectricalType.OUTPUT
+        # ...but not the earlier power prefixes
+        assert infer_pin_electrical_type("VCC_IN") == PinElectricalType.POWER_INPUT
+
     def test_unknown_pins(self):
         assert infer_pin_electrical_type("FOOBAR") == PinElectricalType.UNSPECIFIED
         assert infer_pin_electrical_type("X123") == PinElectricalType.UNSPECIFIED
@@ -114,6 +138,8 @@ class TestPinGraphicStyleInference:
         assert infer_pin_graphic_style("CS_N") == PinGraphicStyle.INVERTED
         assert infer_pin_graphic_style("OE_B") == PinGraphicStyle.INVERTED
         assert infer_pin_graphic_style("WR#") == PinGraphicStyle.INVERTED
+        assert infer_pin_graphic_style("NÉN") == PinGraphicStyle.INVERTED
+        assert infer_pin_graphic_style("N1") == PinGraphicStyle.LINE
 
     def test_clock_pins(self):
         assert infer_pin_graphic_style("CLK") == PinGraphicStyle.CLOCK
@@ -165,6 +191,23 @@ class TestPinGroupCategoryInference:
         assert infer_pin_group_category("NC", PinElectricalType.NOT_CONNECTED) == PinGroupCategory.NC
 
 
+class TestInferMany:
+    """Tests for batch pin inference."""
+
+    def test_matches_single_pin_inference(self):
+        names = ["VCC", "gnd", "NC", "~RST", "SPI_SCK", "GPIO3", "CS_N", "FOOBAR"]
+        etypes, styles, categories = infer_many(names)
+
+        assert etypes == [infer_pin_electrical_type(n) for n in names]
+        assert styles == [infer_pin_graphic_style(n) for n in names]
+        assert categories == [
+            infer_pin_group_category(n, etype) for n, etype in zip(names, etypes)
+        ]
+
+    def test_empty(self):
+        assert infer_many([]) == ([], [], [])
+
+
 class TestCSVParser:
     """Tests for CSV pinout parser."""
 
@@ -221,6 +264,32 @@ class TestCSVParser:
         assert pins[3].electrical_type == PinElectricalType.OUTPUT  # TX
         assert pins[4].electrical_type == PinElectricalType.INPUT  # RX
 
+    def test_parse_csv_infers_in_one_batch(self, monkeypatch):
+        import kiforge.core.parser.csv_parser as csv_parser
+
+        calls = []
+
+        def counting_infer_many(names):
+            calls.append(list(names))
+            return infer_many(names)
+
+        monkeypatch.setattr(csv_parser, "infer_many", counting_infer_many)
+        csv_content = """pin,name,type
+1,VCC,
+2,~RESET,i
+3,TX,weird
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            f.flush()
+            pins = parse_pinout_csv(f.name)
+
+        assert calls == [["VCC", "~RESET", "TX"]]
+        assert pins[0].electrical_type == PinElectricalType.POWER_INPUT  # inferred
+        assert pins[1].electrical_type == PinElectricalType.INPUT  # from the file
+        assert pins[1].graphic_style == PinGraphicStyle.INVERTED
+        assert pins[2].electrical_type == PinElectricalType.OUTPUT  # unknown type, inferred
+
     def test_parse_csv_with_description(self):
         csv_content = """pin,name,type,description
 1,VCC,power,Main power supply
@@ -247,6 +316,44 @@ class TestCSVParser:
         assert pins[0].alternate_names == ["SPI_MOSI", "TIM1_CH1"]
         assert pins[1].alternate_names == ["SPI_MISO"]
 
+    def test_parsed_pins_match_validated_pins(self):
+        csv_content = """pin,name,type,description,alternate
+1, VCC ,power,Main supply,
+2,PA0,io,,"SPI_MOSI, TIM1_CH1"
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            f.flush()
+            pins = parse_pinout_csv(f.name)
+
+        for pin in pins:
+            assert Pin.model_validate(pin.model_dump()) == pin
+        assert pins[0].name == "VCC"
+        assert pins[0].unit == 1
+        assert pins[1].row is None
+
+    def test_parse_csv_soa_matches_pins(self):
+        csv_content = """pin,name,type
+1,VCC,power
+2,GND,gnd
+3,IO1,io
+A12,~RESET,i
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            f.flush()
+            pins = parse_pinout_csv(f.name)
+            arr = parse_pinout_csv_soa(f.name)
+
+        assert arr.shape == (4,)
+        assert list(arr["number"]) == [p.number for p in pins]
+        assert list(arr["name"]) == [p.name for p in pins]
+        assert [ETYPES[c] for c in arr["etype"]] == [p.electrical_type for p in pins]
+        assert [GRAPHIC_STYLES[c] for c in arr["style"]] == [p.graphic_style for p in pins]
+
+        power = arr[arr["etype"] == ETYPE_CODES[PinElectricalType.POWER_INPUT]]
+        assert list(power["name"]) == ["VCC", "GND"]
+
     def test_parse_csv_skips_empty_rows(self):
         csv_content = """pin,name
 1,VCC
@@ -275,6 +382,28 @@ class TestCSVParser:
         assert len(pins) == 2
         assert pins[0].name == "VCC"
 
+    def test_parse_csv_handles_tab_delimiter(self):
+        csv_content = "pin\tname\tdescription\n1\tVCC\tSupply, 3.3V\n2\tGND\tGround\n"
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            f.flush()
+            pins = parse_pinout_csv(f.name)
+
+        assert [p.name for p in pins] == ["VCC", "GND"]
+        assert pins[0].description == "Supply, 3.3V"
+
+    def test_parse_csv_semicolon_header_with_commas(self):
+        csv_content = "Pin;Name;Desc (a, b, c)\n1;VCC;x\n2;GND;y\n"
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            f.flush()
+            pins = parse_pinout_csv(f.name)
+
+        assert [(p.number, p.name, p.description) for p in pins] == [
+            ("1", "VCC", "x"),
+            ("2", "GND", "y"),
+        ]
+
     def test_parse_csv_missing_required_column_fails(self):
         csv_content = """name,type
 VCC,power
@@ -289,6 +418,16 @@ VCC,power
         with pytest.raises(FileNotFoundError):
             parse_pinout_csv("/nonexistent/path/file.csv")
 
+    def test_parse_csv_restores_gc_state(self):
+        csv_content = "name,type\nVCC,power\n"
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(csv_content)
+            f.flush()
+            with pytest.raises(ValueError):
+                parse_pinout_csv(f.name)
+
+        assert gc.isenabled()
+
     def test_create_component_from_csv(self):
         csv_content = """pin,name,type
 1,VCC,power
@@ -333,3 +472,48 @@ VCC,power
         assert pins[4].electrical_type == PinElectricalType.NOT_CONNECTED
         assert pins[5].electrical_type == PinElectricalType.TRISTATE
         assert pins[6].electrical_type == PinElectricalType.OPEN_COLLECTOR
+
+
+class TestFPGACSVParser:
+    """Tests for the Lattice FPGA pinout parser."""
+
+    CSV_CONTENT = """# Pin Out For TEST,,,,,,,,,
+"# Revised Sept, 24, 2019",,,,,,,,,
+,,,,,,,,,
+PADN,Pin/Ball Funcion,CUST_NAME,BANK,Dual Function,LVDS,HIGHSPEED,DQS,CABGA64,QFN32
+,,,,,,,,,
+1,PL1A,,0,"MCLK, CSSPIN",True_OF_PL1B,TRUE,-,A1,1
+2,PL1B,,0,-,Comp_OF_PL1A,TRUE,-,A2,-
+3,VCC,,-,-,-,-,-,B1,2
+4,GND,,-,-,-,-,-,B2,3
+5,TCK,,-,-,-,-,-,C1,4
+6,DONE,,1,-,-,-,-,C2,5
+"""
+
+    def _parse(self, package_column=None):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(self.CSV_CONTENT)
+            f.flush()
+            return parse_lattice_fpga_csv(f.name, package_column)
+
+    def test_parse_lattice_csv(self):
+        pins, pins_by_unit = self._parse()
+        assert [p.number for p in pins] == ["A1", "A2", "B1", "B2", "C1", "C2"]
+
+        by_name = {p.name: p for p in pins}
+        assert by_name["PL1A"].alternate_names == ["MCLK, CSSPIN"]
+        assert by_name["PL1A"].unit == FPGA_UNIT_CONFIG
+        assert by_name["PL1B"].unit == FPGA_UNIT_BANK_START
+        assert by_name["VCC"].electrical_type == PinElectricalType.POWER_INPUT
+        assert by_name["TCK"].unit == FPGA_UNIT_JTAG
+        assert by_name["TCK"].graphic_style == PinGraphicStyle.CLOCK
+        assert by_name["DONE"].electrical_type == PinElectricalType.OUTPUT
+
+        assert [p.name for p in pins_by_unit[FPGA_UNIT_POWER]] == ["VCC", "GND"]
+
+    def test_parse_lattice_csv_package_column(self):
+        pins, _ = self._parse("QFN32")
+        assert [p.number for p in pins] == ["1", "2", "3", "4", "5"]
+
+        with pytest.raises(ValueError, match="not found"):
+            self._parse("TQFP144")
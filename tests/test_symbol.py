@@ -5,7 +5,7 @@ import pytest
 from kiforge.core.symbol.generator import SymbolGenerator, create_symbol
 from kiforge.core.models.component import ComponentInfo
 from kiforge.core.models.pin import Pin
-from kiforge.core.models.enums import PinElectricalType, PinGraphicStyle
+from kiforge.core.models.enums import PinElectricalType, PinGraphicStyle, PinOrientation
 
 
 class TestSymbolGenerator:
@@ -59,6 +59,20 @@ class TestSymbolGenerator:
         right_names = [sp.pin.name for sp in layout.right_pins]
         assert any("OUT" in name for name in right_names)
 
+    def test_side_pins_are_centered_on_the_grid(self):
+        component = self.create_test_component()
+        generator = SymbolGenerator(component)
+        generator.layout_pins()
+        layout = generator.layouts[0]
+
+        left = layout.left_pins
+        assert len(left) == 3
+        assert [sp.y for sp in left] == pytest.approx([2.54, 0.0, -2.54])
+        assert {sp.x for sp in left} == {-layout.width / 2 - 2.54}
+        assert {sp.orientation for sp in left} == {PinOrientation.RIGHT}
+
+        assert [sp.x for sp in layout.top_pins] == [0.0]
+
     def test_symbol_generate_output_format(self):
         component = self.create_test_component()
         generator = SymbolGenerator(component)